@@ -1,8 +1,33 @@
-from flask import Flask, request, jsonify,send_file
+from flask import Flask, Response, g, request, jsonify,send_file
 import os
+import json
+import queue
+import threading
+from collections import Counter
 from flask_cors import CORS
-from scraper import LinkedInJobScraper
-from multi_platform import JobScraper
+from multi_platform import launch_driver, launch_mode_for, LAUNCH_PROFILE, PLATFORM_ORIGINS
+from driver_pool import DriverPoolGroup
+from launch_modes import launch_stats
+from profile_manager import profiles
+from driver_lifecycle import lifecycle
+from seen_jobs import seen_jobs
+from job_store import SORTS, job_store
+from waits import wait_stats
+from net_block import block_stats
+from http_fast import fast_path_stats
+from platforms import PLATFORMS, SEARCH_PLATFORMS, run_scrape, scrapes_in_flight, validate_params, resolve_params
+from fanout import fan_out
+from dedup import dedup_stats, dedupe
+from recency import recency_stats
+import metrics
+from metrics import REQUEST_SECONDS, stage
+import tracing
+import time
+from result_cache import ResultCache, cache_key
+from task_queue import ScrapeTaskQueue
+from prewarm import PREWARM_ENABLED, PrewarmScheduler, QueryTracker
+from single_flight import ScrapeCoalescer
+from scraper import DEFAULT_RESPONSE_CACHE
 import logging
 
 app = Flask(__name__)
@@ -14,6 +39,255 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# --- REQUEST LATENCY (/metrics par endpoint, method, status ke hisaab se) ---
+@app.before_request
+def start_request_timer():
+    g.request_start = time.perf_counter()
+
+@app.after_request
+def record_request_time(response):
+    # Stream responses ka yahan sirf pehla byte tak ka time aata hai
+    start = g.get('request_start')
+    if start is not None:
+        REQUEST_SECONDS.observe(time.perf_counter() - start, endpoint=request.endpoint or 'unmatched',
+                                method=request.method, status=response.status_code)
+    return response
+
+# --- WARM DRIVER POOLS (har request par naya Chrome launch nahi hoga; har launch mode ka alag pool,
+# lekin DRIVER_POOL_MAX_SIZE saare modes ka milake ek hi browser budget) ---
+driver_pool = DriverPoolGroup(
+    factory=lambda mode: launch_driver(user_profile=False, mode=mode),
+    size=int(os.environ.get('DRIVER_POOL_SIZE', 2)),
+    max_size=int(os.environ.get('DRIVER_POOL_MAX_SIZE', 4)),
+    max_uses=int(os.environ.get('DRIVER_POOL_MAX_USES', 20)),
+    acquire_timeout=float(os.environ.get('DRIVER_POOL_ACQUIRE_TIMEOUT', 120)),
+    reset_origins=PLATFORM_ORIGINS,
+    closer=lifecycle.quit,
+)
+def most_used_launch_mode():
+    # Sabse zyada Selenium platforms jis mode par hain; baaki modes pehli lease par launch hote hain
+    return Counter(launch_mode_for(name) for name in LAUNCH_PROFILE).most_common(1)[0][0]
+
+_background_started = False
+
+def start_background():
+    """
+    Starts per-process background work (driver pool warm-up, query
+    pre-warm scheduler). Not run on
+    import: `python app.py` calls it, WSGI servers call it once per worker
+    (e.g. gunicorn post_worker_init).
+    """
+    global _background_started
+    if _background_started:
+        return
+    _background_started = True
+    if os.environ.get('DRIVER_POOL_WARM', '1') == '1':
+        driver_pool.warm_async([most_used_launch_mode()])
+    if PREWARM_ENABLED:
+        prewarm.start()
+
+# --- RESULT CACHE (stale-while-revalidate, har route ke aage) ---
+result_cache = ResultCache(
+    default_ttl=float(os.environ.get('RESULT_CACHE_TTL', 1800)),
+    max_stale=float(os.environ.get('RESULT_CACHE_MAX_STALE', 86400)),
+)
+
+def cache_bypass_requested():
+    # ?refresh=1 ya 'Cache-Control: no-cache' se live scrape force karo
+    if request.args.get('refresh', '').lower() in ('1', 'true', 'yes'):
+        return True
+    return 'no-cache' in request.headers.get('Cache-Control', '').lower()
+
+# --- SINGLE-FLIGHT (ek jaisi in-flight scrapes ek hi Chrome run share karti hain) ---
+coalescer = ScrapeCoalescer()
+
+def live_scrape(platform, keyword, location, pages=3, days=7, on_progress=None, on_job=None):
+    # n8n ke kai workflows same query ek saath bhejein to ek scrape, sabko wahi result
+    # Followers ke on_progress/on_job bhi flight par register hote hain; leader ka scrape sabko bhejta hai
+    return coalescer.run(
+        cache_key(platform, keyword, location, pages, days),
+        lambda progress_fan_out, job_fan_out: run_scrape(platform, keyword, location, pages=pages, days=days,
+                                                         pool=driver_pool, on_progress=progress_fan_out,
+                                                         on_job=job_fan_out),
+        on_progress=on_progress,
+        on_job=on_job,
+    )
+
+# --- PRE-WARM (hot queries off-peak mein dobara scrape, taaki users ko warm cache mile) ---
+query_tracker = QueryTracker()
+
+def scrapes_busy():
+    # Prewarm ke apne refreshes ke alawa koi bhi scrape (pooled, non-pooled, HTTP) = user traffic
+    return scrapes_in_flight() > prewarm.active
+
+prewarm = PrewarmScheduler(
+    tracker=query_tracker,
+    cache=result_cache,
+    runner=live_scrape,
+    is_busy=scrapes_busy,
+)
+
+def cached_scrape(platform, keyword, location, pages=3, days=7, bypass=False):
+    keyword, location = resolve_params(platform, keyword, location)
+    query_tracker.record(platform, keyword, location, pages, days)
+    return result_cache.get_or_load(
+        cache_key(platform, keyword, location, pages, days),
+        lambda: live_scrape(platform, keyword, location, pages, days),
+        bypass=bypass
+    )
+
+# --- STREAMING MODE (?stream=ndjson|sse): har job extract hote hi client ko ---
+STREAM_MIMETYPES = {'ndjson': 'application/x-ndjson', 'sse': 'text/event-stream'}
+
+def stream_format(record, mode):
+    data = json.dumps(record, default=str)
+    if mode == 'sse':
+        return f"event: {record['type']}\ndata: {data}\n\n"
+    return data + '\n'
+
+def stream_scrape(platform, keyword, location, pages=3, days=7, bypass=False):
+    """
+    Yields one {'type': 'job'} record per job as the scraper extracts it,
+    then a single {'type': 'summary'} record. A fresh cached result is
+    replayed instead of scraping; a live result is stored in the cache.
+    """
+    keyword, location = resolve_params(platform, keyword, location)
+    query_tracker.record(platform, keyword, location, pages, days)
+    key = cache_key(platform, keyword, location, pages, days)
+    start = time.monotonic()
+
+    cached = None if bypass else result_cache.get_fresh(key)
+    if cached is not None:
+        payload, age = cached
+        for job in payload.get('jobs', []):
+            yield {'type': 'job', 'platform': platform, 'job': job}
+        yield {
+            'type': 'summary',
+            'success': payload.get('success', True),
+            'platform': platform,
+            'total_jobs': payload.get('total_jobs', len(payload.get('jobs', []))),
+            'streamed_jobs': len(payload.get('jobs', [])),
+            'cache': 'HIT',
+            'cache_age_seconds': int(age),
+            'duration_seconds': round(time.monotonic() - start, 2)
+        }
+        return
+
+    events = queue.Queue()
+    progress = {}
+    done = object()
+
+    def worker():
+        try:
+            # Same query ka stream/request pehle se chal raha ho to usi scrape ki jobs yahan bhi aayengi
+            payload = live_scrape(platform, keyword, location, pages, days,
+                                  on_progress=progress.update, on_job=events.put)
+            result_cache.put(key, payload)
+            events.put((done, payload, None))
+        except Exception as e:
+            logger.error(f"Stream scrape failed ({platform}): {e}")
+            events.put((done, None, str(e)))
+
+    # Client disconnect ho jaye to bhi scrape poora hoke cache mein jayega
+    threading.Thread(target=worker, name=f'stream-{platform}', daemon=True).start()
+
+    streamed = 0
+    first_job_seconds = None
+    while True:
+        event = events.get()
+        if isinstance(event, tuple) and event and event[0] is done:
+            _, payload, error = event
+            break
+        streamed += 1
+        if first_job_seconds is None:
+            first_job_seconds = round(time.monotonic() - start, 2)
+        yield {'type': 'job', 'platform': platform, 'job': event}
+
+    summary = {
+        'type': 'summary',
+        'success': bool(payload and payload.get('success')),
+        'platform': platform,
+        'total_jobs': payload.get('total_jobs', streamed) if payload else 0,
+        'streamed_jobs': streamed,
+        'cache': 'BYPASS' if bypass else 'MISS',
+        'duration_seconds': round(time.monotonic() - start, 2),
+        'first_job_seconds': first_job_seconds,
+        'progress': progress
+    }
+    if payload and 'served_by' in payload:
+        summary['served_by'] = payload['served_by']
+    if payload and 'failed_pages' in payload:
+        summary['successful_pages'] = payload['successful_pages']
+        summary['failed_pages'] = payload['failed_pages']
+    if error:
+        summary['error'] = error
+    yield summary
+
+def trace_requested():
+    return request.args.get('trace', '').lower() in ('1', 'true', 'yes')
+
+def traced_scrape_response(platform, keyword, location, pages=3, days=7):
+    # Cache hit ya kisi aur ki in-flight scrape ka trace bekaar hai: hamesha apna live scrape
+    keyword, location = resolve_params(platform, keyword, location)
+    query_tracker.record(platform, keyword, location, pages, days)
+    with tracing.capture(f"{platform}: {keyword or '-'} @ {location or '-'}") as trace:
+        payload, status, age = result_cache.get_or_load(
+            cache_key(platform, keyword, location, pages, days),
+            lambda: run_scrape(platform, keyword, location, pages=pages, days=days, pool=driver_pool),
+            bypass=True
+        )
+        with stage('serialization', platform):
+            response = jsonify({**payload, 'trace_id': trace.trace_id, 'trace_url': f"/traces/{trace.trace_id}"})
+    trace.save()
+    response.headers['X-Cache'] = status
+    response.headers['Age'] = str(int(age))
+    response.headers['X-Trace-Id'] = trace.trace_id
+    return response, 200
+
+def scrape_response(platform, keyword, location, pages=3, days=7):
+    mode = request.args.get('stream', '').strip().lower()
+    if trace_requested():
+        if mode:
+            return jsonify({'success': False, 'error': 'trace=1 cannot be combined with stream'}), 400
+        return traced_scrape_response(platform, keyword, location, pages, days)
+    if mode:
+        if mode not in STREAM_MIMETYPES:
+            return jsonify({
+                'success': False,
+                'error': f"Unsupported stream mode '{mode}'",
+                'available': list(STREAM_MIMETYPES)
+            }), 400
+        records = stream_scrape(platform, keyword, location, pages, days, bypass=cache_bypass_requested())
+        response = Response((stream_format(record, mode) for record in records),
+                            mimetype=STREAM_MIMETYPES[mode])
+        response.headers['Cache-Control'] = 'no-cache'
+        response.headers['X-Accel-Buffering'] = 'no'
+        return response, 200
+
+    payload, status, age = cached_scrape(platform, keyword, location, pages, days,
+                                         bypass=cache_bypass_requested())
+    with stage('serialization', platform):
+        response = jsonify(payload)
+    response.headers['X-Cache'] = status
+    response.headers['Age'] = str(int(age))
+    return response, 200
+
+# --- ASYNC SCRAPE TASKS (POST -> task id, GET -> status/result) ---
+def run_task(platform, keyword='', location='', pages=3, days=7, on_progress=None):
+    keyword, location = resolve_params(platform, keyword, location)
+    query_tracker.record(platform, keyword, location, pages, days)
+    payload = live_scrape(platform, keyword, location, pages, days, on_progress=on_progress)
+    # Async result bhi cache mein, taaki agla sync request warm mile
+    result_cache.put(cache_key(platform, keyword, location, pages, days), payload)
+    return payload
+
+task_queue = ScrapeTaskQueue(
+    runner=run_task,
+    # driver_pool.max_size poore group ka browser cap hai (mode-wise nahi)
+    workers=int(os.environ.get('TASK_WORKERS', driver_pool.max_size)),
+    retention_seconds=float(os.environ.get('TASK_RETENTION_SECONDS', 3600)),
+)
+
 @app.route('/')
 def home():
    return jsonify({
@@ -23,11 +297,21 @@ def home():
             '/api/jobs': 'GET - Scrape jobs from LinkedIn',
             '/dice': 'GET - Scrape jobs from Dice.com',
             '/indeed': 'GET - Scrape jobs from Indeed.com', # <-- New Added
+            '/search': 'GET - Query all platforms in parallel (keyword, location, platforms, timeout)',
+            '/jobs': 'GET - Query stored jobs, no live scrape (keyword, location, platforms, days, page, per_page, sort)',
+            '/tasks': 'POST - Submit an async scrape (platform, keyword, location, pages, days), returns task_id',
+            '/tasks/<task_id>': 'GET - Task status and progress',
+            '/tasks/<task_id>/result': 'GET - Task result (202 while running)',
+            '/traces/<trace_id>': 'GET - Chrome trace-event JSON of a trace=1 request (open in Perfetto / chrome://tracing)',
+            '/metrics': 'GET - Prometheus metrics (per-stage timings by platform, scrape and request latency)',
             'parameters': {
                 'location': 'Required - Job location (e.g., Mumbai, Remote, TX, USA)',
                 'keyword': 'Optional - Job keyword/title (e.g., Python Developer, Data Analyst)',
                 'pages': 'Optional (LinkedIn only) - Number of pages to scrape',
-                'days': 'Optional (LinkedIn only) - Filter jobs from last N days'
+                'days': 'Optional (LinkedIn only) - Filter jobs from last N days',
+                'refresh': 'Optional - 1 to bypass the result cache (or send Cache-Control: no-cache)',
+                'stream': 'Optional - ndjson or sse to receive each job as soon as it is scraped',
+                'trace': 'Optional - 1 to record a per-stage / per-WebDriver-command trace (live scrape, returns trace_id)'
             }
         },
         'examples': {
@@ -66,10 +350,7 @@ def get_jobs():
         
         logger.info(f"API Request: location={location}, keyword={keyword or 'Any'}, pages={pages}, days={days}")
         
-        scraper = LinkedInJobScraper(max_pages=pages, days_filter=days)
-        result = scraper.scrape_jobs(location=location, keyword=keyword)
-        
-        return jsonify(result), 200
+        return scrape_response('linkedin', keyword, location, pages=pages, days=days)
         
     except Exception as e:
         logger.error(f"API Error: {str(e)}")
@@ -86,15 +367,7 @@ def get_linkedin_jobs():
         location = request.args.get('location', 'USA').strip()
         
         logger.info(f"LinkedIn Selenium Search: {keyword} in {location}")
-        scraper = JobScraper()
-        jobs = scraper.linkedin_scrape(keyword, location)
-        
-        return jsonify({
-            'success': True,
-            'platform': 'LinkedIn',
-            'total_jobs': len(jobs),
-            'jobs': jobs
-        }), 200
+        return scrape_response('linkedin_browser', keyword, location)
     except Exception as e:
         return jsonify({'error': str(e)}), 500
     
@@ -102,9 +375,37 @@ def get_linkedin_jobs():
 def health_check():
     return jsonify({
         'status': 'healthy',
-        'service': 'LinkedIn Job Scraper API'
+        'service': 'LinkedIn Job Scraper API',
+        'driver_pool': driver_pool.stats(),
+        'browser_budget': driver_pool.budget_stats(),
+        'launch_modes': launch_stats.snapshot(),
+        'profiles': profiles.stats(),
+        'driver_lifecycle': lifecycle.stats(),
+        'seen_jobs': seen_jobs.stats(),
+        'job_store': job_store.stats(),
+        'readiness_waits': wait_stats.snapshot(),
+        'http_cache': DEFAULT_RESPONSE_CACHE.stats(),
+        'result_cache': result_cache.stats(),
+        'network_blocking': block_stats.snapshot(),
+        'fast_path': fast_path_stats.snapshot(),
+        'dedup': dedup_stats.snapshot(),
+        'recency': recency_stats.snapshot(),
+        'prewarm': prewarm.stats(),
+        'single_flight': coalescer.stats()
     }), 200
 
+@app.route('/metrics', methods=['GET'])
+def metrics_endpoint():
+    # Prometheus text format (scrape_config mein bas is path ko point karo)
+    return Response(metrics.render(), content_type='text/plain; version=0.0.4; charset=utf-8')
+
+@app.route('/traces/<trace_id>', methods=['GET'])
+def get_trace(trace_id):
+    path = tracing.trace_path(trace_id)
+    if path is None:
+        return jsonify({'success': False, 'error': 'Trace not found or expired'}), 404
+    return send_file(path, mimetype='application/json')
+
 @app.route('/dice', methods=['GET'])
 def get_dice_jobs():
     try:
@@ -118,26 +419,10 @@ def get_dice_jobs():
                 'example': '/dice?keyword=Python Developer&location=Remote'
             }), 400
         
-        if not location:
-            location = 'Remote'
-        
-        # Build Dice.com URL
-        url = f"https://www.dice.com/jobs?q={keyword.replace(' ', '+')}&location={location.replace(' ', '+')}"
-        
-        logger.info(f"Dice API Request: keyword={keyword}, location={location}")
+        logger.info(f"Dice API Request: keyword={keyword}, location={location or 'Remote'}")
         
         # Scrape Dice jobs
-        scraper = JobScraper()
-        dice_jobs = scraper.dice_scrape(url)
-        
-        return jsonify({
-            'success': True,
-            'platform': 'Dice',
-            'keyword': keyword,
-            'location': location,
-            'total_jobs': len(dice_jobs),
-            'jobs': dice_jobs
-        }), 200
+        return scrape_response('dice', keyword, location)
         
     except Exception as e:
         logger.error(f"Dice API Error: {str(e)}")
@@ -157,24 +442,9 @@ def get_indeed_jobs():
         if not keyword:
             return jsonify({'error': 'Keyword required'}), 400
         
-        if not location:
-            location = 'Remote'
+        logger.info(f"Indeed Request: keyword={keyword}, location={location or 'Remote'}")
         
-        # Indeed URL Format
-        # q = keyword, l = location
-        url = f"https://www.indeed.com/jobs?q={keyword.replace(' ', '+')}&l={location.replace(' ', '+')}"
-        
-        logger.info(f"Indeed Request: {url}")
-        
-        scraper = JobScraper()
-        jobs = scraper.indeed_scrape(url)
-        
-        return jsonify({
-            'success': True,
-            'platform': 'Indeed',
-            'total_jobs': len(jobs),
-            'jobs': jobs
-        }), 200
+        return scrape_response('indeed', keyword, location)
         
     except Exception as e:
         logger.error(f"Indeed API Error: {str(e)}")
@@ -189,24 +459,9 @@ def get_zip_jobs():
         if not keyword:
             return jsonify({'error': 'Keyword required'}), 400
         
-        if not location:
-            location = 'USA' # .com default location
-        
-        # --- ZIPRECRUITER .COM URL FORMAT ---
-        # Note: .com uses 'search' and 'location' parameters
-        url = f"https://www.ziprecruiter.com/jobs-search?search={keyword}&location={location}"
-        
-        logger.info(f"ZipRecruiter (.com) Request: {url}")
+        logger.info(f"ZipRecruiter (.com) Request: keyword={keyword}, location={location or 'USA'}")
         
-        scraper = JobScraper()
-        jobs = scraper.ziprecruiter_scrape(url,keyword,location) # Updated function call karega
-        
-        return jsonify({
-            'success': True,
-            'platform': 'ZipRecruiter',
-            'total_jobs': len(jobs),
-            'jobs': jobs
-        }), 200
+        return scrape_response('ziprecruiter', keyword, location)
         
     except Exception as e:
         logger.error(f"API Error: {str(e)}")
@@ -222,21 +477,9 @@ def get_hiring_jobs():
         if not keyword:
             return jsonify({'error': 'Keyword required'}), 400
         
-        # Base URL (Scraper ab khud navigate karega)
-        base_url = "https://hiring.cafe/"
-        
         logger.info(f"HiringCafe Search: Keyword='{keyword}', Location='{location}'")
         
-        scraper = JobScraper()
-        # Hum function mein direct arguments bhej rahe hain
-        jobs = scraper.hiringcafe_scrape(base_url, keyword=keyword, location=location)
-        
-        return jsonify({
-            'success': True,
-            'platform': 'Hiring.cafe',
-            'total_jobs': len(jobs),
-            'jobs': jobs
-        }), 200
+        return scrape_response('hiringcafe', keyword, location)
         
     except Exception as e:
         logger.error(f"API Error: {str(e)}")
@@ -249,15 +492,7 @@ def get_glassdoor_jobs():
         location = request.args.get('location', '').strip()
         
         logger.info(f"Glassdoor Search: {keyword} in {location}")
-        scraper = JobScraper(user_profile=False)  # Fresh Profile Mode
-        jobs = scraper.glassdoor_scrape(keyword, location)
-        
-        return jsonify({
-            'success': True,
-            'platform': 'Glassdoor',
-            'total_jobs': len(jobs),
-            'jobs': jobs
-        }), 200
+        return scrape_response('glassdoor', keyword, location)
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
@@ -269,16 +504,7 @@ def get_simplyhired():
         
         logger.info(f"SimplyHired Request: {keyword} in {location}")
         
-        # Fresh Profile Mode
-        scraper = JobScraper(user_profile=False) 
-        jobs = scraper.simplyhired_scrape(keyword, location)
-        
-        return jsonify({
-            'success': True,
-            'platform': 'SimplyHired',
-            'total_jobs': len(jobs),
-            'jobs': jobs
-        }), 200
+        return scrape_response('simplyhired', keyword, location)
     except Exception as e:
         return jsonify({'error': str(e)}), 500    
 
@@ -290,16 +516,7 @@ def get_builtin():
         
         logger.info(f"BuiltIn Request: {keyword} in {location}")
         
-        # Fresh Profile Mode
-        scraper = JobScraper(user_profile=False) 
-        jobs = scraper.builtin_scrape(keyword, location)
-        
-        return jsonify({
-            'success': True,
-            'platform': 'BuiltIn',
-            'total_jobs': len(jobs),
-            'jobs': jobs
-        }), 200
+        return scrape_response('builtin', keyword, location)
     except Exception as e:
         return jsonify({'error': str(e)}), 500    
         
@@ -324,20 +541,8 @@ def get_careerbuilder():
         
         print(f"🚀 CareerBuilder Request received: {keyword} in {location}")
         
-        # 2. Scraper initialize kijiye (Fresh Profile Mode)
-        # CareerBuilder ko saved profile ki zaroorat nahi hai
-        scraper = JobScraper(user_profile=False) 
-        
-        # 3. Scraping function call kijiye
-        jobs = scraper.careerbuilder_scrape(keyword, location)
-        
-        # 4. JSON Response return kijiye
-        return jsonify({
-            "success": True,
-            "platform": "CareerBuilder",
-            "total_jobs": len(jobs),
-            "jobs": jobs
-        }), 200
+        # 2. Scraping (warm pool driver) aur JSON Response return kijiye
+        return scrape_response('careerbuilder', keyword, location)
 
     except Exception as e:
         print(f"❌ CareerBuilder Route Error: {str(e)}")
@@ -345,6 +550,213 @@ def get_careerbuilder():
             "success": False,
             "error": str(e)
         }), 500
-           
+
+# --- FAN-OUT SEARCH (saare platforms parallel, har ek ki apni deadline) ---
+@app.route('/search', methods=['GET'])
+def search_all():
+    try:
+        keyword = request.args.get('keyword', '').strip()
+        location = request.args.get('location', '').strip()
+
+        if not keyword:
+            return jsonify({
+                'success': False,
+                'error': 'Keyword parameter is required',
+                'example': '/search?keyword=Python Developer&location=Remote&platforms=dice,indeed'
+            }), 400
+
+        requested = request.args.get('platforms', '').strip()
+        names = [p.strip().lower() for p in requested.split(',') if p.strip()] if requested else list(SEARCH_PLATFORMS)
+        unknown = [name for name in names if name not in PLATFORMS]
+        if unknown:
+            return jsonify({
+                'success': False,
+                'error': f"Unknown platform(s): {', '.join(unknown)}",
+                'available': list(PLATFORMS)
+            }), 400
+
+        try:
+            pages = min(max(int(request.args.get('pages', 3)), 1), 10)
+        except ValueError:
+            pages = 3
+        try:
+            days = max(int(request.args.get('days', 7)), 1)
+        except ValueError:
+            days = 7
+        try:
+            timeout = float(request.args.get('timeout', 0)) or None
+        except ValueError:
+            timeout = None
+
+        bypass = cache_bypass_requested()
+        start = time.monotonic()
+        platforms_report = {}
+        calls, deadlines = {}, {}
+        for name in dict.fromkeys(names):
+            error = validate_params(name, keyword, location)
+            if error:
+                platforms_report[name] = {'status': 'skipped', 'error': error}
+                continue
+            calls[name] = (lambda n=name: cached_scrape(n, keyword, location, pages, days, bypass=bypass))
+            deadline = PLATFORMS[name].deadline
+            deadlines[name] = min(deadline, timeout) if timeout else deadline
+
+        logger.info(f"Fan-out Search: {keyword} in {location or 'Any'} -> {', '.join(calls)}")
+        outcomes = fan_out(calls, deadlines)
+
+        jobs = []
+        for name, outcome in outcomes.items():
+            report = {k: v for k, v in outcome.items() if k != 'result'}
+            if outcome['status'] == 'ok':
+                payload, cache_status, age = outcome['result']
+                platform_jobs = payload.get('jobs', [])
+                report.update({
+                    'total_jobs': len(platform_jobs),
+                    'cache': cache_status,
+                    'cache_age_seconds': int(age),
+                    'served_by': payload.get('served_by')
+                })
+                display = PLATFORMS[name].name
+                jobs.extend({**job, 'platform': job.get('platform', display)} for job in platform_jobs)
+            platforms_report[name] = report
+
+        # Ek hi posting kai boards par syndicate hoti hai: ek job, saare platforms 'sources' mein
+        collected = len(jobs)
+        if request.args.get('dedupe', '1') != '0':
+            with stage('dedup', 'search'):
+                jobs = dedupe(jobs)
+
+        with stage('serialization', 'search'):
+            response = jsonify({
+                'success': any(r['status'] == 'ok' for r in platforms_report.values()),
+                'keyword': keyword,
+                'location': location or 'Any',
+                'total_jobs': len(jobs),
+                'duplicates_removed': collected - len(jobs),
+                'duration_seconds': round(time.monotonic() - start, 2),
+                'platforms': platforms_report,
+                'jobs': jobs
+            })
+        return response, 200
+
+    except Exception as e:
+        logger.error(f"Search API Error: {str(e)}")
+        return jsonify({
+            'success': False,
+            'error': 'Internal server error',
+            'message': str(e)
+        }), 500
+
+# --- JOB STORE QUERY (scraped jobs ka local index: search, filter, paginate) ---
+@app.route('/jobs', methods=['GET'])
+def query_jobs():
+    # Local job store se answer (live scrape nahi); store /search, routes aur tasks se bharta hai
+    try:
+        keyword = request.args.get('keyword', '').strip()
+        location = request.args.get('location', '').strip()
+
+        requested = request.args.get('platforms', '').strip()
+        names = [p.strip().lower() for p in requested.split(',') if p.strip()]
+        unknown = [name for name in names if name not in PLATFORMS]
+        if unknown:
+            return jsonify({
+                'success': False,
+                'error': f"Unknown platform(s): {', '.join(unknown)}",
+                'available': list(PLATFORMS)
+            }), 400
+
+        sort = request.args.get('sort', 'date').strip().lower()
+        if sort not in SORTS:
+            return jsonify({
+                'success': False,
+                'error': f"Unknown sort '{sort}'. Use one of: {', '.join(SORTS)}"
+            }), 400
+
+        try:
+            days = max(int(request.args.get('days', 0)), 0) or None
+        except ValueError:
+            days = None
+        try:
+            page = max(int(request.args.get('page', 1)), 1)
+        except ValueError:
+            page = 1
+        try:
+            per_page = min(max(int(request.args.get('per_page', 20)), 1), 100)
+        except ValueError:
+            per_page = 20
+
+        start = time.perf_counter()
+        total, jobs = job_store.query(keyword=keyword, location=location, platforms=names, days=days,
+                                      page=page, per_page=per_page, sort=sort)
+        return jsonify({
+            'success': True,
+            'keyword': keyword,
+            'location': location,
+            'total_jobs': total,
+            'page': page,
+            'per_page': per_page,
+            'pages': (total + per_page - 1) // per_page,
+            'duration_ms': round((time.perf_counter() - start) * 1000, 2),
+            'jobs': jobs
+        }), 200
+
+    except Exception as e:
+        logger.error(f"Jobs query error: {str(e)}")
+        return jsonify({'success': False, 'error': str(e)}), 500
+
+# --- ASYNC TASK API ---
+@app.route('/tasks', methods=['POST'])
+def submit_task():
+    data = request.get_json(silent=True) or request.form.to_dict() or request.args.to_dict()
+    platform = str(data.get('platform', '')).strip().lower()
+    keyword = str(data.get('keyword', '')).strip()
+    location = str(data.get('location', '')).strip()
+
+    error = validate_params(platform, keyword, location)
+    if error:
+        return jsonify({
+            'success': False,
+            'error': error,
+            'example': {'platform': 'indeed', 'keyword': 'Data Analyst', 'location': 'Remote'}
+        }), 400
+
+    try:
+        pages = min(max(int(data.get('pages', 3)), 1), 10)
+    except (TypeError, ValueError):
+        pages = 3
+    try:
+        days = max(int(data.get('days', 7)), 1)
+    except (TypeError, ValueError):
+        days = 7
+
+    task = task_queue.submit(platform, {
+        'keyword': keyword,
+        'location': location,
+        'pages': pages,
+        'days': days
+    })
+    task['status_url'] = f"/tasks/{task['task_id']}"
+    task['result_url'] = f"/tasks/{task['task_id']}/result"
+    return jsonify(task), 202
+
+@app.route('/tasks/<task_id>', methods=['GET'])
+def get_task(task_id):
+    task = task_queue.get(task_id)
+    if task is None:
+        return jsonify({'success': False, 'error': 'Task not found or expired'}), 404
+    return jsonify(task), 200
+
+@app.route('/tasks/<task_id>/result', methods=['GET'])
+def get_task_result(task_id):
+    task = task_queue.get(task_id, include_result=True)
+    if task is None:
+        return jsonify({'success': False, 'error': 'Task not found or expired'}), 404
+    if task['status'] == 'failed':
+        return jsonify({'success': False, 'error': task['error'], 'task_id': task_id}), 500
+    if task['status'] != 'succeeded':
+        return jsonify({'task_id': task_id, 'status': task['status'], 'progress': task['progress']}), 202
+    return jsonify(task['result']), 200
+
 if __name__ == '__main__':
+    start_background()
     app.run(host='0.0.0.0', port=5002, debug=False)
@@ -0,0 +1,285 @@
+"""
+Stand-in HTML for every platform, shaped after the selectors the scrapers
+use today. Pages are rendered per request so card counts and links point
+at the local fixture server. A real page saved as
+benchmarks/recorded/<platform>/<page>.html is served instead when present.
+"""
+import os
+from datetime import datetime, timedelta
+from html import escape
+from typing import Dict, Optional
+
+RECORDED_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'recorded')
+
+TITLES = ('Data Analyst', 'Senior Python Developer', 'Machine Learning Engineer', 'BI Analyst',
+          'Backend Engineer', 'AI Developer', 'Data Engineer', 'Analytics Consultant')
+COMPANIES = ('Acme Corp', 'Globex', 'Initech', 'Umbrella Analytics', 'Hooli', 'Stark Industries')
+LOCATIONS = ('Remote', 'New York, NY', 'Austin, TX', 'San Francisco, CA', 'Hybrid - Chicago, IL')
+AGES = ('Just now', '3 hours ago', '1 day ago', '2 days ago', '5 days ago', '1 week ago')
+SHORT_AGES = ('1h', '4h', '1d', '2d', '5d', '1w')
+
+PARAGRAPH = ("We are looking for someone who enjoys turning messy data into clear decisions. "
+             "You will own pipelines end to end, partner with product and engineering, and "
+             "ship dashboards, models and services that thousands of people rely on every day. ")
+
+
+def job(i: int) -> Dict[str, str]:
+    return {
+        'title': f"{TITLES[i % len(TITLES)]} {i}",
+        'company': COMPANIES[i % len(COMPANIES)],
+        'location': LOCATIONS[i % len(LOCATIONS)],
+        'age': AGES[i % len(AGES)],
+        'short_age': SHORT_AGES[i % len(SHORT_AGES)],
+        'date': (datetime.now() - timedelta(days=i % 5)).strftime('%Y-%m-%d'),
+    }
+
+
+def description(i: int) -> str:
+    paragraphs = ''.join(f"<p>{PARAGRAPH * 3}</p>" for _ in range(4))
+    bullets = ''.join(f"<li>Requirement {k} for role {i}</li>" for k in range(8))
+    return f"<h2>About the role</h2>{paragraphs}<h3>Requirements</h3><ul>{bullets}</ul>"
+
+
+def page(body: str, title: str = 'Jobs', head: str = '') -> str:
+    # Asli pages jaisa thoda noise: nav, scripts, footer
+    scripts = ''.join(f"<script>window.__chunk{k} = {{loaded: true}};</script>" for k in range(10))
+    return (f"<!DOCTYPE html><html><head><meta charset='utf-8'><title>{escape(title)}</title>{scripts}{head}</head>"
+            f"<body><header><nav><a href='#'>Home</a><a href='#'>Jobs</a></nav></header>{body}"
+            f"<footer><p>&copy; Fixture</p></footer></body></html>")
+
+
+# --- LinkedIn (guest search, requests + Selenium) ---
+def linkedin_search(base: str, count: int, start: int = 0) -> str:
+    cards = []
+    for i in range(start, start + count):
+        j = job(i)
+        cards.append(
+            f"<li><div class='base-card relative w-full base-card--link base-search-card job-search-card' data-entity-urn='urn:li:jobPosting:{i}'>"
+            f"<a class='base-card__full-link absolute' href='{base}/jobs/view/{i}?refId=fixture'><span class='sr-only'>{escape(j['title'])}</span></a>"
+            f"<div class='base-search-card__info'><h3 class='base-search-card__title'>\n  {escape(j['title'])}\n</h3>"
+            f"<h4 class='base-search-card__subtitle'><a class='hidden-nested-link' href='{base}/company/{i}'>{escape(j['company'])}</a></h4>"
+            f"<div class='base-search-card__metadata'><span class='job-search-card__location'>{escape(j['location'])}</span>"
+            f"<time class='job-search-card__listdate' datetime='{j['date']}'>{j['age']}</time></div></div></div></li>"
+        )
+    return page(f"<ul class='jobs-search__results-list'>{''.join(cards)}</ul>", 'LinkedIn Jobs')
+
+
+# --- Hiring.cafe ---
+def hiringcafe_search(base: str, count: int) -> str:
+    cards = []
+    for i in range(count):
+        j = job(i)
+        cards.append(
+            f"<div class='card'><div>{escape(j['company'])}</div><div>{escape(j['title'])}</div>"
+            f"<div>{escape(j['location'])}</div><div>{j['short_age']}</div>"
+            f"<div><div><a href='{base}/viewjob/{i}' aria-label='Open job'></a></div></div></div>"
+        )
+    body = "<input type='text' placeholder='Search jobs'>" + f"<main>{''.join(cards)}</main>"
+    return page(body, 'Hiring Cafe')
+
+
+# --- Dice ---
+def dice_search(base: str, count: int) -> str:
+    cards = []
+    for i in range(count):
+        j = job(i)
+        cards.append(
+            f"<div data-testid='job-card'>"
+            f"<a data-testid='job-search-job-card-link' href='{base}/job-detail/{i}'>"
+            f"<span data-testid='job-search-job-detail-link'>{escape(j['title'])}</span></a>"
+            f"<p class='text-sm font-normal text-zinc-600'>{escape(j['location'])}</p>"
+            f"<p class='text-sm font-normal text-zinc-600'>Full-time</p>"
+            f"<p class='text-sm font-normal text-zinc-600'>{j['age']}</p></div>"
+        )
+    return page(f"<div id='results'>{''.join(cards)}</div>", 'Dice Jobs')
+
+
+# --- ZipRecruiter ---
+def ziprecruiter_search(base: str, count: int) -> str:
+    cards = []
+    for i in range(count):
+        j = job(i)
+        cards.append(
+            f"<article class='job_result' id='job-card-zr{i}'>"
+            f"<h2 aria-label='{escape(j['title'])}'>{escape(j['title'])}</h2>"
+            f"<div data-testid='job-card-company'>{escape(j['company'])}</div>"
+            f"<div data-testid='job-card-location'>{escape(j['location'])}</div></article>"
+        )
+    return page(''.join(cards), 'ZipRecruiter')
+
+
+def ziprecruiter_detail(base: str, job_key: str) -> str:
+    i = int(job_key.replace('zr', '') or 0)
+    return page(
+        f"<div data-testid='job-details-scroll-container'>{description(i)}</div>"
+        f"<a aria-label='Apply' href='{base}/apply/{i}'>Apply</a>", 'ZipRecruiter Job'
+    )
+
+
+# --- Indeed ---
+def indeed_search(base: str, count: int) -> str:
+    cards = []
+    for i in range(count):
+        j = job(i)
+        cards.append(
+            f"<div class='job_seen_beacon'><h2 class='jobTitle'><a data-jk='jk{i}' href='{base}/viewjob?jk=jk{i}'>"
+            f"<span title='{escape(j['title'])}'>{escape(j['title'])}</span></a></h2>"
+            f"<span data-testid='company-name'>{escape(j['company'])}</span>"
+            f"<div data-testid='text-location'>{escape(j['location'])}</div></div>"
+        )
+    return page(''.join(cards), 'Indeed')
+
+
+def indeed_detail(base: str, jk: str) -> str:
+    i = int(jk.replace('jk', '') or 0)
+    return page(
+        f"<div class='jobsearch-ViewJobLayout-jobDisplay'><div id='jobDescriptionText'>{description(i)}</div>"
+        f"<button>Save</button></div>", 'Indeed Job'
+    )
+
+
+# --- Glassdoor ---
+def glassdoor_search(base: str, count: int) -> str:
+    cards = []
+    for i in range(count):
+        j = job(i)
+        cards.append(
+            f"<li class='jobCard'><div>{escape(j['company'])}</div><div>4.{i % 10} ★</div>"
+            f"<div><a data-test='job-title' href='{base}/job-listing/{i}'>{escape(j['title'])}</a></div>"
+            f"<div>{escape(j['location'])}</div><div>{j['short_age']}</div></li>"
+        )
+    return page(f"<ul>{''.join(cards)}</ul><div id='panel'></div>", 'Glassdoor')
+
+
+def glassdoor_detail(base: str, i: int) -> str:
+    return page(f"<div class='JobDetails_jobDescription__uW_fK'>{description(i)}</div>", 'Glassdoor Job')
+
+
+# --- SimplyHired (side panel JS se bharta hai) ---
+SIMPLYHIRED_PANEL_JS = """
+<script>
+document.addEventListener('click', function (e) {
+  var a = e.target.closest('[data-testid="searchSerpJobTitle"] a');
+  if (!a) return;
+  e.preventDefault();
+  var panel = document.querySelector('[data-testid="viewJobBodyJobFullDescriptionContent"]');
+  setTimeout(function () { panel.innerHTML = a.getAttribute('data-description'); }, 50);
+});
+</script>
+"""
+
+
+def simplyhired_search(base: str, count: int) -> str:
+    cards = []
+    for i in range(count):
+        j = job(i)
+        cards.append(
+            f"<li class='css-0'><h2 data-testid='searchSerpJobTitle'>"
+            f"<a href='{base}/job/{i}' data-description='{escape(description(i))}'>{escape(j['title'])}</a></h2>"
+            f"<span data-testid='companyName'>{escape(j['company'])}</span>"
+            f"<span data-testid='searchSerpJobLocation'>{escape(j['location'])}</span>"
+            f"<p data-testid='searchSerpJobDateStamp'>{j['age']}</p></li>"
+        )
+    body = (f"<ul>{''.join(cards)}</ul>"
+            f"<aside><div data-testid='viewJobBodyJobFullDescriptionContent'></div></aside>{SIMPLYHIRED_PANEL_JS}")
+    return page(body, 'SimplyHired')
+
+
+# --- BuiltIn ---
+def builtin_search(base: str, count: int) -> str:
+    cards = []
+    for i in range(count):
+        j = job(i)
+        cards.append(
+            f"<div data-id='job-card'><a data-id='job-card-title' href='{base}/job/{i}'>{escape(j['title'])}</a>"
+            f"<a data-id='company-title' href='{base}/company/{i}'>{escape(j['company'])}</a>"
+            f"<span class='font-barlow'>Full-time</span><span class='font-barlow'>{escape(j['location'])}</span>"
+            f"<span class='bg-gray-01'>Reposted {j['age']}</span></div>"
+        )
+    return page(''.join(cards), 'Built In')
+
+
+def builtin_detail(base: str, i: int) -> str:
+    return page(f"<div class='job-description'>{description(i)}</div>", 'Built In Job')
+
+
+# --- CareerBuilder ---
+def careerbuilder_search(base: str, count: int) -> str:
+    cards = []
+    for i in range(count):
+        j = job(i)
+        cards.append(
+            f"<li class='job-listing-item'><h2 class='job-title'><a href='{base}/job/{i}'>{escape(j['title'])}</a></h2>"
+            f"<span class='company-name'>{escape(j['company'])}</span><span class='job-location'>{escape(j['location'])}</span>"
+            f"<span class='job-post-date'>{j['age']}</span></li>"
+        )
+    return page(f"<ul>{''.join(cards)}</ul>", 'CareerBuilder')
+
+
+def careerbuilder_detail(base: str, i: int) -> str:
+    return page(f"<div id='job-description'>{description(i)}</div>", 'CareerBuilder Job')
+
+
+def generic_detail(base: str, i: int) -> str:
+    return page(f"<main><article class='job-description'>{description(i)}</article></main>", 'Job')
+
+
+def _last_int(path: str) -> int:
+    tail = path.rstrip('/').rsplit('/', 1)[-1]
+    return int(tail) if tail.isdigit() else 0
+
+
+def _linkedin_search(base, path, query, cards, pages):
+    start = int(query.get('start', 0) or 0)
+    # `pages` ke baad khali page, jaise asli search results khatam hote hain
+    return linkedin_search(base, cards if start < pages * cards else 0, start)
+
+
+# platform -> (detail page hai?, detail renderer, search renderer)
+ROUTES = {
+    'linkedin': (lambda path, query: not path.startswith('/jobs/search'),
+                 lambda base, path, query: generic_detail(base, _last_int(path)),
+                 _linkedin_search),
+    'hiringcafe': (lambda path, query: '/viewjob/' in path,
+                   lambda base, path, query: generic_detail(base, _last_int(path)),
+                   lambda base, path, query, cards, pages: hiringcafe_search(base, cards)),
+    'dice': (lambda path, query: '/job-detail/' in path,
+             lambda base, path, query: generic_detail(base, _last_int(path)),
+             lambda base, path, query, cards, pages: dice_search(base, cards)),
+    'ziprecruiter': (lambda path, query: bool(query.get('lk')),
+                     lambda base, path, query: ziprecruiter_detail(base, query['lk']),
+                     lambda base, path, query, cards, pages: ziprecruiter_search(base, cards)),
+    'indeed': (lambda path, query: path.startswith('/viewjob'),
+               lambda base, path, query: indeed_detail(base, query.get('jk', '')),
+               lambda base, path, query, cards, pages: indeed_search(base, cards)),
+    'glassdoor': (lambda path, query: '/job-listing/' in path,
+                  lambda base, path, query: glassdoor_detail(base, _last_int(path)),
+                  lambda base, path, query, cards, pages: glassdoor_search(base, cards)),
+    'simplyhired': (lambda path, query: '/job/' in path,
+                    lambda base, path, query: generic_detail(base, _last_int(path)),
+                    lambda base, path, query, cards, pages: simplyhired_search(base, cards)),
+    'builtin': (lambda path, query: '/job/' in path,
+                lambda base, path, query: builtin_detail(base, _last_int(path)),
+                lambda base, path, query, cards, pages: builtin_search(base, cards)),
+    'careerbuilder': (lambda path, query: '/job/' in path,
+                      lambda base, path, query: careerbuilder_detail(base, _last_int(path)),
+                      lambda base, path, query, cards, pages: careerbuilder_search(base, cards)),
+}
+
+
+def render(platform: str, path: str, query: Dict[str, str], base: str, cards: int, pages: int) -> Optional[str]:
+    """Returns the HTML for platform + path (path without the /<platform> prefix), or None for 404."""
+    if platform not in ROUTES:
+        return None
+    is_detail, detail, search = ROUTES[platform]
+    kind = 'detail' if is_detail(path, query) else 'search'
+
+    # Recorded snapshot (agar rakha hai) synthetic page ki jagah
+    recorded = os.path.join(RECORDED_DIR, platform, f"{kind}.html")
+    if os.path.exists(recorded):
+        with open(recorded, encoding='utf-8') as f:
+            return f.read()
+
+    if kind == 'detail':
+        return detail(base, path, query)
+    return search(base, path, query, cards, pages)
@@ -0,0 +1,223 @@
+"""
+Offline scraper benchmarks against the local fixture server.
+
+    python -m benchmarks.run --iterations 20 --output bench.json
+
+Reports parse throughput, end-to-end latency percentiles and Python
+allocation peaks (tracemalloc) as JSON. Selenium scrapers are skipped
+when Chrome can't be launched (or with --no-selenium).
+"""
+import argparse
+import contextlib
+import json
+import logging
+import math
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+from typing import Callable, Dict, List
+
+from benchmarks import fixtures
+from benchmarks.server import FixtureServer
+from http_cache import ResponseCache
+from rate_limit import HostRateLimiter
+import recency
+from scraper import LinkedInJobScraper
+
+# Relative date strings jo platforms par dikhte hain
+DATE_SAMPLES = fixtures.AGES + fixtures.SHORT_AGES + (
+    'Today', 'Yesterday', 'Posted 30+ days ago', 'Reposted 4 Days Ago', '2 weeks ago', '1 month ago', '2026-10-01',
+)
+
+SELENIUM_CASES: Dict[str, Callable] = {
+    'linkedin_browser': lambda scraper, base: scraper.linkedin_scrape('Data Analyst', 'Remote'),
+    'hiringcafe': lambda scraper, base: scraper.hiringcafe_scrape(f"{base['hiringcafe']}/", keyword='Data Analyst'),
+    'dice': lambda scraper, base: scraper.dice_scrape(f"{base['dice']}/jobs?q=Data+Analyst&location=Remote"),
+    'ziprecruiter': lambda scraper, base: scraper.ziprecruiter_scrape(
+        f"{base['ziprecruiter']}/jobs-search?search=Data Analyst&location=USA", 'Data Analyst', 'USA'),
+    'indeed': lambda scraper, base: scraper.indeed_scrape(f"{base['indeed']}/jobs?q=Data+Analyst&l=Remote"),
+    'glassdoor': lambda scraper, base: scraper.glassdoor_scrape('Data Analyst', 'Remote'),
+    'simplyhired': lambda scraper, base: scraper.simplyhired_scrape('Data Analyst', 'Remote'),
+    'builtin': lambda scraper, base: scraper.builtin_scrape('Data Analyst', 'Remote'),
+    'careerbuilder': lambda scraper, base: scraper.careerbuilder_scrape('Data Analyst', 'USA'),
+}
+
+
+def percentile(samples: List[float], q: float) -> float:
+    ordered = sorted(samples)
+    k = (len(ordered) - 1) * q
+    low = math.floor(k)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (k - low)
+
+
+def measure(fn: Callable, iterations: int, warmup: int = 1) -> Dict:
+    """Latency stats over `iterations` calls, then one extra call under tracemalloc for the memory peak."""
+    for _ in range(warmup):
+        fn()
+
+    samples = []
+    result = None
+    for _ in range(iterations):
+        start = time.perf_counter()
+        result = fn()
+        samples.append(time.perf_counter() - start)
+
+    # tracemalloc timing bigaadta hai, isliye peak alag run mein
+    tracemalloc.start()
+    try:
+        fn()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    ms = [s * 1000 for s in samples]
+    return {
+        'iterations': iterations,
+        'mean_ms': round(sum(ms) / len(ms), 3),
+        'p50_ms': round(percentile(ms, 0.50), 3),
+        'p90_ms': round(percentile(ms, 0.90), 3),
+        'p99_ms': round(percentile(ms, 0.99), 3),
+        'min_ms': round(min(ms), 3),
+        'max_ms': round(max(ms), 3),
+        'peak_kib': round(peak / 1024, 1),
+    }, result
+
+
+def bench_parsing(server: FixtureServer, iterations: int) -> Dict:
+    results = {}
+    html = fixtures.linkedin_search(server.base_url('linkedin'), server.cards)
+    for parser in ('lxml', 'bs4'):
+        scraper = LinkedInJobScraper(parser=parser, days_filter=30, cache=ResponseCache())
+        stats, jobs = measure(lambda: scraper._parse_jobs(html), iterations)
+        stats['cards_per_page'] = len(jobs)
+        stats['pages_per_second'] = round(1000 / stats['mean_ms'], 1)
+        stats['cards_per_second'] = round(len(jobs) * 1000 / stats['mean_ms'], 1)
+        results[f'linkedin_parse_jobs[{parser}]'] = stats
+
+    # Shared recency parser: cached (real usage, dates repeat) vs har call par regex
+    batch = DATE_SAMPLES * 100
+    for name, parse in (('recency_posted_at', recency.posted_at),
+                        ('recency_posted_at[uncached]',
+                         lambda text: recency._parse.__wrapped__(recency._key(text)))):
+        stats, _ = measure(lambda: [parse(text) for text in batch], iterations)
+        stats['calls_per_batch'] = len(batch)
+        stats['calls_per_second'] = round(len(batch) * 1000 / stats['mean_ms'], 1)
+        results[name] = stats
+    return results
+
+
+def bench_linkedin_requests(server: FixtureServer, iterations: int) -> Dict:
+    def run():
+        scraper = LinkedInJobScraper(
+            max_pages=server.pages,
+            days_filter=30,
+            base_url=server.base_url('linkedin'),
+            rate_limiter=HostRateLimiter(rate=1e9, burst=1e9),
+            cache=ResponseCache(),
+        )
+        return scraper.scrape_jobs(location='Remote', keyword='Data Analyst')
+
+    stats, result = measure(run, iterations)
+    stats['jobs'] = result['total_jobs']
+    return stats
+
+
+def bench_selenium(server: FixtureServer, iterations: int, platforms: List[str]) -> Dict:
+    from driver_pool import DriverPool
+    from multi_platform import BASE_URLS, JobScraper, launch_driver
+
+    pool = DriverPool(factory=lambda: launch_driver(user_profile=False), size=1, max_size=1)
+    try:
+        pool.warm()
+        if pool.stats()['idle'] == 0:
+            raise RuntimeError('driver pool could not launch Chrome')
+    except Exception as e:
+        pool.shutdown()
+        return {name: {'skipped': f"Chrome unavailable: {e}"} for name in platforms}
+
+    base = {name: server.base_url(name) for name in BASE_URLS}
+    results = {}
+    try:
+        for name in platforms:
+            case = SELENIUM_CASES[name]
+
+            def run():
+                # Seen-jobs index ke bina, warna pehle run ke baad JD fetch hi nahi hota
+                scraper = JobScraper(pool=pool, base_urls=base, seen_index=None)
+                return case(scraper, base)
+
+            try:
+                stats, jobs = measure(run, iterations)
+                stats['jobs'] = len(jobs)
+                stats['pool'] = {k: pool.stats()[k] for k in ('acquires', 'launches', 'recycled')}
+                results[name] = stats
+            except Exception as e:
+                results[name] = {'error': str(e)}
+    finally:
+        pool.shutdown()
+    return results
+
+
+def git_commit() -> str:
+    try:
+        return subprocess.check_output(['git', 'rev-parse', '--short', 'HEAD'], stderr=subprocess.DEVNULL, text=True).strip()
+    except Exception:
+        return ''
+
+
+def main(argv=None) -> Dict:
+    parser = argparse.ArgumentParser(description='Offline scraper benchmarks')
+    parser.add_argument('--iterations', type=int, default=20, help='timed runs per parse / requests benchmark')
+    parser.add_argument('--selenium-iterations', type=int, default=3, help='timed runs per Selenium scraper')
+    parser.add_argument('--cards', type=int, default=25, help='job cards per fixture page')
+    parser.add_argument('--pages', type=int, default=3, help='LinkedIn result pages before the empty page')
+    parser.add_argument('--platforms', default=','.join(SELENIUM_CASES), help='comma separated Selenium platforms')
+    parser.add_argument('--no-selenium', action='store_true', help='skip the Selenium scrapers')
+    parser.add_argument('--output', help='write JSON here instead of stdout')
+    args = parser.parse_args(argv)
+
+    platforms = [p.strip() for p in args.platforms.split(',') if p.strip()]
+    unknown = [p for p in platforms if p not in SELENIUM_CASES]
+    if unknown:
+        parser.error(f"unknown platform(s): {', '.join(unknown)}")
+
+    logging.getLogger().setLevel(logging.WARNING)
+    report = {
+        'meta': {
+            'timestamp': datetime.now().isoformat(timespec='seconds'),
+            'git_commit': git_commit(),
+            'python': platform.python_version(),
+            'machine': platform.machine(),
+            'system': platform.system(),
+        },
+        'config': {
+            'iterations': args.iterations,
+            'selenium_iterations': args.selenium_iterations,
+            'cards': args.cards,
+            'pages': args.pages,
+        },
+    }
+
+    # Scrapers ke print() JSON output ko kharab na karein
+    with FixtureServer(cards=args.cards, pages=args.pages) as server, contextlib.redirect_stdout(sys.stderr):
+        report['parse'] = bench_parsing(server, args.iterations)
+        report['end_to_end'] = {'linkedin': bench_linkedin_requests(server, args.iterations)}
+        if not args.no_selenium:
+            report['end_to_end'].update(bench_selenium(server, args.selenium_iterations, platforms))
+        report['meta']['fixture_requests'] = server.requests
+
+    output = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(output + '\n')
+    else:
+        print(output)
+    return report
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,66 @@
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qsl, urlsplit
+
+from benchmarks.fixtures import render
+
+
+class FixtureServer:
+    """
+    Local stand-in for the job boards. Every platform lives under its own
+    prefix, e.g. http://127.0.0.1:<port>/indeed/jobs?q=..., so scrapers are
+    pointed at it through their base URL overrides.
+    """
+
+    def __init__(self, cards: int = 25, pages: int = 3, host: str = '127.0.0.1', port: int = 0):
+        self.cards = cards
+        self.pages = pages
+        self.requests = 0
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def do_GET(self):
+                parts = urlsplit(self.path)
+                platform, _, rest = parts.path.lstrip('/').partition('/')
+                query = dict(parse_qsl(parts.query, keep_blank_values=True))
+                html = render(platform, '/' + rest, query, server.base_url(platform), server.cards, server.pages)
+                server.requests += 1
+
+                body = (html if html is not None else 'Not Found').encode('utf-8')
+                self.send_response(200 if html is not None else 404)
+                self.send_header('Content-Type', 'text/html; charset=utf-8')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self._httpd = ThreadingHTTPServer((host, port), Handler)
+        self._httpd.daemon_threads = True
+        self._thread = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def base_url(self, platform: str) -> str:
+        return f"{self.url}/{platform}"
+
+    def start(self) -> 'FixtureServer':
+        self._thread = threading.Thread(target=self._httpd.serve_forever, name='fixture-server', daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def __enter__(self) -> 'FixtureServer':
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
@@ -0,0 +1,142 @@
+from typing import Callable, Dict, List, NamedTuple, Optional
+
+from bs4 import BeautifulSoup
+from lxml import etree
+
+
+class CardFields(NamedTuple):
+    """Raw fields of one LinkedIn job card. None = element not found on the card."""
+    title: Optional[str]
+    company: Optional[str]
+    location: Optional[str]
+    date: Optional[str]
+    link: Optional[str]
+
+
+# Har field ke selectors, priority order mein (pehla match jeetta hai)
+CARD_SELECTORS = (('div', 'base-card'), ('li', 'jobs-search-results__list-item'), ('div', 'job-search-card'))
+TITLE_SELECTORS = (('h3', 'base-search-card__title'), ('a', 'base-card__full-link'), ('h3', None))
+COMPANY_SELECTORS = (('h4', 'base-search-card__subtitle'), ('a', 'hidden-nested-link'), ('h4', None))
+LOCATION_SELECTORS = (('span', 'job-search-card__location'), ('span', 'job-result-card__location'))
+DATE_SELECTORS = (('time', None), ('span', 'job-search-card__listdate'))
+
+
+# --- BeautifulSoup backend (reference implementation) ---
+def _bs4_find(card, selectors):
+    for tag, cls in selectors:
+        elem = card.find(tag, class_=cls) if cls else card.find(tag)
+        if elem:
+            return elem
+    return None
+
+
+def parse_cards_bs4(html: str) -> List[CardFields]:
+    soup = BeautifulSoup(html, 'lxml')
+
+    job_cards = []
+    for tag, cls in CARD_SELECTORS:
+        job_cards = soup.find_all(tag, class_=cls)
+        if job_cards:
+            break
+
+    cards = []
+    for card in job_cards:
+        title = _bs4_find(card, TITLE_SELECTORS)
+        company = _bs4_find(card, COMPANY_SELECTORS)
+        location = _bs4_find(card, LOCATION_SELECTORS)
+
+        date = _bs4_find(card, DATE_SELECTORS)
+        date_text = None
+        if date:
+            datetime_attr = date.get('datetime', '')
+            date_text = str(datetime_attr) if datetime_attr else date.get_text()
+
+        link = card.find('a', class_='base-card__full-link') or card.find('a', href=True)
+
+        cards.append(CardFields(
+            title.get_text() if title else None,
+            company.get_text() if company else None,
+            location.get_text() if location else None,
+            date_text,
+            str(link.get('href', '')) if link else None,
+        ))
+    return cards
+
+
+# --- lxml backend (compiled XPath, card ke andar scoped) ---
+def _class_test(cls: str) -> str:
+    # bs4 ke class_ jaisa: class attribute ke whitespace-separated tokens mein se ek
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {cls} ')"
+
+
+def _first(tag: str, cls: Optional[str], extra: str = '') -> etree.XPath:
+    test = f"[{_class_test(cls)}]" if cls else ''
+    return etree.XPath(f"(.//{tag}{test}{extra})[1]", smart_strings=False)
+
+
+_CARD_XPATHS = tuple(etree.XPath(f"//{tag}[{_class_test(cls)}]") for tag, cls in CARD_SELECTORS)
+_TITLE_XPATHS = tuple(_first(tag, cls) for tag, cls in TITLE_SELECTORS)
+_COMPANY_XPATHS = tuple(_first(tag, cls) for tag, cls in COMPANY_SELECTORS)
+_LOCATION_XPATHS = tuple(_first(tag, cls) for tag, cls in LOCATION_SELECTORS)
+_DATE_XPATHS = tuple(_first(tag, cls) for tag, cls in DATE_SELECTORS)
+_LINK_XPATHS = (_first('a', 'base-card__full-link'), _first('a', None, extra='[@href]'))
+
+# bs4 get_text() script/style/template ke andar ke strings skip karta hai
+_TEXT_XPATH = etree.XPath(
+    "descendant::text()[not(ancestor::script or ancestor::style or ancestor::template)]",
+    smart_strings=False
+)
+
+_HTML_PARSER = etree.HTMLParser()
+
+
+def _lxml_find(card, xpaths):
+    for xpath in xpaths:
+        found = xpath(card)
+        if found:
+            return found[0]
+    return None
+
+
+def _lxml_text(elem) -> Optional[str]:
+    return ''.join(_TEXT_XPATH(elem)) if elem is not None else None
+
+
+def parse_cards_lxml(html: str) -> List[CardFields]:
+    try:
+        root = etree.fromstring(html, _HTML_PARSER)
+    except ValueError:
+        # Unicode string mein encoding declaration ho to lxml bytes maangta hai
+        root = etree.fromstring(html.encode('utf-8'), _HTML_PARSER)
+    if root is None:
+        return []
+
+    job_cards = []
+    for xpath in _CARD_XPATHS:
+        job_cards = xpath(root)
+        if job_cards:
+            break
+
+    cards = []
+    for card in job_cards:
+        date = _lxml_find(card, _DATE_XPATHS)
+        date_text = None
+        if date is not None:
+            date_text = date.get('datetime') or _lxml_text(date)
+
+        link = _lxml_find(card, _LINK_XPATHS)
+
+        cards.append(CardFields(
+            _lxml_text(_lxml_find(card, _TITLE_XPATHS)),
+            _lxml_text(_lxml_find(card, _COMPANY_XPATHS)),
+            _lxml_text(_lxml_find(card, _LOCATION_XPATHS)),
+            date_text,
+            link.get('href', '') if link is not None else None,
+        ))
+    return cards
+
+
+PARSERS: Dict[str, Callable[[str], List[CardFields]]] = {
+    'lxml': parse_cards_lxml,
+    'bs4': parse_cards_bs4,
+}
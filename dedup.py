@@ -0,0 +1,275 @@
+import os
+import re
+import threading
+from typing import Dict, Iterable, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+from job_store import job_field
+
+# Estimated description Jaccard jiske upar do jobs ek hi posting maane jaate hain
+DEDUP_THRESHOLD = float(os.environ.get('DEDUP_THRESHOLD', 0.8))
+NUM_PERM = 64
+# 16 bands x 4 rows: ~0.5 Jaccard par candidate banne lagta hai, final check threshold se
+LSH_BANDS = 16
+# Isse chhoti description (placeholders, "Description not found") ka signature nahi banta
+MIN_DESCRIPTION_WORDS = 30
+
+# Sirf aakhri legal suffix hatate hain ("Acme Corp." == "Acme Corporation" == "ACME, Inc")
+COMPANY_SUFFIXES = frozenset((
+    'inc', 'incorporated', 'llc', 'llp', 'lp', 'ltd', 'limited', 'corp', 'corporation', 'co', 'company',
+    'plc', 'gmbh', 'ag', 'sa', 'bv', 'pte', 'pvt', 'private',
+))
+TITLE_ABBREVIATIONS = {
+    'sr': 'senior', 'snr': 'senior', 'jr': 'junior', 'eng': 'engineer', 'engr': 'engineer',
+    'dev': 'developer', 'mgr': 'manager', 'assoc': 'associate', 'admin': 'administrator',
+    'swe': 'software engineer', 'ii': '2', 'iii': '3', 'iv': '4',
+}
+# Boards title mein ye jod dete hain, posting wahi rehti hai
+TITLE_NOISE = frozenset(('remote', 'hybrid', 'onsite', 'wfh', 'urgent', 'urgently', 'hiring', 'immediate',
+                         'immediately', 'joiner', 'joiners'))
+# In query params mein job ki identity hoti hai (Indeed jk, ZipRecruiter lk, ...); baaki tracking
+ID_PARAMS = frozenset(('jk', 'vjk', 'lk', 'jl', 'jobid', 'job_id', 'id', 'currentjobid'))
+
+_PARENS = re.compile(r'\([^)]*\)|\[[^\]]*\]')
+_TOKEN = re.compile(r'[a-z0-9+#]+')
+_TAG = re.compile(r'<[^>]+>')
+_LINKEDIN_VIEW = re.compile(r'^/jobs/view/(?:[^/]*-)?(\d+)')
+
+
+def normalize_company(name: str) -> str:
+    tokens = _TOKEN.findall((name or '').lower().replace('&', ' and '))
+    while len(tokens) > 1 and tokens[-1] in COMPANY_SUFFIXES:
+        tokens.pop()
+    return ' '.join(tokens)
+
+
+def normalize_title(title: str) -> str:
+    tokens = []
+    for token in _TOKEN.findall(_PARENS.sub(' ', (title or '').lower())):
+        if token in TITLE_NOISE:
+            continue
+        tokens.extend(TITLE_ABBREVIATIONS.get(token, token).split())
+    return ' '.join(tokens)
+
+
+def canonical_url(url: str) -> str:
+    """Scheme-less host + path + job-id params only, so tracking variants of one apply link compare equal."""
+    if not url or not url.startswith('http'):
+        return ''
+    parts = urlsplit(url)
+    host = parts.netloc.lower()
+    for prefix in ('www.', 'm.'):
+        if host.startswith(prefix):
+            host = host[len(prefix):]
+    path = parts.path.rstrip('/') or '/'
+    # LinkedIn: in.linkedin.com/jobs/view/data-analyst-at-acme-123 == linkedin.com/jobs/view/123
+    if host.endswith('linkedin.com'):
+        host = 'linkedin.com'
+        match = _LINKEDIN_VIEW.match(path)
+        if match:
+            path = f"/jobs/view/{match.group(1)}"
+    params = sorted((k.lower(), v) for k, v in parse_qsl(parts.query) if k.lower() in ID_PARAMS)
+    return f"{host}{path}" + (f"?{urlencode(params)}" if params else '')
+
+
+def _city(location: str) -> str:
+    # "New York, NY" aur "New York, New York, United States" dono -> "new york"
+    return ' '.join(_TOKEN.findall((location or '').split(',')[0].lower()))
+
+
+# --- MinHash (densified one-permutation hashing: har shingle ek hi baar hash, 64 bins) ---
+_BIN_BITS = NUM_PERM.bit_length() - 1
+_EMPTY = float('inf')
+# Khaali bin padosi bin se bharte waqt offset, taaki asli values se takraaye nahi
+_ROTATION = 1 << 62
+
+
+def minhash(text: str) -> Optional[Tuple[int, ...]]:
+    """
+    NUM_PERM-value MinHash over word 3-gram shingles; None for short
+    descriptions. Uses Python's salted hash(), so signatures are only
+    comparable within one process (the index is never persisted).
+    """
+    words = _TOKEN.findall(_TAG.sub(' ', text or '').lower())
+    if len(words) < MIN_DESCRIPTION_WORDS:
+        return None
+    bins = [_EMPTY] * NUM_PERM
+    for h in set(map(hash, zip(words, words[1:], words[2:]))):
+        slot = h & (NUM_PERM - 1)
+        value = h >> _BIN_BITS
+        if value < bins[slot]:
+            bins[slot] = value
+    # Densification: khaali bin = agla asli bhara hua bin (circular) + distance * rotation
+    signature = list(bins)
+    for i in range(NUM_PERM):
+        if bins[i] is _EMPTY:
+            for step in range(1, NUM_PERM):
+                value = bins[(i + step) % NUM_PERM]
+                if value is not _EMPTY:
+                    signature[i] = value + step * _ROTATION
+                    break
+    return tuple(signature)
+
+
+def similarity(a: Tuple[int, ...], b: Tuple[int, ...]) -> float:
+    return sum(1 for x, y in zip(a, b) if x == y) / len(a)
+
+
+def _token_overlap(a: str, b: str) -> float:
+    left, right = set(a.split()), set(b.split())
+    return len(left & right) / len(left | right) if left and right else 0.0
+
+
+class _Cluster:
+    __slots__ = ('job', 'sources', 'company', 'title', 'city', 'signature')
+
+    def __init__(self, job: Dict, company: str, title: str, city: str, signature):
+        self.job = dict(job)
+        self.sources: List[Dict] = []
+        self.company = company
+        self.title = title
+        self.city = city
+        self.signature = signature
+
+
+class DedupIndex:
+    """
+    Collapses the same posting seen on several boards. Jobs match on a
+    canonical apply URL, on normalized (company, title) in the same city,
+    or on a MinHash description signature looked up through an LSH band
+    index (candidates are verified against `threshold`). Each kept job
+    records every platform it came from under 'sources'.
+    """
+
+    def __init__(self, threshold: float = DEDUP_THRESHOLD, bands: int = LSH_BANDS):
+        if NUM_PERM % bands:
+            raise ValueError(f"bands must divide {NUM_PERM}")
+        self.threshold = threshold
+        self.bands = bands
+        self.rows = NUM_PERM // bands
+        self._clusters: List[_Cluster] = []
+        self._by_url: Dict[str, int] = {}
+        self._by_key: Dict[Tuple[str, str], List[int]] = {}
+        self._buckets: List[Dict[Tuple[int, ...], List[int]]] = [{} for _ in range(bands)]
+        self.matches = {'url': 0, 'key': 0, 'minhash': 0}
+
+    def _band_keys(self, signature):
+        return [signature[b * self.rows:(b + 1) * self.rows] for b in range(self.bands)]
+
+    def _find_exact(self, url, company, title, city) -> Tuple[Optional[int], str]:
+        if url and url in self._by_url:
+            return self._by_url[url], 'url'
+        # Khaali city par key match nahi (Dice/Hiring.cafe aksar location chhod dete hain): MinHash decide kare
+        if company and title and city:
+            for index in self._by_key.get((company, title), ()):
+                if self._clusters[index].city == city:
+                    return index, 'key'
+        return None, ''
+
+    def _find_similar(self, company, title, signature) -> Optional[int]:
+        candidates = set()
+        for band, key in enumerate(self._band_keys(signature)):
+            candidates.update(self._buckets[band].get(key, ()))
+        for index in sorted(candidates):
+            cluster = self._clusters[index]
+            # Same boilerplate wali do alag roles merge na hon: company aur title bhi milne chahiye
+            if company and cluster.company and company != cluster.company:
+                continue
+            if _token_overlap(title, cluster.title) < 0.5:
+                continue
+            if similarity(signature, cluster.signature) >= self.threshold:
+                return index
+        return None
+
+    def add(self, job: Dict, platform: str) -> bool:
+        """Adds one job; returns False when it was merged into an earlier one."""
+        url = canonical_url(job_field(job, 'link'))
+        company = normalize_company(job_field(job, 'company'))
+        title = normalize_title(job_field(job, 'title'))
+        city = _city(job_field(job, 'location'))
+        source = {'platform': platform, 'link': job_field(job, 'link') or None}
+
+        # Sasti exact checks pehle, MinHash sirf unke fail hone par
+        index, reason = self._find_exact(url, company, title, city)
+        signature = None
+        if index is None:
+            signature = minhash(job_field(job, 'description'))
+            if signature is not None:
+                index, reason = self._find_similar(company, title, signature), 'minhash'
+
+        if index is not None:
+            self.matches[reason] += 1
+            self._merge(index, job, url, source, signature)
+            return False
+
+        index = len(self._clusters)
+        cluster = _Cluster(job, company, title, city, signature)
+        cluster.sources.append(source)
+        self._clusters.append(cluster)
+        if url:
+            self._by_url[url] = index
+        if company and title and city:
+            self._by_key.setdefault((company, title), []).append(index)
+        if signature is not None:
+            self._index_signature(index, signature)
+        return True
+
+    def _index_signature(self, index: int, signature):
+        for band, key in enumerate(self._band_keys(signature)):
+            self._buckets[band].setdefault(key, []).append(index)
+
+    def _merge(self, index: int, job: Dict, url: str, source: Dict, signature):
+        # Pehle aaya job hi rakhte hain; description sirf duplicate ke paas ho to wahan se le lo
+        cluster = self._clusters[index]
+        if source not in cluster.sources:
+            cluster.sources.append(source)
+        if url:
+            self._by_url.setdefault(url, index)
+        if not job_field(cluster.job, 'description') and job_field(job, 'description'):
+            for key in ('description', 'description_text', 'description_html'):
+                if key in job:
+                    cluster.job[key] = job[key]
+            if cluster.signature is None:
+                cluster.signature = signature if signature is not None else minhash(job_field(job, 'description'))
+                if cluster.signature is not None:
+                    self._index_signature(index, cluster.signature)
+
+    def jobs(self) -> List[Dict]:
+        return [{**cluster.job, 'sources': list(cluster.sources)} for cluster in self._clusters]
+
+
+class DedupStats:
+    """Totals over every dedupe() call, for /health."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stats = {'runs': 0, 'jobs_in': 0, 'jobs_out': 0, 'url': 0, 'key': 0, 'minhash': 0}
+
+    def record(self, jobs_in: int, jobs_out: int, matches: Dict[str, int]):
+        with self._lock:
+            self._stats['runs'] += 1
+            self._stats['jobs_in'] += jobs_in
+            self._stats['jobs_out'] += jobs_out
+            for reason, count in matches.items():
+                self._stats[reason] += count
+
+    def snapshot(self) -> Dict:
+        with self._lock:
+            stats = dict(self._stats)
+        stats['duplicates_removed'] = stats['jobs_in'] - stats['jobs_out']
+        return stats
+
+
+dedup_stats = DedupStats()
+
+
+def dedupe(jobs: Iterable[Dict], threshold: float = DEDUP_THRESHOLD) -> List[Dict]:
+    """Collapses near-duplicate jobs (each needs a 'platform' key); survivors get a 'sources' list."""
+    index = DedupIndex(threshold)
+    count = 0
+    for job in jobs:
+        count += 1
+        index.add(job, job.get('platform') or '')
+    unique = index.jobs()
+    dedup_stats.record(count, len(unique), index.matches)
+    return unique
@@ -0,0 +1,114 @@
+import logging
+from collections import Counter, deque
+from typing import Callable, Dict, Iterator, List, Optional
+from urllib.parse import urlparse
+
+from metrics import stage
+from waits import Readiness, wait_until
+
+logger = logging.getLogger(__name__)
+
+
+def iter_details(driver, jobs: List[Dict], extract: Callable, platform: str,
+                 readiness: Optional[Readiness] = None, concurrency: int = 4,
+                 per_host: int = 3, link_key: str = 'link',
+                 prepare_tab: Optional[Callable] = None) -> Iterator[Dict]:
+    """
+    Loads job detail pages in parallel browser tabs and merges the fields
+    returned by extract(driver, job) back into each job dict.
+
+    Tabs are opened with window.open so the browser downloads up to
+    `concurrency` pages at once (max `per_host` per host); extraction then
+    walks the tabs oldest-first. Each job is yielded as soon as its detail
+    page has been extracted, so callers can stream it onwards.
+
+    prepare_tab(driver), if given, runs in each new tab before it starts
+    loading (e.g. to apply request blocking).
+    """
+    concurrency = max(concurrency, 1)
+    per_host = max(per_host, 1)
+    main_window = driver.current_window_handle
+
+    pending = deque(enumerate(jobs))
+    open_tabs = deque()
+    host_counts = Counter()
+    fetched = 0
+
+    def open_more():
+        skipped = deque()
+        while pending and len(open_tabs) < concurrency:
+            index, job = pending.popleft()
+            link = job.get(link_key) or ''
+            if not link.startswith('http'):
+                print(f"{platform} JD Error: invalid link {link!r}")
+                continue
+            host = urlparse(link).netloc
+            if host_counts[host] >= per_host:
+                skipped.append((index, job))
+                continue
+
+            before = set(driver.window_handles)
+            driver.switch_to.window(main_window)
+            driver.execute_script("window.open(arguments[0], '_blank');", 'about:blank' if prepare_tab else link)
+            new_handles = [h for h in driver.window_handles if h not in before]
+            if not new_handles:
+                print(f"{platform} JD Error: could not open tab for {link}")
+                continue
+            if prepare_tab:
+                # Blank tab mein setup, phir navigation (execute_script wait nahi karta, load parallel chalta hai)
+                driver.switch_to.window(new_handles[0])
+                try:
+                    prepare_tab(driver)
+                except Exception as e:
+                    print(f"{platform} tab setup error: {e}")
+                driver.execute_script("window.location.href = arguments[0];", link)
+                driver.switch_to.window(main_window)
+            host_counts[host] += 1
+            open_tabs.append((new_handles[0], index, job, host))
+        # Host cap ki wajah se ruke hue jobs queue ke aage wapas
+        pending.extendleft(reversed(skipped))
+
+    try:
+        open_more()
+        while open_tabs:
+            handle, index, job, host = open_tabs.popleft()
+            # Is job ke tab ka wait + extract (aur agle tabs kholna) jd_fetch mein
+            with stage('jd_fetch', platform):
+                try:
+                    driver.switch_to.window(handle)
+                    if readiness is not None:
+                        wait_until(driver, readiness.conditions, timeout=readiness.ceiling,
+                                   platform=platform, stage='detail', require_all=readiness.require_all)
+                    fields = extract(driver, job)
+                    job.update(fields or {})
+                except Exception as e:
+                    print(f"{platform} JD Error: {e}")
+                    job = None
+                finally:
+                    try:
+                        driver.switch_to.window(handle)
+                        driver.close()
+                    except Exception:
+                        pass
+                    host_counts[host] -= 1
+                    driver.switch_to.window(main_window)
+                # Agle tabs pehle khol do, taaki caller ke kaam ke dauran bhi load hote rahein
+                open_more()
+            if job is not None:
+                fetched += 1
+                yield job
+    finally:
+        # Error ke case mein bache hue tabs band karo
+        for handle, _, _, _ in open_tabs:
+            try:
+                driver.switch_to.window(handle)
+                driver.close()
+            except Exception:
+                pass
+        try:
+            driver.switch_to.window(main_window)
+        except Exception:
+            pass
+
+    logger.info(f"{platform}: fetched {fetched}/{len(jobs)} job descriptions")
+
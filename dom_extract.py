@@ -0,0 +1,151 @@
+import json
+from typing import Dict, List, NamedTuple, Optional, Tuple
+from urllib.parse import urljoin
+
+from bs4 import BeautifulSoup
+
+from metrics import per_item, stage
+
+
+class Field(NamedTuple):
+    """
+    One value read from a card. `selectors` is a fallback chain evaluated
+    with card.querySelector ('' = the card itself); the first match wins.
+    `attr` is 'text' (innerText), 'element' (the WebElement) or an
+    attribute/property name such as 'href'. With many=True every match of
+    the first selector that matches anything is returned as a list.
+    """
+    selectors: Tuple[str, ...]
+    attr: str = 'text'
+    many: bool = False
+
+
+class CardSpec(NamedTuple):
+    cards: Tuple[str, ...]          # card selectors, first one that matches wins
+    fields: Dict[str, Field]
+    closest: Optional[str] = None   # card = match.closest(closest), e.g. title -> its <li>
+
+
+# Browser ke andar saare cards + fields ek hi call mein (har find_element ek WebDriver round trip hai)
+_EXTRACT_JS = """
+var spec = JSON.parse(arguments[0]);
+var limit = arguments[1];
+
+var cards = [];
+for (var i = 0; i < spec.cards.length && !cards.length; i++) {
+    cards = Array.prototype.slice.call(document.querySelectorAll(spec.cards[i]));
+}
+if (spec.closest) {
+    cards = cards.map(function (el) { return el.closest(spec.closest); }).filter(Boolean);
+}
+var total = cards.length;
+if (limit !== null) cards = cards.slice(0, limit);
+
+function read(el, attr) {
+    if (attr === 'element') return el;
+    if (attr === 'text') return el.innerText;
+    var value = (attr in el) ? el[attr] : el.getAttribute(attr);
+    return value === undefined ? null : value;
+}
+
+function extract(card, field) {
+    for (var i = 0; i < field.selectors.length; i++) {
+        var sel = field.selectors[i];
+        if (field.many) {
+            var found = sel ? card.querySelectorAll(sel) : [card];
+            if (found.length) {
+                return Array.prototype.map.call(found, function (el) { return read(el, field.attr); });
+            }
+        } else {
+            var el = sel ? card.querySelector(sel) : card;
+            if (el) return read(el, field.attr);
+        }
+    }
+    return field.many ? [] : null;
+}
+
+return {
+    total: total,
+    cards: cards.map(function (card) {
+        var row = {};
+        Object.keys(spec.fields).forEach(function (name) { row[name] = extract(card, spec.fields[name]); });
+        return row;
+    })
+};
+"""
+
+
+def _spec_json(spec: CardSpec) -> str:
+    return json.dumps({
+        'cards': list(spec.cards),
+        'closest': spec.closest,
+        'fields': {
+            name: {'selectors': list(field.selectors), 'attr': field.attr, 'many': field.many}
+            for name, field in spec.fields.items()
+        },
+    })
+
+
+def extract_cards(driver, spec: CardSpec, limit: Optional[int] = None) -> Tuple[int, List[Dict]]:
+    """
+    Reads every card on the page with one execute_script call. Returns
+    (total cards found, [field dict per card]) with at most `limit` cards;
+    missing fields are None (or [] for many=True).
+    """
+    # Ek hi round trip mein cards dhoondhna aur fields padhna, isliye poora card_discovery
+    with stage('card_discovery'):
+        result = driver.execute_script(_EXTRACT_JS, _spec_json(spec), limit) or {}
+    return result.get('total', 0), result.get('cards') or []
+
+
+# --- Same CardSpec, browser ke bina (HTTP fast path ke server-rendered HTML par) ---
+def _read_html(el, attr: str, base_url: str):
+    if attr == 'element':
+        return el
+    if attr == 'text':
+        # innerText jaisa: whitespace collapse
+        return ' '.join(el.get_text(' ').split())
+    value = el.get(attr)
+    if isinstance(value, list):
+        value = ' '.join(value)
+    # JS el.href absolute URL deta hai
+    if attr in ('href', 'src') and value is not None:
+        value = urljoin(base_url, value)
+    return value
+
+
+def _extract_html(card, field: Field, base_url: str):
+    for sel in field.selectors:
+        if field.many:
+            found = card.select(sel) if sel else [card]
+            if found:
+                return [_read_html(el, field.attr, base_url) for el in found]
+        else:
+            el = card.select_one(sel) if sel else card
+            if el is not None:
+                return _read_html(el, field.attr, base_url)
+    return [] if field.many else None
+
+
+def extract_cards_html(html: str, spec: CardSpec, base_url: str = '',
+                       limit: Optional[int] = None) -> Tuple[int, List[Dict]]:
+    """
+    extract_cards() for a fetched HTML document: same fallback chains and
+    return shape, with hrefs resolved against base_url and 'element'
+    fields returned as bs4 Tags.
+    """
+    with stage('parse'):
+        soup = BeautifulSoup(html, 'lxml')
+    with stage('card_discovery'):
+        cards = []
+        for sel in spec.cards:
+            cards = soup.select(sel)
+            if cards:
+                break
+        if spec.closest:
+            cards = [c for c in (el if el.name == spec.closest else el.find_parent(spec.closest) for el in cards) if c]
+    total = len(cards)
+    if limit is not None:
+        cards = cards[:limit]
+    return total, [{name: _extract_html(card, field, base_url) for name, field in spec.fields.items()}
+                   for card in per_item(cards, 'card_extraction')]
@@ -0,0 +1,167 @@
+import logging
+import os
+import signal
+import threading
+import time
+from typing import Dict, Optional, Set, Tuple
+
+from launch_modes import children_map, driver_pids, process_tree
+
+logger = logging.getLogger(__name__)
+
+# Hard wall-clock limit per scrape; iske baad driver ka poora process tree kill
+SCRAPE_DEADLINE = float(os.environ.get('SCRAPE_DEADLINE', 300))
+
+
+def _start_time(pid: int) -> Optional[int]:
+    # /proc/<pid>/stat field 22: pid reuse pakadne ke liye (pid + start time = ek hi process)
+    try:
+        with open(f'/proc/{pid}/stat', 'rb') as f:
+            stat = f.read()
+        fields = stat[stat.rfind(b')') + 2:].split()
+        # Zombie mar chuka hai, bas parent ne reap nahi kiya
+        return None if fields[0] == b'Z' else int(fields[19])
+    except (OSError, IndexError, ValueError):
+        return None
+
+
+class _Tracked:
+    __slots__ = ('roots', 'procs', 'deadline', 'label', 'expired')
+
+    def __init__(self, roots):
+        self.roots = roots
+        self.procs: Set[Tuple[int, Optional[int]]] = set()
+        self.deadline: Optional[float] = None
+        self.label = ''
+        self.expired = False
+
+
+class DriverLifecycle:
+    """
+    Tracks the exact process tree (chromedriver, Chrome, renderers) of each
+    driver so cleanup only ever touches that driver's processes, and kills
+    the tree of any scrape that runs past its deadline.
+    """
+
+    def __init__(self, poll_interval: float = 1.0, kill_grace: float = 3.0):
+        self.poll_interval = poll_interval
+        self.kill_grace = kill_grace
+        self._tracked: Dict[int, _Tracked] = {}
+        self._lock = threading.Lock()
+        self._watchdog: Optional[threading.Thread] = None
+        self._stats = {
+            'registered': 0,
+            'deadline_kills': 0,
+            'processes_killed': 0,
+        }
+
+    # --- Tracking ---
+    def register(self, driver):
+        tracked = _Tracked(driver_pids(driver))
+        self._refresh(tracked)
+        with self._lock:
+            self._tracked[id(driver)] = tracked
+            self._stats['registered'] += 1
+
+    def _refresh(self, tracked: _Tracked, children=None):
+        # Naye renderers add karo; purane yaad rehte hain taaki browser mare to orphans bhi milein
+        for root in tracked.roots:
+            for pid in process_tree(root, children):
+                tracked.procs.add((pid, _start_time(pid)))
+
+    # --- Deadlines ---
+    def watch(self, driver, seconds: float, label: str = ''):
+        """Kills the driver's process tree if it is still leased `seconds` from now."""
+        with self._lock:
+            tracked = self._tracked.get(id(driver))
+            if tracked is None:
+                return
+            tracked.deadline = time.monotonic() + seconds
+            tracked.label = label
+            tracked.expired = False
+            if self._watchdog is None or not self._watchdog.is_alive():
+                self._watchdog = threading.Thread(target=self._watch_loop, name='driver-watchdog', daemon=True)
+                self._watchdog.start()
+
+    def unwatch(self, driver):
+        with self._lock:
+            tracked = self._tracked.get(id(driver))
+            if tracked is not None:
+                tracked.deadline = None
+
+    def expired(self, driver) -> bool:
+        with self._lock:
+            tracked = self._tracked.get(id(driver))
+            return bool(tracked and tracked.expired)
+
+    def _watch_loop(self):
+        while True:
+            time.sleep(self.poll_interval)
+            now = time.monotonic()
+            with self._lock:
+                watched = [t for t in self._tracked.values() if t.deadline is not None]
+                due = [t for t in watched if now >= t.deadline]
+                for tracked in due:
+                    tracked.deadline = None
+                    tracked.expired = True
+                    self._stats['deadline_kills'] += 1
+            if watched:
+                children = children_map() if os.path.isdir('/proc') else None
+                for tracked in watched:
+                    if tracked not in due:
+                        self._refresh(tracked, children)
+            for tracked in due:
+                logger.warning(f"Driver watchdog: {tracked.label or 'scrape'} exceeded its deadline, killing its browser")
+                self._kill(tracked)
+
+    # --- Cleanup ---
+    def _wait_exit(self, procs: Set, timeout: float) -> Set:
+        deadline = time.monotonic() + timeout
+        alive = {(pid, started) for pid, started in procs if started is not None and _start_time(pid) == started}
+        while alive and time.monotonic() < deadline:
+            time.sleep(0.05)
+            alive = {(pid, started) for pid, started in alive if _start_time(pid) == started}
+        return alive
+
+    def _kill(self, tracked: _Tracked, wait_first: bool = False):
+        self._refresh(tracked)
+        # quit() ke baad pehle khud band hone ka mauka do, sirf bache hue ko signal
+        alive = self._wait_exit(tracked.procs, self.kill_grace if wait_first else 0)
+        signalled = len(alive)
+        for sig in (signal.SIGTERM, signal.SIGKILL):
+            if not alive:
+                break
+            for pid, _ in alive:
+                try:
+                    os.kill(pid, sig)
+                except OSError:
+                    pass
+            alive = self._wait_exit(alive, self.kill_grace)
+        if signalled:
+            with self._lock:
+                self._stats['processes_killed'] += signalled
+
+    def kill(self, driver, wait_first: bool = False):
+        """Terminates whatever is left of the driver's tree and stops tracking it."""
+        with self._lock:
+            tracked = self._tracked.pop(id(driver), None)
+        if tracked is not None:
+            self._kill(tracked, wait_first)
+
+    def quit(self, driver):
+        """driver.quit(), then kill any process of its tree that outlived it."""
+        try:
+            driver.quit()
+        except Exception:
+            pass
+        self.kill(driver, wait_first=True)
+
+    def stats(self) -> Dict:
+        with self._lock:
+            stats = dict(self._stats)
+            stats['tracked'] = len(self._tracked)
+            stats['watched'] = sum(1 for t in self._tracked.values() if t.deadline is not None)
+        return stats
+
+
+lifecycle = DriverLifecycle()
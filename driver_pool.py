@@ -0,0 +1,409 @@
+import logging
+import threading
+import time
+from typing import Callable, Dict, List, Optional
+from urllib.parse import urlparse
+
+logger = logging.getLogger(__name__)
+
+
+class PoolExhausted(Exception):
+    pass
+
+
+class _PooledDriver:
+    __slots__ = ('driver', 'uses', 'launched_at', 'launch_seconds')
+
+    def __init__(self, driver, launch_seconds: float):
+        self.driver = driver
+        self.uses = 0
+        self.launched_at = time.time()
+        self.launch_seconds = launch_seconds
+
+
+class BrowserBudget:
+    """
+    Process-wide cap on live browsers shared by several pools. A slot is
+    taken before each launch and given back when the driver quits. When
+    the cap is reached, a pool can reclaim a slot by closing another
+    pool's idle driver.
+    """
+
+    def __init__(self, limit: int):
+        self.limit = max(limit, 1)
+        self._used = 0
+        self._lock = threading.Lock()
+        self._pools: List['DriverPool'] = []
+
+    def register(self, pool: 'DriverPool'):
+        with self._lock:
+            self._pools.append(pool)
+
+    def try_take(self) -> bool:
+        with self._lock:
+            if self._used >= self.limit:
+                return False
+            self._used += 1
+            return True
+
+    def give_back(self):
+        with self._lock:
+            self._used = max(self._used - 1, 0)
+
+    def reclaim(self, requester: 'DriverPool') -> bool:
+        """Closes one idle driver of another pool; True if a slot was freed."""
+        with self._lock:
+            pools = [pool for pool in self._pools if pool is not requester]
+        # Pool locks budget lock ke bahar (do pools ek doosre se reclaim karein to deadlock na ho)
+        return any(pool.evict_idle() for pool in pools)
+
+    @property
+    def used(self) -> int:
+        with self._lock:
+            return self._used
+
+
+class DriverPool:
+    """
+    Keeps pre-launched Chrome drivers warm so requests lease a browser
+    instead of paying the 3-8s startup on every call. With a shared
+    BrowserBudget, launches also count against the global browser cap.
+    """
+
+    # Budget full hone par doosre pools ke slots chhodne ka poll interval
+    BUDGET_POLL_SECONDS = 0.5
+
+    def __init__(self, factory: Callable, size: int = 2, max_size: Optional[int] = None,
+                 max_uses: int = 20, acquire_timeout: float = 120, reset_origins: tuple = (),
+                 closer: Optional[Callable] = None, budget: Optional[BrowserBudget] = None):
+        self.factory = factory
+        self.budget = budget
+        if budget is not None:
+            budget.register(self)
+        # closer(driver) driver band karta hai (default driver.quit())
+        self.closer = closer
+        self.size = max(size, 0)
+        self.max_size = max(max_size or self.size, self.size, 1)
+        self.max_uses = max_uses
+        self.acquire_timeout = acquire_timeout
+        self.reset_origins = reset_origins
+
+        self._idle: List[_PooledDriver] = []
+        self._leased: Dict[int, _PooledDriver] = {}
+        self._launching = 0
+        self._closed = False
+        self._cond = threading.Condition()
+
+        self._stats = {
+            'acquires': 0,
+            'pool_hits': 0,
+            'pool_misses': 0,
+            'waits': 0,
+            'launches': 0,
+            'launch_failures': 0,
+            'launch_seconds_total': 0.0,
+            'last_launch_seconds': 0.0,
+            'recycled': 0,
+            'discarded': 0,
+            'budget_waits': 0,
+            'evicted_for_budget': 0,
+        }
+
+    # --- Launching ---
+    def _launch(self) -> _PooledDriver:
+        start = time.perf_counter()
+        try:
+            driver = self.factory()
+        except Exception:
+            with self._cond:
+                self._stats['launch_failures'] += 1
+            raise
+        elapsed = time.perf_counter() - start
+        with self._cond:
+            self._stats['launches'] += 1
+            self._stats['launch_seconds_total'] += elapsed
+            self._stats['last_launch_seconds'] = elapsed
+        logger.info(f"Driver pool: launched browser in {elapsed:.2f}s")
+        return _PooledDriver(driver, elapsed)
+
+    def _total(self) -> int:
+        return len(self._idle) + len(self._leased) + self._launching
+
+    def _take_slot(self) -> bool:
+        return self.budget is None or self.budget.try_take()
+
+    def _give_slot(self):
+        if self.budget is not None:
+            self.budget.give_back()
+
+    def warm(self):
+        while True:
+            with self._cond:
+                if self._closed or len(self._idle) + self._launching >= self.size \
+                        or self._total() >= self.max_size:
+                    return
+                # Warm karne ke liye doosre modes ke browser band nahi karte
+                if not self._take_slot():
+                    return
+                self._launching += 1
+            try:
+                entry = self._launch()
+            except Exception as e:
+                logger.error(f"Driver pool: warm launch failed: {e}")
+                self._give_slot()
+                with self._cond:
+                    self._launching -= 1
+                    self._cond.notify_all()
+                return
+            with self._cond:
+                self._launching -= 1
+                if self._closed:
+                    self._quit(entry)
+                    return
+                self._idle.append(entry)
+                self._cond.notify_all()
+
+    def warm_async(self):
+        threading.Thread(target=self.warm, name='driver-pool-warm', daemon=True).start()
+
+    # --- Health & reset ---
+    def _is_healthy(self, entry: _PooledDriver) -> bool:
+        try:
+            entry.driver.execute_script("return 1")
+            return len(entry.driver.window_handles) > 0
+        except Exception:
+            return False
+
+    def _reset(self, entry: _PooledDriver) -> bool:
+        driver = entry.driver
+        try:
+            handles = driver.window_handles
+            for handle in handles[1:]:
+                driver.switch_to.window(handle)
+                driver.close()
+            driver.switch_to.window(handles[0])
+
+            origins = set(self.reset_origins)
+            current = urlparse(driver.current_url or '')
+            if current.scheme in ('http', 'https'):
+                origins.add(f"{current.scheme}://{current.netloc}")
+                try:
+                    driver.execute_script("window.localStorage.clear(); window.sessionStorage.clear();")
+                except Exception:
+                    pass
+            for origin in origins:
+                try:
+                    driver.execute_cdp_cmd("Storage.clearDataForOrigin", {
+                        "origin": origin,
+                        "storageTypes": "all"
+                    })
+                except Exception:
+                    pass
+
+            driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+            driver.delete_all_cookies()
+            driver.get("about:blank")
+            return True
+        except Exception as e:
+            logger.warning(f"Driver pool: reset failed, discarding driver: {e}")
+            return False
+
+    def _close_driver(self, driver):
+        try:
+            if self.closer is not None:
+                self.closer(driver)
+            else:
+                driver.quit()
+        except Exception:
+            pass
+
+    def _quit(self, entry: _PooledDriver):
+        self._close_driver(entry.driver)
+        self._give_slot()
+
+    def evict_idle(self) -> bool:
+        """Quits the oldest idle driver (for another pool under the shared budget)."""
+        with self._cond:
+            if not self._idle:
+                return False
+            entry = self._idle.pop(0)
+            self._stats['evicted_for_budget'] += 1
+        self._quit(entry)
+        return True
+
+    # --- Leasing ---
+    def acquire(self, timeout: Optional[float] = None):
+        timeout = self.acquire_timeout if timeout is None else timeout
+        deadline = time.monotonic() + timeout
+        waited = budget_waited = False
+
+        while True:
+            with self._cond:
+                if self._closed:
+                    raise PoolExhausted("Driver pool is shut down")
+
+                entry = self._idle.pop() if self._idle else None
+                launch = budget_full = False
+                if entry is None and self._total() < self.max_size:
+                    if self._take_slot():
+                        self._launching += 1
+                        launch = True
+                    else:
+                        budget_full = True
+                if entry is None and not launch:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise PoolExhausted(f"No driver available after {timeout}s")
+                    if not waited:
+                        self._stats['waits'] += 1
+                        waited = True
+                    if not budget_full:
+                        self._cond.wait(remaining)
+                        continue
+                    if not budget_waited:
+                        self._stats['budget_waits'] += 1
+                        budget_waited = True
+
+            if budget_full:
+                # Global cap bhara hai: doosre mode ka idle browser band karo, warna slot khaali hone tak poll
+                if not self.budget.reclaim(self):
+                    with self._cond:
+                        self._cond.wait(min(remaining, self.BUDGET_POLL_SECONDS))
+                continue
+
+            if launch:
+                try:
+                    entry = self._launch()
+                except Exception:
+                    self._give_slot()
+                    with self._cond:
+                        self._launching -= 1
+                        self._cond.notify_all()
+                    raise
+                with self._cond:
+                    self._launching -= 1
+                    self._stats['acquires'] += 1
+                    self._stats['pool_misses'] += 1
+                    self._leased[id(entry.driver)] = entry
+                return entry.driver
+
+            if not self._is_healthy(entry):
+                logger.warning("Driver pool: idle driver failed health check, replacing")
+                self._quit(entry)
+                with self._cond:
+                    self._stats['discarded'] += 1
+                    self._cond.notify_all()
+                continue
+
+            with self._cond:
+                self._stats['acquires'] += 1
+                self._stats['pool_hits'] += 1
+                self._leased[id(entry.driver)] = entry
+            return entry.driver
+
+    def release(self, driver, discard: bool = False):
+        with self._cond:
+            entry = self._leased.pop(id(driver), None)
+        if entry is None:
+            self._close_driver(driver)
+            return
+
+        entry.uses += 1
+        keep = not discard and not self._closed
+        if keep and self.max_uses and entry.uses >= self.max_uses:
+            keep = False
+            with self._cond:
+                self._stats['recycled'] += 1
+        elif not keep:
+            with self._cond:
+                self._stats['discarded'] += 1
+
+        if keep and not self._reset(entry):
+            keep = False
+            with self._cond:
+                self._stats['discarded'] += 1
+
+        if not keep:
+            self._quit(entry)
+
+        with self._cond:
+            if keep:
+                self._idle.append(entry)
+            self._cond.notify_all()
+
+        if not keep and not self._closed:
+            self.warm_async()
+
+    def shutdown(self):
+        with self._cond:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._cond.notify_all()
+        for entry in idle:
+            self._quit(entry)
+
+    def stats(self) -> Dict:
+        with self._cond:
+            stats = dict(self._stats)
+            stats['idle'] = len(self._idle)
+            stats['in_use'] = len(self._leased)
+            stats['launching'] = self._launching
+            stats['size'] = self.size
+            stats['max_size'] = self.max_size
+            stats['max_uses'] = self.max_uses
+        stats['hit_ratio'] = round(stats['pool_hits'] / stats['acquires'], 3) if stats['acquires'] else 0.0
+        stats['avg_launch_seconds'] = round(stats['launch_seconds_total'] / stats['launches'], 3) if stats['launches'] else 0.0
+        stats['launch_seconds_total'] = round(stats['launch_seconds_total'], 3)
+        stats['last_launch_seconds'] = round(stats['last_launch_seconds'], 3)
+        return stats
+
+
+class DriverPoolGroup:
+    """
+    One DriverPool per launch mode, so a scrape only leases a browser that
+    was started the way its platform needs. Pools are created on first use;
+    factory(mode) launches one driver. max_size is one browser budget for
+    all modes together: a mode that needs a browser while the budget is
+    full closes another mode's idle driver (or waits for one to quit).
+    """
+
+    def __init__(self, factory: Callable[[str], object], **pool_kwargs):
+        self.factory = factory
+        self.pool_kwargs = pool_kwargs
+        size = max(pool_kwargs.get('size', 2), 0)
+        # Saare modes milke itne browsers (DRIVER_POOL_MAX_SIZE), mode-wise nahi
+        self.max_size = max(pool_kwargs.get('max_size') or size, size, 1)
+        self.budget = BrowserBudget(self.max_size)
+        self._pools: Dict[str, DriverPool] = {}
+        self._lock = threading.Lock()
+
+    def for_mode(self, mode: str) -> DriverPool:
+        with self._lock:
+            pool = self._pools.get(mode)
+            if pool is None:
+                pool = DriverPool(factory=lambda: self.factory(mode), budget=self.budget, **self.pool_kwargs)
+                self._pools[mode] = pool
+            return pool
+
+    def in_use(self) -> int:
+        with self._lock:
+            pools = list(self._pools.values())
+        return sum(pool.stats()['in_use'] for pool in pools)
+
+    def warm_async(self, modes):
+        for mode in modes:
+            self.for_mode(mode).warm_async()
+
+    def shutdown(self):
+        with self._lock:
+            pools = list(self._pools.values())
+        for pool in pools:
+            pool.shutdown()
+
+    def stats(self) -> Dict:
+        with self._lock:
+            pools = dict(self._pools)
+        return {mode: pool.stats() for mode, pool in pools.items()}
+
+    def budget_stats(self) -> Dict:
+        return {'max_browsers': self.budget.limit, 'live_browsers': self.budget.used}
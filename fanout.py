@@ -0,0 +1,52 @@
+import logging
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict
+
+logger = logging.getLogger(__name__)
+
+
+def fan_out(calls: Dict[str, Callable[[], Any]], deadlines: Dict[str, float]) -> Dict[str, Dict]:
+    """
+    Runs every call in parallel and collects whatever finishes before its
+    own deadline (seconds from start). Calls that miss their deadline are
+    reported as 'timeout' and left to finish in the background.
+    """
+    results: Dict[str, Dict] = {}
+    if not calls:
+        return results
+
+    start = time.monotonic()
+    executor = ThreadPoolExecutor(max_workers=len(calls), thread_name_prefix='fanout')
+    futures = {executor.submit(fn): name for name, fn in calls.items()}
+    pending = set(futures)
+
+    try:
+        while pending:
+            now = time.monotonic() - start
+            # Jinki deadline nikal gayi unhe timeout mark karo
+            for future in list(pending):
+                name = futures[future]
+                if not future.done() and now >= deadlines[name]:
+                    pending.discard(future)
+                    results[name] = {'status': 'timeout', 'duration_seconds': round(now, 2)}
+                    logger.warning(f"Fan-out: {name} missed its {deadlines[name]}s deadline")
+            if not pending:
+                break
+
+            next_deadline = min(deadlines[futures[f]] for f in pending)
+            done, _ = wait(pending, timeout=max(next_deadline - now, 0), return_when=FIRST_COMPLETED)
+            for future in done:
+                pending.discard(future)
+                name = futures[future]
+                elapsed = round(time.monotonic() - start, 2)
+                try:
+                    results[name] = {'status': 'ok', 'duration_seconds': elapsed, 'result': future.result()}
+                except Exception as e:
+                    logger.error(f"Fan-out: {name} failed: {e}")
+                    results[name] = {'status': 'error', 'duration_seconds': elapsed, 'error': str(e)}
+    finally:
+        # Timeout wale calls background mein chalte rahenge, request block nahi hogi
+        executor.shutdown(wait=False)
+
+    return results
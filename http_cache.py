@@ -0,0 +1,180 @@
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, NamedTuple, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+logger = logging.getLogger(__name__)
+
+
+def normalize_url(url: str) -> str:
+    """Lowercase scheme/host, drop fragment and default ports, sort query params."""
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or '').lower()
+    if parts.port and not ((scheme == 'http' and parts.port == 80) or (scheme == 'https' and parts.port == 443)):
+        host = f"{host}:{parts.port}"
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    return urlunsplit((scheme, host, parts.path or '/', query, ''))
+
+
+class CachedResponse(NamedTuple):
+    url: str
+    body: str
+    etag: Optional[str]
+    last_modified: Optional[str]
+    stored_at: float
+
+
+class ResponseCache:
+    """Interface for _fetch_page caches. lookup() returns (entry, is_fresh)."""
+
+    def lookup(self, url: str) -> Tuple[Optional[CachedResponse], bool]:
+        return None, False
+
+    def store(self, url: str, body: str, etag: Optional[str] = None, last_modified: Optional[str] = None):
+        pass
+
+    def refresh(self, url: str):
+        pass
+
+    def stats(self) -> Dict:
+        return {}
+
+
+class DiskResponseCache(ResponseCache):
+    """
+    Response bodies on disk keyed by normalized URL, with TTL expiry,
+    ETag/Last-Modified revalidation and size-bounded LRU eviction.
+    """
+
+    def __init__(self, directory: str, ttl: float = 900, max_bytes: int = 100 * 1024 * 1024):
+        self.directory = directory
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._index: 'OrderedDict[str, Dict]' = OrderedDict()
+        self._total_bytes = 0
+        self._loaded = False
+        self._stats = {'hits': 0, 'misses': 0, 'stale': 0, 'revalidated': 0, 'stores': 0, 'evictions': 0}
+
+    def _path(self, key: str, ext: str) -> str:
+        return os.path.join(self.directory, f"{key}.{ext}")
+
+    def _load(self):
+        # Pehli baar use hone par disk index memory mein (stored_at order = LRU order)
+        if self._loaded:
+            return
+        self._loaded = True
+        if not os.path.isdir(self.directory):
+            return
+        entries = []
+        for name in os.listdir(self.directory):
+            if not name.endswith('.json'):
+                continue
+            try:
+                with open(os.path.join(self.directory, name), encoding='utf-8') as f:
+                    entries.append(json.load(f))
+            except (OSError, ValueError):
+                continue
+        for meta in sorted(entries, key=lambda m: m.get('stored_at', 0)):
+            if os.path.exists(self._path(meta['key'], 'body')):
+                self._index[meta['key']] = meta
+                self._total_bytes += meta.get('size', 0)
+
+    def _write_atomic(self, path: str, data: bytes):
+        tmp = f"{path}.{threading.get_ident()}.tmp"
+        with open(tmp, 'wb') as f:
+            f.write(data)
+        os.replace(tmp, path)
+
+    def _remove(self, key: str):
+        meta = self._index.pop(key, None)
+        if meta:
+            self._total_bytes -= meta.get('size', 0)
+        for ext in ('body', 'json'):
+            try:
+                os.remove(self._path(key, ext))
+            except OSError:
+                pass
+
+    def lookup(self, url: str) -> Tuple[Optional[CachedResponse], bool]:
+        key = hashlib.sha256(normalize_url(url).encode('utf-8')).hexdigest()
+        with self._lock:
+            self._load()
+            meta = self._index.get(key)
+            if meta is None:
+                self._stats['misses'] += 1
+                return None, False
+            try:
+                with open(self._path(key, 'body'), encoding='utf-8') as f:
+                    body = f.read()
+            except OSError:
+                self._remove(key)
+                self._stats['misses'] += 1
+                return None, False
+            self._index.move_to_end(key)
+            fresh = time.time() - meta['stored_at'] < self.ttl
+            self._stats['hits' if fresh else 'stale'] += 1
+            entry = CachedResponse(meta['url'], body, meta.get('etag'), meta.get('last_modified'), meta['stored_at'])
+            return entry, fresh
+
+    def store(self, url: str, body: str, etag: Optional[str] = None, last_modified: Optional[str] = None):
+        key = hashlib.sha256(normalize_url(url).encode('utf-8')).hexdigest()
+        data = body.encode('utf-8')
+        meta = {
+            'key': key,
+            'url': normalize_url(url),
+            'etag': etag,
+            'last_modified': last_modified,
+            'stored_at': time.time(),
+            'size': len(data),
+        }
+        with self._lock:
+            self._load()
+            try:
+                os.makedirs(self.directory, exist_ok=True)
+                self._write_atomic(self._path(key, 'body'), data)
+                self._write_atomic(self._path(key, 'json'), json.dumps(meta).encode('utf-8'))
+            except OSError as e:
+                logger.warning(f"HTTP cache write failed: {e}")
+                return
+            old = self._index.pop(key, None)
+            if old:
+                self._total_bytes -= old.get('size', 0)
+            self._index[key] = meta
+            self._total_bytes += meta['size']
+            self._stats['stores'] += 1
+
+            # LRU eviction jab tak size limit ke andar na aa jaye
+            while self._total_bytes > self.max_bytes and len(self._index) > 1:
+                oldest = next(iter(self._index))
+                self._remove(oldest)
+                self._stats['evictions'] += 1
+
+    def refresh(self, url: str):
+        # 304 Not Modified: body same hai, sirf TTL dobara start karo
+        key = hashlib.sha256(normalize_url(url).encode('utf-8')).hexdigest()
+        with self._lock:
+            meta = self._index.get(key)
+            if meta is None:
+                return
+            meta['stored_at'] = time.time()
+            self._stats['revalidated'] += 1
+            try:
+                self._write_atomic(self._path(key, 'json'), json.dumps(meta).encode('utf-8'))
+            except OSError:
+                pass
+
+    def stats(self) -> Dict:
+        with self._lock:
+            stats = dict(self._stats)
+            stats['entries'] = len(self._index)
+            stats['bytes'] = self._total_bytes
+            lookups = stats['hits'] + stats['stale'] + stats['misses']
+        stats['hit_ratio'] = round(stats['hits'] / lookups, 3) if lookups else 0.0
+        return stats
@@ -0,0 +1,237 @@
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, List, Optional
+
+import requests
+from bs4 import BeautifulSoup
+from fake_useragent import UserAgent
+from requests.adapters import HTTPAdapter
+
+from dom_extract import extract_cards_html
+from metrics import stage
+from tracing import bind
+from multi_platform import (
+    BaseScraper, CARD_SPECS, SEARCH_URLS, SEEN_INDEX,
+    builtin_card_job, careerbuilder_card_job, linkedin_card_job,
+)
+from rate_limit import HostRateLimiter
+from scraper import DEFAULT_RATE_LIMITER
+
+# Browser se pehle plain HTTP try karo (0 = hamesha Chrome)
+FAST_PATH = os.environ.get('HTTP_FAST_PATH', '1') == '1'
+HTTP_DETAIL_CONCURRENCY = int(os.environ.get('HTTP_DETAIL_CONCURRENCY', 4))
+
+# Bot wall: in statuses par ya challenge page mile to browser fallback
+CHALLENGE_STATUSES = (401, 403, 429, 503)
+CHALLENGE_MARKERS = ('cf-chl', 'challenge-platform', 'just a moment...', 'px-captcha', 'captcha-delivery',
+                     'authwall', 'access denied')
+
+
+class FastPathUnavailable(Exception):
+    """The board answered the listing request with a challenge, an error, no cards or no usable jobs."""
+
+    def __init__(self, reason: str):
+        super().__init__(reason)
+        self.reason = reason
+
+
+def _challenged(html: str) -> bool:
+    lowered = html[:200000].lower()
+    return any(marker in lowered for marker in CHALLENGE_MARKERS)
+
+
+# Saare fast-path scrapes ek hi keep-alive pool share karte hain
+_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+_ua: Optional[UserAgent] = None
+
+
+def _shared_session() -> requests.Session:
+    global _session
+    with _session_lock:
+        if _session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=16, pool_maxsize=max(HTTP_DETAIL_CONCURRENCY, 4))
+            session.mount('https://', adapter)
+            session.mount('http://', adapter)
+            _session = session
+        return _session
+
+
+def _user_agent() -> str:
+    global _ua
+    if _ua is None:
+        _ua = UserAgent()
+    return _ua.random
+
+
+class HttpJobScraper(BaseScraper):
+    """
+    Listing and detail pages over pooled HTTP for boards that render their
+    search results server-side. Cards are read with the same CARD_SPECS and
+    card -> job mappings as the Chrome scrapers. Raises FastPathUnavailable
+    before any job is emitted so the caller can fall back to the browser.
+    """
+
+    def __init__(self, on_progress=None, on_job=None, base_urls=None, seen_index=SEEN_INDEX,
+                 session: Optional[requests.Session] = None, rate_limiter: Optional[HostRateLimiter] = None,
+                 detail_concurrency: int = HTTP_DETAIL_CONCURRENCY, timeout: float = 15):
+        super().__init__(on_progress, on_job, base_urls, seen_index)
+        self.session = session or _shared_session()
+        self.rate_limiter = rate_limiter or DEFAULT_RATE_LIMITER
+        self.detail_concurrency = max(detail_concurrency, 1)
+        self.timeout = timeout
+
+    def _get_headers(self) -> Dict[str, str]:
+        return {
+            'User-Agent': _user_agent(),
+            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+            'Accept-Language': 'en-US,en;q=0.5',
+        }
+
+    def _get(self, url: str, platform_name: str, stage_name: str = 'fetch') -> str:
+        # Detail fetch worker threads mein current_platform nahi hota, isliye platform explicit
+        self.rate_limiter.acquire(url)
+        try:
+            with stage(stage_name, platform_name):
+                response = self.session.get(url, headers=self._get_headers(), timeout=self.timeout)
+        except requests.exceptions.RequestException as e:
+            raise FastPathUnavailable(f"request_error: {type(e).__name__}")
+        if response.status_code != 200:
+            kind = 'blocked' if response.status_code in CHALLENGE_STATUSES else 'http'
+            raise FastPathUnavailable(f"{kind}_{response.status_code}")
+        return response.text
+
+    def _cards(self, platform_name: str, url: str, limit: Optional[int]):
+        html = self._get(url, platform_name)
+        total, cards = extract_cards_html(html, CARD_SPECS[platform_name], url, limit)
+        if not total:
+            # JS-only page ya bot wall: Chrome hi dekh payega
+            raise FastPathUnavailable('challenge' if _challenged(html) else 'no_cards')
+        print(f"{platform_name} (http): Found {total} cards")
+        self._report(cards_found=total)
+        return cards
+
+    def _mapped(self, platform_name: str, cards, to_job) -> List[Dict]:
+        jobs = [job for job in (to_job(card) for card in cards) if job]
+        if not jobs:
+            # Cards mile par ek bhi job map nahi hui (markup badla?): kuch emit hone se pehle Chrome par jao
+            raise FastPathUnavailable('no_jobs')
+        return jobs
+
+    def _open_details(self, platform_name, jobs, extract):
+        # Detail pages parallel GET, jaise hi ek parse ho yield (Chrome tabs wala contract: extract(page, job))
+        def fetch(job):
+            try:
+                html = self._get(job['link'], platform_name, 'jd_fetch')
+            except FastPathUnavailable as e:
+                print(f"{platform_name} (http) detail skipped ({e.reason}): {job['link']}")
+                html = None
+            with stage('parse', platform_name):
+                page = BeautifulSoup(html, 'lxml') if html is not None else None
+                return extract(page, job) or {}
+
+        if not jobs:
+            return
+        with ThreadPoolExecutor(max_workers=min(self.detail_concurrency, len(jobs)),
+                                thread_name_prefix=f"{platform_name}-http") as executor:
+            futures = {executor.submit(bind(fetch), job): job for job in jobs if job.get('link')}
+            for job in jobs:
+                if not job.get('link'):
+                    yield job
+            for future in as_completed(futures):
+                job = futures[future]
+                try:
+                    job.update(future.result())
+                except Exception as e:
+                    print(f"{platform_name} (http) detail error: {e}")
+                yield job
+
+    # --- Platforms ---
+    def linkedin_scrape(self, keyword, location):
+        # Guest search page server-rendered hai (wahi .base-card markup)
+        cards = self._cards('linkedin', SEARCH_URLS['linkedin'](self.base_urls['linkedin'], keyword, location), 5)
+        jobs_data = []
+        for job in self._mapped('linkedin', cards, linkedin_card_job):
+            self._add_job(jobs_data, job)
+        return jobs_data
+
+    def builtin_scrape(self, keyword, location):
+        url = SEARCH_URLS['builtin'](self.base_urls['builtin'], keyword, location)
+        temp_jobs = self._mapped('builtin', self._cards('builtin', url, 5),
+                                 lambda card: builtin_card_job(card, location))
+
+        def extract_jd(page, job):
+            desc_el = page.select_one(".job-description") if page is not None else None
+            if desc_el is None:
+                return {"description_text": "Description container not found"}
+            return {"description_text": desc_el.get_text('\n', strip=True)}
+
+        jobs_data = []
+        try:
+            for job in self._fetch_details('builtin', temp_jobs, extract_jd):
+                self._add_job(jobs_data, {**job, "platform": "BuiltIn"})
+        except Exception as e:
+            # Jobs emit ho chuke hain, yahan raise kiya to browser fallback duplicates bhejega
+            print(f"BuiltIn (http) Error: {e}")
+        return jobs_data
+
+    def careerbuilder_scrape(self, keyword, location):
+        url = SEARCH_URLS['careerbuilder'](self.base_urls['careerbuilder'], keyword, location)
+        temp_jobs = self._mapped('careerbuilder', self._cards('careerbuilder', url, 5),
+                                 lambda card: careerbuilder_card_job(card, location))
+
+        def extract_jd(page, job):
+            desc_el = None
+            if page is not None:
+                desc_el = page.select_one("#job-description") or page.select_one(".jdp-description-details")
+            if desc_el is None:
+                return {"description_html": "Description not found", "description_text": "Description not found"}
+            return {
+                "description_html": desc_el.decode_contents(),
+                "description_text": desc_el.get_text('\n', strip=True)
+            }
+
+        jobs_data = []
+        try:
+            for job in self._fetch_details('careerbuilder', temp_jobs, extract_jd):
+                self._add_job(jobs_data, {**job, "platform": "CareerBuilder"})
+        except Exception as e:
+            print(f"CareerBuilder (http) Error: {e}")
+        return jobs_data
+
+
+class FastPathStats:
+    """Per platform: scrapes served over HTTP vs Chrome, and why the fast path fell back."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._platforms: Dict[str, Dict] = {}
+
+    def record(self, platform: str, served_by: str, seconds: float, fallback: Optional[str] = None):
+        with self._lock:
+            entry = self._platforms.setdefault(platform, {
+                'http': 0, 'browser': 0, 'http_seconds_total': 0.0, 'browser_seconds_total': 0.0, 'fallbacks': {},
+            })
+            entry[served_by] += 1
+            entry[f'{served_by}_seconds_total'] += seconds
+            if fallback:
+                entry['fallbacks'][fallback] = entry['fallbacks'].get(fallback, 0) + 1
+
+    def snapshot(self) -> Dict:
+        with self._lock:
+            report = {}
+            for platform, entry in self._platforms.items():
+                report[platform] = {
+                    'http': entry['http'],
+                    'browser': entry['browser'],
+                    'avg_http_seconds': round(entry['http_seconds_total'] / entry['http'], 3) if entry['http'] else None,
+                    'avg_browser_seconds': (round(entry['browser_seconds_total'] / entry['browser'], 3)
+                                            if entry['browser'] else None),
+                    'fallbacks': dict(entry['fallbacks']),
+                }
+            return report
+
+
+fast_path_stats = FastPathStats()
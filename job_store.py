@@ -0,0 +1,239 @@
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from lxml import html as lxml_html
+
+from recency import posted_day
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+JOB_STORE_DB = os.environ.get('JOB_STORE_DB', os.path.join(BASE_DIR, 'jobs.db'))
+
+# Har platform alag key naam use karta hai (Dice capitalized, LinkedIn apply_link/posted_date, ...)
+FIELD_ALIASES = {
+    'title': ('title', 'Title'),
+    'company': ('company', 'Company'),
+    'location': ('location', 'Location'),
+    'posted': ('date', 'posted_at', 'posted_date', 'Date'),
+    'link': ('link', 'apply_link', 'Link'),
+    # Plain text pehle, warna HTML (FTS ke liye tags strip hote hain)
+    'description': ('description_text', 'description', 'description_html'),
+}
+
+SORTS = ('date', 'relevance')
+
+_WORD = re.compile(r'\w+', re.UNICODE)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id               INTEGER PRIMARY KEY,
+    platform         TEXT NOT NULL,
+    job_key          TEXT NOT NULL,
+    title            TEXT NOT NULL,
+    company          TEXT,
+    location         TEXT,
+    posted_on        TEXT,
+    link             TEXT,
+    description      TEXT,
+    description_text TEXT,
+    source           TEXT,
+    first_seen       REAL NOT NULL,
+    last_seen        REAL NOT NULL,
+    raw              TEXT NOT NULL,
+    UNIQUE (platform, job_key)
+);
+CREATE INDEX IF NOT EXISTS jobs_posted ON jobs (posted_on DESC, last_seen DESC);
+CREATE INDEX IF NOT EXISTS jobs_platform_posted ON jobs (platform, posted_on DESC);
+
+CREATE VIRTUAL TABLE IF NOT EXISTS jobs_fts USING fts5(
+    title, description_text, content='jobs', content_rowid='id', tokenize='porter unicode61'
+);
+CREATE TRIGGER IF NOT EXISTS jobs_ai AFTER INSERT ON jobs BEGIN
+    INSERT INTO jobs_fts (rowid, title, description_text) VALUES (new.id, new.title, new.description_text);
+END;
+CREATE TRIGGER IF NOT EXISTS jobs_ad AFTER DELETE ON jobs BEGIN
+    INSERT INTO jobs_fts (jobs_fts, rowid, title, description_text) VALUES ('delete', old.id, old.title, old.description_text);
+END;
+CREATE TRIGGER IF NOT EXISTS jobs_au AFTER UPDATE OF title, description_text ON jobs BEGIN
+    INSERT INTO jobs_fts (jobs_fts, rowid, title, description_text) VALUES ('delete', old.id, old.title, old.description_text);
+    INSERT INTO jobs_fts (rowid, title, description_text) VALUES (new.id, new.title, new.description_text);
+END;
+"""
+
+
+def job_field(job: Dict, name: str) -> str:
+    """First non-empty value among the platform-specific keys for `name` (see FIELD_ALIASES)."""
+    for key in FIELD_ALIASES[name]:
+        value = job.get(key)
+        if isinstance(value, str) and value.strip():
+            return value.strip()
+    return ''
+
+
+def _plain_text(description: str) -> str:
+    if '<' not in description:
+        return description
+    try:
+        return ' '.join(lxml_html.fromstring(description).text_content().split())
+    except (ValueError, lxml_html.etree.ParserError):
+        return description
+
+
+def _fts_query(text: str) -> str:
+    # User input FTS syntax na tode: har word quoted, aakhri word prefix match
+    words = _WORD.findall(text)
+    if not words:
+        return ''
+    return ' '.join(f'"{w}"' for w in words[:-1]) + (' ' if len(words) > 1 else '') + f'"{words[-1]}"*'
+
+
+def normalize(platform: str, source: str, job: Dict, seen_at: datetime) -> Optional[Dict]:
+    """Maps one scraper job dict onto the store schema (None if it has no title)."""
+    title = job_field(job, 'title')
+    if not title:
+        return None
+    company = job_field(job, 'company')
+    location = job_field(job, 'location')
+    link = job_field(job, 'link')
+    description = job_field(job, 'description')
+    if link.startswith('http'):
+        key = link
+    else:
+        key = hashlib.sha1(f"{title}\x1f{company}\x1f{location}".lower().encode('utf-8')).hexdigest()
+    return {
+        'platform': platform,
+        'job_key': key,
+        'title': title,
+        'company': company,
+        'location': location,
+        'posted_on': posted_day(job_field(job, 'posted'), seen_at),
+        'link': link,
+        'description': description,
+        'description_text': _plain_text(description),
+        'source': source,
+        'raw': json.dumps(job, default=str),
+    }
+
+
+class JobStore:
+    """
+    SQLite store of every scraped job in one schema across platforms, with
+    an FTS5 index over titles and descriptions for the /jobs query route.
+    """
+
+    def __init__(self, path: str = JOB_STORE_DB):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._stats = {'ingests': 0, 'jobs_ingested': 0, 'queries': 0, 'query_seconds_total': 0.0}
+
+    def _db(self) -> sqlite3.Connection:
+        if self._conn is None:
+            conn = sqlite3.connect(self.path, check_same_thread=False)
+            conn.row_factory = sqlite3.Row
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            conn.executescript(SCHEMA)
+            self._conn = conn
+        return self._conn
+
+    def ingest(self, platform: str, source: str, jobs: Iterable[Dict]) -> int:
+        """Upserts a scrape's jobs; known jobs keep first_seen and an earlier description if the new one is empty."""
+        now = time.time()
+        seen_at = datetime.fromtimestamp(now)
+        rows = [row for row in (normalize(platform, source, job, seen_at) for job in jobs) if row]
+        if not rows:
+            return 0
+        with self._lock:
+            db = self._db()
+            with db:
+                db.executemany("""
+                    INSERT INTO jobs (platform, job_key, title, company, location, posted_on, link,
+                                      description, description_text, source, first_seen, last_seen, raw)
+                    VALUES (:platform, :job_key, :title, :company, :location, :posted_on, :link,
+                            :description, :description_text, :source, :now, :now, :raw)
+                    ON CONFLICT (platform, job_key) DO UPDATE SET
+                        title = excluded.title,
+                        company = excluded.company,
+                        location = excluded.location,
+                        posted_on = COALESCE(jobs.posted_on, excluded.posted_on),
+                        link = excluded.link,
+                        description = COALESCE(NULLIF(excluded.description, ''), jobs.description),
+                        description_text = COALESCE(NULLIF(excluded.description_text, ''), jobs.description_text),
+                        last_seen = excluded.last_seen,
+                        raw = excluded.raw
+                """, [{**row, 'now': now} for row in rows])
+            self._stats['ingests'] += 1
+            self._stats['jobs_ingested'] += len(rows)
+        return len(rows)
+
+    def query(self, keyword: str = '', location: str = '', platforms: Optional[List[str]] = None,
+              days: Optional[int] = None, page: int = 1, per_page: int = 20,
+              sort: str = 'date') -> Tuple[int, List[Dict]]:
+        """Returns (total matches, jobs on this page)."""
+        start = time.perf_counter()
+        where, params = [], []
+        match = _fts_query(keyword)
+        if match:
+            where.append("jobs.id IN (SELECT rowid FROM jobs_fts WHERE jobs_fts MATCH ?)")
+            params.append(match)
+        if location:
+            where.append("jobs.location LIKE ?")
+            params.append(f"%{location}%")
+        if platforms:
+            where.append(f"jobs.platform IN ({','.join('?' * len(platforms))})")
+            params.extend(platforms)
+        if days:
+            # Posting date na pata ho to pehli baar dekhe jaane ka din
+            where.append("COALESCE(jobs.posted_on, date(jobs.first_seen, 'unixepoch', 'localtime')) >= ?")
+            params.append((datetime.now() - timedelta(days=days)).strftime('%Y-%m-%d'))
+        clause = f"WHERE {' AND '.join(where)}" if where else ''
+
+        if sort == 'relevance' and match:
+            # bm25: chhota = zyada relevant
+            sql = (f"SELECT jobs.* FROM jobs JOIN jobs_fts ON jobs_fts.rowid = jobs.id AND jobs_fts MATCH ? "
+                   f"{clause} ORDER BY bm25(jobs_fts) LIMIT ? OFFSET ?")
+            page_params = [match, *params]
+        else:
+            sql = (f"SELECT jobs.* FROM jobs {clause} "
+                   f"ORDER BY jobs.posted_on IS NULL, jobs.posted_on DESC, jobs.last_seen DESC LIMIT ? OFFSET ?")
+            page_params = list(params)
+
+        with self._lock:
+            db = self._db()
+            total = db.execute(f"SELECT COUNT(*) FROM jobs {clause}", params).fetchone()[0]
+            rows = db.execute(sql, [*page_params, per_page, (page - 1) * per_page]).fetchall()
+            self._stats['queries'] += 1
+            self._stats['query_seconds_total'] += time.perf_counter() - start
+        return total, [self._row_to_job(row) for row in rows]
+
+    @staticmethod
+    def _row_to_job(row: sqlite3.Row) -> Dict:
+        return {
+            'title': row['title'],
+            'company': row['company'],
+            'location': row['location'],
+            'posted_on': row['posted_on'],
+            'link': row['link'],
+            'description': row['description'],
+            'platform': row['source'],
+            'platform_key': row['platform'],
+            'first_seen': datetime.fromtimestamp(row['first_seen']).isoformat(timespec='seconds'),
+            'last_seen': datetime.fromtimestamp(row['last_seen']).isoformat(timespec='seconds'),
+        }
+
+    def stats(self) -> Dict:
+        with self._lock:
+            stats = dict(self._stats)
+        stats['avg_query_ms'] = round(stats['query_seconds_total'] * 1000 / stats['queries'], 3) if stats['queries'] else 0.0
+        stats['query_seconds_total'] = round(stats['query_seconds_total'], 3)
+        return stats
+
+
+job_store = JobStore()
@@ -0,0 +1,164 @@
+import os
+import threading
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+
+class LaunchMode(NamedTuple):
+    """How Chrome is started. headless uses uc's headless=new handling (UA and navigator patches)."""
+    headless: bool = False
+    window_size: Tuple[int, int] = (1920, 1080)
+    maximized: bool = True
+    args: Tuple[str, ...] = ()
+
+
+# Background services jo scraping mein kaam nahi aate (network, CPU aur RSS bachate hain)
+LEAN_ARGS = (
+    '--disable-background-networking',
+    '--disable-sync',
+    '--disable-extensions',
+    '--disable-component-update',
+    '--disable-default-apps',
+    '--disable-domain-reliability',
+    '--disable-client-side-phishing-detection',
+    '--disable-features=Translate,OptimizationHints,MediaRouter',
+    '--no-first-run',
+    '--no-default-browser-check',
+    '--metrics-recording-only',
+    '--mute-audio',
+)
+
+LAUNCH_MODES: Dict[str, LaunchMode] = {
+    # Pehle jaisa: visible window, Linux par Xvfb chahiye
+    'full': LaunchMode(),
+    'headless': LaunchMode(headless=True, maximized=False),
+    'lean': LaunchMode(headless=True, window_size=(1366, 768), maximized=False, args=LEAN_ARGS),
+}
+
+DEFAULT_LAUNCH_MODE = 'full'
+
+
+# --- /proc se process tree aur RSS (Linux only, baaki jagah None) ---
+def children_map() -> Dict[int, List[int]]:
+    children: Dict[int, List[int]] = {}
+    for name in os.listdir('/proc'):
+        if not name.isdigit():
+            continue
+        try:
+            with open(f'/proc/{name}/stat', 'rb') as f:
+                stat = f.read()
+        except OSError:
+            continue
+        # comm mein spaces/brackets ho sakte hain, isliye aakhri ')' ke baad parse
+        fields = stat[stat.rfind(b')') + 2:].split()
+        children.setdefault(int(fields[1]), []).append(int(name))
+    return children
+
+
+def process_tree(pid: int, children: Optional[Dict[int, List[int]]] = None) -> List[int]:
+    """pid plus all its descendants (pass children=children_map() to reuse one /proc scan)."""
+    if not os.path.isdir('/proc'):
+        return [pid]
+    if children is None:
+        children = children_map()
+    tree, stack = [], [pid]
+    while stack:
+        current = stack.pop()
+        tree.append(current)
+        stack.extend(children.get(current, ()))
+    return tree
+
+
+def rss_bytes(pids: List[int]) -> Optional[int]:
+    """Sum of VmRSS over pids (shared pages are counted once per process)."""
+    total, found = 0, False
+    for pid in pids:
+        try:
+            with open(f'/proc/{pid}/status') as f:
+                for line in f:
+                    if line.startswith('VmRSS:'):
+                        total += int(line.split()[1]) * 1024
+                        found = True
+                        break
+        except OSError:
+            continue
+    return total if found else None
+
+
+def driver_pids(driver) -> List[int]:
+    """Root pids of a driver: chromedriver and the browser it controls."""
+    roots = []
+    service = getattr(driver, 'service', None)
+    process = getattr(service, 'process', None)
+    if getattr(process, 'pid', None):
+        roots.append(process.pid)
+    if getattr(driver, 'browser_pid', None):
+        roots.append(driver.browser_pid)
+    return roots
+
+
+def driver_rss(driver) -> Optional[int]:
+    if not os.path.isdir('/proc'):
+        return None
+    pids = []
+    for root in driver_pids(driver):
+        pids.extend(p for p in process_tree(root) if p not in pids)
+    return rss_bytes(pids) if pids else None
+
+
+class LaunchStats:
+    """Startup latency and browser RSS per launch mode, for /health."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._modes: Dict[str, Dict] = {}
+
+    def _entry(self, mode: str) -> Dict:
+        return self._modes.setdefault(mode, {
+            'launches': 0, 'failures': 0, 'startup_seconds_total': 0.0, 'startup_seconds_max': 0.0,
+            'last_startup_seconds': 0.0, 'launch_rss': [], 'scrape_rss': [],
+        })
+
+    def record_launch(self, mode: str, seconds: float, rss: Optional[int]):
+        with self._lock:
+            entry = self._entry(mode)
+            entry['launches'] += 1
+            entry['startup_seconds_total'] += seconds
+            entry['startup_seconds_max'] = max(entry['startup_seconds_max'], seconds)
+            entry['last_startup_seconds'] = seconds
+            if rss is not None:
+                entry['launch_rss'] = (entry['launch_rss'] + [rss])[-100:]
+
+    def record_failure(self, mode: str):
+        with self._lock:
+            self._entry(mode)['failures'] += 1
+
+    def record_scrape_rss(self, mode: str, rss: Optional[int]):
+        # Page load ke baad renderers bhi chal rahe hote hain, launch RSS se zyada realistic
+        if rss is None:
+            return
+        with self._lock:
+            entry = self._entry(mode)
+            entry['scrape_rss'] = (entry['scrape_rss'] + [rss])[-100:]
+
+    def snapshot(self) -> Dict:
+        def mb(samples, fn):
+            return round(fn(samples) / (1024 * 1024), 1) if samples else None
+
+        with self._lock:
+            report = {}
+            for mode, entry in self._modes.items():
+                launches = entry['launches']
+                report[mode] = {
+                    'launches': launches,
+                    'failures': entry['failures'],
+                    'avg_startup_seconds': round(entry['startup_seconds_total'] / launches, 3) if launches else 0.0,
+                    'max_startup_seconds': round(entry['startup_seconds_max'], 3),
+                    'last_startup_seconds': round(entry['last_startup_seconds'], 3),
+                    'avg_launch_rss_mb': mb(entry['launch_rss'], lambda s: sum(s) / len(s)),
+                    'avg_scrape_rss_mb': mb(entry['scrape_rss'], lambda s: sum(s) / len(s)),
+                    'max_scrape_rss_mb': mb(entry['scrape_rss'], max),
+                }
+            return report
+
+
+launch_stats = LaunchStats()
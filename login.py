@@ -1,11 +1,11 @@
 import undetected_chromedriver as uc
 import os
 import time
+from profile_manager import profiles
 
 def create_job_profile():
-    # 1. Path setup (Usi folder mein jahan script hai)
-    base_dir = os.path.dirname(os.path.abspath(__file__))
-    profile_path = os.path.join(base_dir, "chrome_profile")
+    # 1. Path setup: 'login' template, scraper har run mein iska clone use karta hai
+    profile_path = profiles.template_path('login')
     
     if not os.path.exists(profile_path):
         os.makedirs(profile_path)
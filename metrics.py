@@ -0,0 +1,172 @@
+import bisect
+import math
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Iterable, Iterator, List, Sequence, Tuple
+
+from tracing import current_trace
+
+# run_scrape set karta hai; stages isi platform ke label ke saath record hote hain
+current_platform: ContextVar[str] = ContextVar('current_platform', default='none')
+# Khule hue stages ka stack: andar wale stage ka time bahar wale se minus (har second ek hi stage mein)
+_open_stages: ContextVar[Tuple[List[float], ...]] = ContextVar('open_stages', default=())
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 20, 30, 60, 120, 300)
+
+
+def _escape(value) -> str:
+    return str(value).replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+
+def _number(value: float) -> str:
+    if value == math.inf:
+        return '+Inf'
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+def _label_text(pairs: Sequence[Tuple[str, str]]) -> str:
+    return '{' + ','.join(f'{k}="{_escape(v)}"' for k, v in pairs) + '}' if pairs else ''
+
+
+class _Metric:
+    kind = ''
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+        self._values: Dict[Tuple[str, ...], object] = {}
+
+    def _key(self, labels: Dict) -> Tuple[str, ...]:
+        return tuple(str(labels.get(name, '')) for name in self.labelnames)
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {_escape(self.documentation)}", f"# TYPE {self.name} {self.kind}"]
+        with self._lock:
+            items = sorted(self._values.items())
+            lines.extend(self._samples(items))
+        return lines
+
+    def _samples(self, items) -> List[str]:
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    kind = 'counter'
+
+    def inc(self, amount: float = 1, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def _samples(self, items):
+        return [f"{self.name}{_label_text(list(zip(self.labelnames, key)))} {_number(value)}" for key, value in items]
+
+
+class Histogram(_Metric):
+    kind = 'histogram'
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                 buckets: Sequence[float] = DEFAULT_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value: float, **labels):
+        key = self._key(labels)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            entry = self._values.get(key)
+            if entry is None:
+                # [per-bucket counts (+Inf aakhri), sum, count]
+                entry = self._values[key] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            entry[0][index] += 1
+            entry[1] += value
+            entry[2] += 1
+
+    def _samples(self, items):
+        lines = []
+        for key, (counts, total, count) in items:
+            pairs = list(zip(self.labelnames, key))
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets + (math.inf,), counts):
+                cumulative += bucket_count
+                lines.append(f"{self.name}_bucket{_label_text(pairs + [('le', _number(bound))])} {cumulative}")
+            lines.append(f"{self.name}_sum{_label_text(pairs)} {_number(total)}")
+            lines.append(f"{self.name}_count{_label_text(pairs)} {count}")
+        return lines
+
+
+class Registry:
+    def __init__(self):
+        self._metrics: List[_Metric] = []
+
+    def register(self, metric: _Metric) -> _Metric:
+        self._metrics.append(metric)
+        return metric
+
+    def render(self) -> str:
+        lines = []
+        for metric in self._metrics:
+            lines.extend(metric.render())
+        return '\n'.join(lines) + '\n'
+
+
+REGISTRY = Registry()
+
+STAGE_SECONDS = REGISTRY.register(Histogram(
+    'scraper_stage_seconds',
+    'Wall time per scrape stage (self time: nested stages are not counted twice)',
+    ('platform', 'stage'),
+))
+SCRAPE_SECONDS = REGISTRY.register(Histogram(
+    'scraper_scrape_seconds', 'Wall time of one platform scrape', ('platform', 'served_by'),
+))
+SCRAPES_TOTAL = REGISTRY.register(Counter(
+    'scraper_scrapes_total', 'Platform scrapes by outcome (ok, empty, error)', ('platform', 'served_by', 'outcome'),
+))
+JOBS_TOTAL = REGISTRY.register(Counter('scraper_jobs_total', 'Jobs returned by scrapes', ('platform',)))
+COALESCED_TOTAL = REGISTRY.register(Counter(
+    'scraper_coalesced_requests_total', 'Requests served by joining an identical in-flight scrape', ('platform',),
+))
+BROWSER_LAUNCHES_SAVED_TOTAL = REGISTRY.register(Counter(
+    'scraper_browser_launches_saved_total', 'Chrome scrapes avoided by single-flight coalescing', ('platform',),
+))
+REQUEST_SECONDS = REGISTRY.register(Histogram(
+    'scraper_http_request_seconds', 'Flask request latency', ('endpoint', 'method', 'status'),
+))
+
+
+@contextmanager
+def stage(name: str, platform: str = None):
+    """Times the block into scraper_stage_seconds{platform, stage} (and the active trace, if any)."""
+    child_time = [0.0]
+    token = _open_stages.set(_open_stages.get() + (child_time,))
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        end = time.perf_counter()
+        elapsed = end - start
+        _open_stages.reset(token)
+        parents = _open_stages.get()
+        if parents:
+            parents[-1][0] += elapsed
+        label = platform or current_platform.get()
+        STAGE_SECONDS.observe(max(elapsed - child_time[0], 0.0), platform=label, stage=name)
+        trace = current_trace.get()
+        if trace is not None:
+            trace.add(name, 'stage', start, end, {'platform': label})
+
+
+def per_item(items: Iterable, name: str, platform: str = None) -> Iterator:
+    """Yields items and times the caller's loop body for each one as stage `name`."""
+    for item in items:
+        with stage(name, platform):
+            yield item
+
+
+def render() -> str:
+    return REGISTRY.render()
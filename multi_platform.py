@@ -6,230 +6,670 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.keys import Keys
 import time
 import random
-from datetime import datetime, timedelta
+from datetime import datetime
 import re
 import os
-import subprocess
 import platform
 import json
 import urllib.parse
-import tempfile
-
-class JobScraper:
-    def __init__(self,user_profile=False):
-        # 1. Process Cleanup (Render ke liye zaroori)
+from detail_fetch import iter_details
+from dom_extract import CardSpec, Field, extract_cards
+from launch_modes import DEFAULT_LAUNCH_MODE, LAUNCH_MODES, driver_rss, launch_stats
+from profile_manager import profiles
+from driver_lifecycle import SCRAPE_DEADLINE, lifecycle
+from seen_jobs import fingerprint, seen_jobs
+from net_block import BlockProfile, apply_blocking, block_stats, clear_blocking, read_network_log
+from waits import Readiness, SelectorPresent, ContentChanged, DomStable, NetworkIdle, wait_until
+from recency import RecencyWindow, posted_day, recency_stats
+from metrics import per_item, stage as timed_stage
+from tracing import instrument_driver, span
+
+# Scrapers yahin se URL banate hain (benchmarks local fixture server ke liye override karte hain)
+BASE_URLS = {
+    'linkedin': "https://www.linkedin.com",
+    'hiringcafe': "https://hiring.cafe",
+    'dice': "https://www.dice.com",
+    'ziprecruiter': "https://www.ziprecruiter.com",
+    'indeed': "https://www.indeed.com",
+    'glassdoor': "https://www.glassdoor.com",
+    'simplyhired': "https://www.simplyhired.com",
+    'builtin': "https://builtin.com",
+    'careerbuilder': "https://www.careerbuilder.com",
+}
+
+PLATFORM_ORIGINS = tuple(BASE_URLS.values())
+
+# --- JD DETAIL FETCH (parallel tabs) ---
+DETAIL_CONCURRENCY = int(os.environ.get('DETAIL_CONCURRENCY', 4))
+DETAIL_PER_HOST = int(os.environ.get('DETAIL_PER_HOST', 3))
+
+# --- SEEN-JOBS INDEX (pehle fetch hui JDs dobara nahi kholte) ---
+SEEN_INDEX = seen_jobs if os.environ.get('SEEN_JOBS', '1') == '1' else None
+
+# extract_jd ke failure placeholders, ye index mein save nahi hote
+JD_PLACEHOLDERS = {"Description could not be loaded", "Description container not found", "Description not found"}
+
+
+def _query_param(link, name):
+    return urllib.parse.parse_qs(urllib.parse.urlsplit(link or '').query).get(name, [''])[0]
+
+
+def _bare_link(link):
+    # Tracking params hata ke link hi id ("Link Not Found" jaise values par index skip)
+    return link.split('#')[0].split('?')[0] if link and link.startswith('http') else ''
+
+
+# Detail page ka stable job id per platform ('' = is job ke liye index skip)
+JOB_IDS = {
+    'hiringcafe': lambda job: job['link'].split('/viewjob/')[-1].split('?')[0] if '/viewjob/' in job['link'] else '',
+    'indeed': lambda job: _query_param(job['link'], 'jk'),
+    'ziprecruiter': lambda job: _query_param(job['link'], 'lk'),
+    'glassdoor': lambda job: _query_param(job['link'], 'jl') or _bare_link(job['link']),
+}
+
+# --- LAUNCH PROFILE (har platform ka sabse sasta mode jo site abhi bhi accept karti hai) ---
+# Cloudflare wale boards (Indeed family, ZipRecruiter, Glassdoor) headless pakad lete hain
+LAUNCH_PROFILE = {
+    'linkedin': 'lean',
+    # Location modal (11th .w-full) desktop layout par depend karta hai, window chhoti nahi
+    'hiringcafe': 'headless',
+    'dice': 'lean',
+    'ziprecruiter': 'full',
+    'indeed': 'full',
+    'glassdoor': 'full',
+    'simplyhired': 'full',
+    'builtin': 'lean',
+    'careerbuilder': 'lean',
+}
+
+
+def launch_mode_for(platform_name):
+    # LAUNCH_MODE_<PLATFORM> > LAUNCH_MODE > table
+    mode = (os.environ.get(f'LAUNCH_MODE_{platform_name.upper()}') or os.environ.get('LAUNCH_MODE')
+            or LAUNCH_PROFILE.get(platform_name, DEFAULT_LAUNCH_MODE))
+    if mode not in LAUNCH_MODES:
+        raise ValueError(f"Unknown launch mode '{mode}' for {platform_name} (expected one of: {', '.join(LAUNCH_MODES)})")
+    return mode
+
+# --- NETWORK BLOCKING (CDP Network.setBlockedURLs) ---
+# Default: images, fonts, CSS, media, analytics, ads sab block; jo site bina CSS ke toot ti hai use allow
+NET_BLOCKING = os.environ.get('NET_BLOCKING', '1') == '1'
+BLOCK_PROFILES = {
+    'linkedin': BlockProfile(),
+    # Location modal (11th .w-full) aur card text lines layout par depend karte hain
+    'hiringcafe': BlockProfile(block=('image', 'font', 'media', 'analytics', 'ads')),
+    'dice': BlockProfile(),
+    'ziprecruiter': BlockProfile(),
+    'indeed': BlockProfile(),
+    # card.text ko '\n' se split karte hain, CSS ke bina lines badal jaati hain
+    'glassdoor': BlockProfile(block=('image', 'font', 'media', 'analytics', 'ads')),
+    'simplyhired': BlockProfile(),
+    'builtin': BlockProfile(),
+    'careerbuilder': BlockProfile(),
+}
+
+# --- READINESS DECLARATIONS (fixed sleep ki jagah) ---
+# ceiling = purana sleep, condition hold hote hi wait khatam ho jata hai
+READINESS = {
+    'linkedin': {
+        'search': Readiness(5, [SelectorPresent(".base-card", ".job-search-card")]),
+        'scroll': Readiness(2, [DomStable(500)]),
+    },
+    'hiringcafe': {
+        'search': Readiness(5, [SelectorPresent("input[type='text']")]),
+        'modal': Readiness(2, [SelectorPresent("#react-select-multi_location_selector-input")]),
+        'suggestions': Readiness(2, [DomStable(300)]),
+        'results': Readiness(2, [DomStable(500)]),
+        'scroll': Readiness(3, [DomStable(500)]),
+        'detail': Readiness(5, [SelectorPresent("main"), NetworkIdle(500)], require_all=True),
+    },
+    'dice': {
+        'search': Readiness(5, [SelectorPresent("[data-testid='job-card']", "div[data-testid='search-result-card']", "dhi-js-search-result-card")]),
+        'scroll': Readiness(1, [DomStable(300)]),
+    },
+    'ziprecruiter': {
+        'search': Readiness(8, [SelectorPresent("article.job_result", "article[id^='job-card-']")]),
+        'detail': Readiness(5, [SelectorPresent("[data-testid='job-details-scroll-container']", ".job_description")]),
+    },
+    'indeed': {
+        'search': Readiness(15, [SelectorPresent("div.job_seen_beacon", "td.resultContent")]),
+        'detail': Readiness(5, [SelectorPresent(".jobsearch-ViewJobLayout-jobDisplay", ".jobsearch-ViewJobLayout-content", "#jobDescriptionText")]),
+    },
+    'glassdoor': {
+        'search': Readiness(12, [SelectorPresent(".jobCard")]),
+        'panel': Readiness(4, [DomStable(500)]),
+        'detail': Readiness(5, [SelectorPresent(".JobDetails_jobDescription__uW_fK", "[class*='JobDetails_jobDescription']")]),
+    },
+    'simplyhired': {
+        'search': Readiness(8, [SelectorPresent("[data-testid='searchSerpJobTitle']")]),
+        'panel': Readiness(4, [SelectorPresent("div[data-testid='viewJobBodyJobFullDescriptionContent']")]),
+    },
+    'builtin': {
+        'search': Readiness(8, [SelectorPresent("div[data-id='job-card']", ".job-bounded-responsive")]),
+        'detail': Readiness(5, [SelectorPresent(".job-description")]),
+    },
+    'careerbuilder': {
+        'search': Readiness(6, [SelectorPresent(".job-listing-item", "li.item")]),
+        'detail': Readiness(5, [SelectorPresent("#job-description", ".jdp-description-details")]),
+    },
+}
+
+# Hiring.cafe: card = /viewjob/ link ka teesra parent; href + text ek execute_script mein
+_HIRINGCAFE_CARDS_JS = """
+return Array.prototype.map.call(document.querySelectorAll("a[href*='/viewjob/']"), function (a) {
+    var card = a.parentElement && a.parentElement.parentElement && a.parentElement.parentElement.parentElement;
+    return [a.href, card ? card.innerText : ''];
+});
+"""
+HIRINGCAFE_DAYS = 14
+HIRINGCAFE_JD_LIMIT = 5
+
+# --- CARD FIELD DECLARATIONS (ek execute_script mein saare cards, fallback chains browser mein) ---
+CARD_SPECS = {
+    'linkedin': CardSpec(
+        cards=(".base-card, .job-search-card",),
+        fields={
+            'title': Field((".base-search-card__title",)),
+            'company': Field((".base-search-card__subtitle",)),
+            'date': Field(("time", ".job-search-card__listdate")),
+            'link': Field(("a",), 'href'),
+        },
+    ),
+    'dice': CardSpec(
+        cards=("[data-testid='job-card']", "div[data-testid='search-result-card']", "dhi-js-search-result-card",
+               "div.card", "article", "[class*='card']"),
+        fields={
+            'title': Field(("[data-testid='job-search-job-detail-link']",)),
+            # Link kabhi child pe hota hai, kabhi card khud anchor hai
+            'link': Field(("[data-testid='job-search-job-card-link']", ""), 'href'),
+            'meta': Field(("p.text-sm.font-normal.text-zinc-600",), many=True),
+        },
+    ),
+    'ziprecruiter': CardSpec(
+        cards=("article.job_result, article[id^='job-card-']",),
+        fields={
+            'id': Field(("",), 'id'),
+            'aria_title': Field(("h2[aria-label]",), 'aria-label'),
+            'title': Field(("h2",)),
+            'company': Field(("[data-testid='job-card-company']",)),
+            'location': Field(("[data-testid='job-card-location']",)),
+        },
+    ),
+    'indeed': CardSpec(
+        cards=("div.job_seen_beacon, td.resultContent",),
+        fields={
+            'jk': Field(("a[data-jk]",), 'data-jk'),
+            'span_title': Field(("h2.jobTitle span[title]",), 'title'),
+            'title': Field(("h2.jobTitle",)),
+            'company': Field(("[data-testid='company-name']",)),
+            'location': Field(("[data-testid='text-location']",)),
+        },
+    ),
+    'simplyhired': CardSpec(
+        cards=("[data-testid='searchSerpJobTitle']",),
+        closest="li",
+        fields={
+            'title_el': Field(("[data-testid='searchSerpJobTitle'] a",), 'element'),
+            'title': Field(("[data-testid='searchSerpJobTitle'] a",)),
+            'link': Field(("[data-testid='searchSerpJobTitle'] a",), 'href'),
+            'company': Field(("[data-testid='companyName']",)),
+            'location': Field(("[data-testid='searchSerpJobLocation']",)),
+            'date': Field(("[data-testid='searchSerpJobDateStamp']",)),
+            'text': Field(("",)),
+        },
+    ),
+    'builtin': CardSpec(
+        cards=("div[data-id='job-card']", ".job-bounded-responsive"),
+        fields={
+            'title': Field(("a[data-id='job-card-title']",)),
+            'link': Field(("a[data-id='job-card-title']",), 'href'),
+            'company': Field(("a[data-id='company-title']",)),
+            'locations': Field(("span.font-barlow",), many=True),
+            'date': Field(("span.bg-gray-01",)),
+        },
+    ),
+    'careerbuilder': CardSpec(
+        cards=(".job-listing-item", "li.item"),
+        fields={
+            'title': Field(("h2.job-title a",)),
+            'link': Field(("h2.job-title a",), 'href'),
+            'company': Field((".company-name",)),
+            'location': Field((".job-location",)),
+            'date': Field((".job-post-date",)),
+        },
+    ),
+}
+
+
+def launch_driver(user_profile=False, mode=DEFAULT_LAUNCH_MODE):
+    """
+    Starts Chrome in the given launch mode (see LAUNCH_MODES) and records
+    its startup latency and RSS in launch_stats.
+    """
+    launch_mode = LAUNCH_MODES[mode]
+    start = time.perf_counter()
+    # 🔥 login.py wala saved profile ya ❄️ pre-initialized fresh profile, dono ka per-run clone
+    # (ek saath kai sessions, aur Chrome ko har baar naya profile setup nahi karna padta)
+    profile_path = profiles.clone('login' if user_profile else 'fresh')
+    try:
+        with timed_stage('driver_launch'):
+            driver = _start_chrome(launch_mode, profile_path, user_profile)
+    except Exception:
+        profiles.release(profile_path)
+        launch_stats.record_failure(mode)
+        raise
+    # user-data-dir arg se aaya to uc ise rakh leta hai; clone hai, quit() par delete karo
+    driver.keep_user_data_dir = False
+    # Is driver ka apna process tree (cleanup sirf isi ka, doosre scrapes ka nahi)
+    lifecycle.register(driver)
+    launch_stats.record_launch(mode, time.perf_counter() - start, driver_rss(driver))
+    return driver
+
+
+def _seed_profile(path):
+    # Ek baar Chrome chala ke profile initialize karo (First Run, Local State, Default/...)
+    driver = _start_chrome(LAUNCH_MODES['lean'], path, False)
+    browser_pid = getattr(driver, 'browser_pid', None)
+    try:
+        driver.get("about:blank")
+    finally:
+        driver.quit()
+    # quit() sirf SIGTERM bhejta hai, profile flush hone tak ruko
+    deadline = time.monotonic() + 10
+    while browser_pid and time.monotonic() < deadline:
         try:
-            subprocess.run(['pkill', '-f', 'chrome'], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
-        except:
-            pass
-       
-
-        options = uc.ChromeOptions()
-        options.page_load_strategy = 'eager'
-        if user_profile:
-            # 🔥 Wahi saved profile use karna
-            # 2. PORTABLE PROFILE PATH SETUP (Current Directory)
-            base_dir = os.path.dirname(os.path.abspath(__file__))
-            profile_path = os.path.join(base_dir, "chrome_profile")
-            options.add_argument(f"--user-data-dir={profile_path}")
-            options.add_argument("--profile-directory=Default")
-        else:
-            # ❄️ BAKI PLATFORMS KE LIYE: Fresh/Temporary Profile
-            temp_dir = tempfile.mkdtemp()
-            options.add_argument(f"--user-data-dir={temp_dir}")    
+            os.kill(browser_pid, 0)
+        except OSError:
+            break
+        time.sleep(0.1)
+
+
+profiles.register('fresh', initializer=_seed_profile)
+
+
+def _start_chrome(launch_mode, profile_path, user_profile=False):
+    options = uc.ChromeOptions()
+    options.page_load_strategy = 'eager'
+    options.add_argument(f"--user-data-dir={profile_path}")
+    if user_profile:
+        options.add_argument("--profile-directory=Default")
+
     
-        
-        # --- 1. STRICT LINUX AGENT FOR RENDER ---
-        # User-Agent rotation hata kar ek solid Linux agent use kar rahe hain
-        if platform.system() == "Windows":
-             options.add_argument("user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36")
-        else:
-             # Render ke liye yahi best hai
-             options.add_argument("user-agent=Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36")
-
-        # --- 2. STEALTH ARGUMENTS (Sabse Zaroori) ---
-        # options.add_argument('--headless=new')
-        options.add_argument('--window-size=1920,1080')
+    # --- 1. STRICT LINUX AGENT FOR RENDER ---
+    # User-Agent rotation hata kar ek solid Linux agent use kar rahe hain
+    if platform.system() == "Windows":
+         options.add_argument("user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36")
+    else:
+         # Render ke liye yahi best hai
+         options.add_argument("user-agent=Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36")
+
+    # --- 2. STEALTH ARGUMENTS (Sabse Zaroori) ---
+    # Headless uc.Chrome(headless=...) se (wo headless=new ke leaks bhi patch karta hai)
+    width, height = launch_mode.window_size
+    options.add_argument(f'--window-size={width},{height}')
+    if launch_mode.maximized:
         options.add_argument('--start-maximized')
-        options.add_argument('--no-sandbox')
-        options.add_argument('--disable-dev-shm-usage')
-        options.add_argument('--disable-gpu')
-        
-        # Hide Automation signals
-        options.add_argument('--disable-blink-features=AutomationControlled') 
-        options.add_argument("--disable-popup-blocking")
-        # options.add_argument("--disable-extensions")
-        
-        # Advanced Stealth (Ye flag pakde jane se bachat hai)
-        # options.add_experimental_option("excludeSwitches", ["enable-automation"])
-        # options.add_experimental_option('useAutomationExtension', False)
+    for arg in launch_mode.args:
+        options.add_argument(arg)
+    options.add_argument('--no-sandbox')
+    options.add_argument('--disable-dev-shm-usage')
+    options.add_argument('--disable-gpu')
+    
+    # Hide Automation signals
+    options.add_argument('--disable-blink-features=AutomationControlled') 
+    options.add_argument("--disable-popup-blocking")
+    # options.add_argument("--disable-extensions")
+    
+    # Advanced Stealth (Ye flag pakde jane se bachat hai)
+    # options.add_experimental_option("excludeSwitches", ["enable-automation"])
+    # options.add_experimental_option('useAutomationExtension', False)
+    
+    prefs = {
+        "profile.managed_default_content_settings.images": 2,
+        "profile.default_content_setting_values.notifications": 2,
+        "credentials_enable_service": False,
+        "profile.password_manager_enabled": False,
+        "intl.accept_languages": "en-US,en"
+    }
+    options.add_experimental_option("prefs", prefs)
+
+    # Network events (blocked requests, downloaded bytes) performance log se padhte hain
+    options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+
+    # --- RENDER PATH ---
+    base_path = "/opt/render/project/.render/chrome"
+    
+    if os.path.exists(base_path):
+        print("--- Running on Render Server ---")
+        chrome_binary = os.path.join(base_path, "opt/google/chrome/google-chrome")
+        driver_binary = os.path.join(base_path, "chromedriver")
+        if os.path.exists(chrome_binary): options.binary_location = chrome_binary
         
-        prefs = {
-            "profile.managed_default_content_settings.images": 2,
-            "profile.default_content_setting_values.notifications": 2,
-            "credentials_enable_service": False,
-            "profile.password_manager_enabled": False,
-            "intl.accept_languages": "en-US,en"
-        }
-        options.add_experimental_option("prefs", prefs)
-
-        # --- RENDER PATH ---
-        base_path = "/opt/render/project/.render/chrome"
+        driver = uc.Chrome(
+            options=options, 
+            driver_executable_path=driver_binary, 
+            version_main=131,
+            headless=launch_mode.headless
+        )
+    else:
+        print("--- Running Local ---")
+        driver = uc.Chrome(options=options, use_subprocess=True, version_main=146, headless=launch_mode.headless)
+    
+    # --- 3. JAVASCRIPT INJECTION (Navigator Override) ---
+    # Browser ko jhoot bolne par majboor karna ki wo automate nahi ho raha
+    driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {
+        "source": """
+            Object.defineProperty(navigator, 'webdriver', {
+                get: () => undefined
+            });
+        """
+    })
         
-        if os.path.exists(base_path):
-            print("--- Running on Render Server ---")
-            chrome_binary = os.path.join(base_path, "opt/google/chrome/google-chrome")
-            driver_binary = os.path.join(base_path, "chromedriver")
-            if os.path.exists(chrome_binary): options.binary_location = chrome_binary
-            
-            self.driver = uc.Chrome(
-                options=options, 
-                driver_executable_path=driver_binary, 
-                version_main=131
+    driver.set_window_size(width, height)
+    return driver
+
+
+def _posted_day(date_text):
+    # Board ka date text ('7d ago', 'Yesterday', 'Today') -> YYYY-MM-DD; samajh na aaye to aaj
+    return posted_day(date_text) or datetime.now().strftime("%Y-%m-%d")
+
+
+# Search URLs (Selenium scrapers aur HTTP fast path same page kholte hain)
+SEARCH_URLS = {
+    'linkedin': lambda base, keyword, location:
+        f"{base}/jobs/search/?keywords={keyword.replace(' ', '%20')}&location={location.replace(' ', '%20')}",
+    'dice': lambda base, keyword, location:
+        f"{base}/jobs?q={keyword.replace(' ', '+')}&location={location.replace(' ', '+')}",
+    # 'allLocations=true' se ye pure location radius ko search karta hai
+    'builtin': lambda base, keyword, location:
+        f"{base}/jobs?search={keyword.replace(' ', '+')}&location={location.replace(' ', '+')}&allLocations=true",
+    'careerbuilder': lambda base, keyword, location:
+        f"{base}/jobs?keywords={keyword.replace(' ', '+')}&location={location.replace(' ', '+')}",
+}
+
+
+# --- CARD -> JOB (Selenium scrapers aur HTTP fast path dono yahi mapping use karte hain) ---
+def linkedin_card_job(card):
+    # Title/company/link na mile to card skip
+    if card['title'] is None or card['company'] is None or not card['link']:
+        return None
+    return {
+        "title": card['title'].strip(),
+        "company": card['company'].strip(),
+        # DIRECT LINK
+        "link": card['link'].split('?')[0],
+        "platform": "LinkedIn",
+        "date": datetime.now().strftime("%Y-%m-%d")
+    }
+
+
+def dice_card_job(card):
+    title = card['title']
+    if not title:
+        return None # Title nahi to card bekar hai
+    meta = card['meta']
+    location = meta[0] if meta else "Location Not Found"
+    # Posted Date (New)
+    posted_date = _posted_day(meta[-1]) if meta else "Date Not Found"
+    return {
+        "Title": title,
+        "Location": location,
+        "Date": posted_date,
+        "Link": card['link']
+    }
+
+
+def builtin_card_job(card, location):
+    # --- Title, Direct Link & Company (zaroori) ---
+    if card['title'] is None or card['company'] is None:
+        return None
+
+    # --- Location Extraction ---
+    # Aapke snippet mein location span.font-barlow ke andar hai (usually aakhri span)
+    locations = card['locations']
+    job_loc = locations[-1].strip() if locations else location
+
+    # --- Date (Posted) ---
+    # Selector: span.bg-gray-01 (e.g., "Reposted 4 Days Ago")
+    if card['date'] is not None:
+        date_text = _posted_day(card['date'].replace("Reposted", "").strip())
+    else:
+        date_text = datetime.now().strftime("%Y-%m-%d")
+
+    return {
+        "title": card['title'].strip(),
+        "company": card['company'].strip(),
+        "location": job_loc,
+        "posted_at": date_text,
+        "link": card['link']
+    }
+
+
+def careerbuilder_card_job(card, location):
+    # --- Title & Direct Link ---
+    if card['title'] is None:
+        return None
+    return {
+        "title": card['title'].strip(),
+        "company": card['company'].strip() if card['company'] is not None else "N/A",
+        "location": card['location'].strip() if card['location'] is not None else location,
+        "posted_at": card['date'].strip() if card['date'] is not None else "Recently",
+        "link": card['link']
+    }
+
+
+class BaseScraper:
+    """
+    Progress reporting, job streaming and the seen-jobs detail skip shared
+    by the Chrome scrapers and the HTTP fast path. Subclasses implement
+    _open_details(platform_name, jobs, extract).
+    """
+
+    def __init__(self, on_progress=None, on_job=None, base_urls=None, seen_index=SEEN_INDEX):
+        self.on_progress = on_progress
+        self.on_job = on_job
+        self.base_urls = {**BASE_URLS, **(base_urls or {})}
+        self.seen_index = seen_index
+        self.progress = {'cards_found': 0, 'jds_fetched': 0, 'jobs': 0}
+
+    def _report(self, **counts):
+        # Async task API ke liye progress (cards found, JDs fetched)
+        self.progress.update(counts)
+        if self.on_progress:
+            self.on_progress(dict(self.progress))
+
+    def _add_job(self, jobs_data, job):
+        jobs_data.append(job)
+        # Streaming mode: job extract hote hi client ko bhejo
+        if self.on_job:
+            self.on_job(job)
+        has_jd = any(key in job for key in ("description", "description_text", "description_html"))
+        self._report(
+            jobs=self.progress['jobs'] + 1,
+            jds_fetched=self.progress['jds_fetched'] + (1 if has_jd else 0)
+        )
+
+    def _fetch_details(self, platform_name, jobs, extract):
+        # Detail pages ko bounded parallel tabs mein fetch karke jobs mein merge (har job ready hote hi yield)
+        if self.seen_index is None:
+            return self._open_details(platform_name, jobs, extract)
+        return self._fetch_with_index(platform_name, jobs, extract)
+
+    def _fetch_with_index(self, platform_name, jobs, extract):
+        # Index mein (TTL ke andar, same title/company/location) wale jobs store se, sirf naye/badle hue tabs mein
+        job_id = JOB_IDS.get(platform_name, lambda job: _bare_link(job.get('link')))
+        keys = {}
+        for job in jobs:
+            key = job_id(job)
+            if key:
+                keys[id(job)] = (key, fingerprint(job.get('title'), job.get('company'), job.get('location')))
+
+        try:
+            known = self.seen_index.lookup(platform_name, dict(keys.values()))
+        except Exception as e:
+            print(f"{platform_name} seen-jobs lookup failed: {e}")
+            known = {}
+
+        fresh = []
+        for job in jobs:
+            key = keys.get(id(job))
+            if key and key[0] in known:
+                job.update(known[key[0]])
+                yield job
+            else:
+                fresh.append(job)
+        if known:
+            print(f"{platform_name}: {len(jobs) - len(fresh)} JDs from seen-jobs index, fetching {len(fresh)}")
+
+        def extract_and_store(driver, job):
+            fields = extract(driver, job) or {}
+            key = keys.get(id(job))
+            values = [v for v in fields.values() if isinstance(v, str)]
+            if key and any(values) and not any(v in JD_PLACEHOLDERS for v in values):
+                try:
+                    self.seen_index.store(platform_name, key[0], key[1], fields)
+                except Exception as e:
+                    print(f"{platform_name} seen-jobs store failed: {e}")
+            return fields
+
+        yield from self._open_details(platform_name, fresh, extract_and_store)
+
+
+class JobScraper(BaseScraper):
+    def __init__(self, user_profile=False, pool=None, detail_concurrency=DETAIL_CONCURRENCY,
+                 detail_per_host=DETAIL_PER_HOST, on_progress=None, on_job=None, base_urls=None,
+                 block_resources=NET_BLOCKING, launch_mode=DEFAULT_LAUNCH_MODE, deadline=SCRAPE_DEADLINE,
+                 seen_index=SEEN_INDEX):
+        super().__init__(on_progress, on_job, base_urls, seen_index)
+        # Pool mode: warm driver lease karo; pool group ho to is launch mode ka pool
+        self.launch_mode = launch_mode
+        self.pool = pool.for_mode(launch_mode) if hasattr(pool, 'for_mode') else pool
+        self.block_resources = block_resources
+        self.network = None
+        self._platform = None
+        self.detail_concurrency = detail_concurrency
+        self.detail_per_host = detail_per_host
+        self._driver_failed = False
+        self._closed = False
+        # Pool wait ya cold launch (cold launch apne driver_launch stage mein alag dikhega)
+        with timed_stage('driver_acquire'):
+            if pool is not None:
+                self.driver = self.pool.acquire()
+            else:
+                # pkill -f chrome nahi: wo is host ke baaki saare scrapes bhi maar deta tha
+                self.driver = launch_driver(user_profile, mode=launch_mode)
+        # trace=1 requests mein har WebDriver command ek span
+        instrument_driver(self.driver)
+        # Hard deadline: scrape atak gaya to watchdog sirf isi driver ka tree kill karega
+        if deadline:
+            lifecycle.watch(self.driver, deadline, label=f"{launch_mode} scrape")
+
+    def _wait_ready(self, platform_name, stage, conditions=None):
+        # Platform ki declared readiness condition tak wait, ceiling ke saath
+        spec = READINESS[platform_name][stage]
+        with timed_stage('readiness_wait', platform_name):
+            return wait_until(
+                self.driver,
+                conditions or spec.conditions,
+                timeout=spec.ceiling,
+                platform=platform_name,
+                stage=stage,
+                require_all=spec.require_all
             )
-        else:
-            print("--- Running Local ---")
-            self.driver = uc.Chrome(options=options, use_subprocess=True, version_main=146)
-        
-        # --- 3. JAVASCRIPT INJECTION (Navigator Override) ---
-        # Browser ko jhoot bolne par majboor karna ki wo automate nahi ho raha
-        self.driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {
-            "source": """
-                Object.defineProperty(navigator, 'webdriver', {
-                    get: () => undefined
-                });
-            """
-        })
-            
-        self.driver.set_window_size(1920, 1080)
 
+    def _block_profile(self):
+        return BLOCK_PROFILES.get(self._platform, BlockProfile())
 
+    def _load(self, platform_name, url):
+        # Pehli navigation se pehle platform ka blocklist lagao (pool lease ke purane log drain karke)
+        if self._platform != platform_name:
+            self._platform = platform_name
+            if self.block_resources:
+                read_network_log(self.driver)
+                try:
+                    apply_blocking(self.driver, self._block_profile())
+                except Exception as e:
+                    print(f"Network blocking skipped: {e}")
+        with timed_stage('navigation', platform_name):
+            self.driver.get(url)
 
-    def parse_relative_date(self, date_text):
-        """
-        Converts '7d ago', 'Yesterday', 'Today' into '2024-05-20' format.
-        """
-        if not date_text:
-            return datetime.now().strftime("%Y-%m-%d")
-        
-        text = date_text.lower().strip()
-        current_date = datetime.now()
+    def _prepare_tab(self, driver):
+        # Detail tabs alag CDP target hain, blocklist wahan bhi lagani padti hai
+        apply_blocking(driver, self._block_profile())
 
+    def _collect_network(self):
+        # Is scrape mein kitne requests/bytes gaye aur kitne block hue
+        if not (self.block_resources and self._platform):
+            return
         try:
-            # Case 1: "Today", "Just now", "Hours ago" -> Aaj ki date
-            if any(x in text for x in ["today", "just", "now", "hour", "h "]):
-                return current_date.strftime("%Y-%m-%d")
-
-            # Case 2: "Yesterday" -> Kal ki date
-            elif "yesterday" in text:
-                return (current_date - timedelta(days=1)).strftime("%Y-%m-%d")
-
-            # Case 3: "7d ago" ya "7 days ago" -> Subtract Days
-            elif "d" in text or "day" in text:
-                # Sirf number nikalo (regex se)
-                match = re.search(r'(\d+)', text)
-                if match:
-                    days_ago = int(match.group(1))
-                    new_date = current_date - timedelta(days=days_ago)
-                    return new_date.strftime("%Y-%m-%d")
-
-            # Case 4: "2w ago" ya "2 weeks ago" -> Subtract Weeks
-            elif "w" in text or "week" in text:
-                match = re.search(r'(\d+)', text)
-                if match:
-                    weeks_ago = int(match.group(1))
-                    new_date = current_date - timedelta(weeks=weeks_ago)
-                    return new_date.strftime("%Y-%m-%d")
-            
-            # Case 5: "1m ago" (Month) -> Approx 30 days minus
-            elif "m" in text or "mon" in text:
-                match = re.search(r'(\d+)', text)
-                if match:
-                    months_ago = int(match.group(1))
-                    new_date = current_date - timedelta(days=months_ago * 30)
-                    return new_date.strftime("%Y-%m-%d")
-
+            self.network = block_stats.record(self._platform, read_network_log(self.driver))
+            clear_blocking(self.driver)
+            print(f"{self._platform} network: {self.network['requests']} requests, "
+                  f"{self.network['blocked_requests']} blocked (~{self.network['estimated_bytes_saved'] // 1024} KiB saved)")
         except Exception:
-            pass # Agar koi error aaye to original text hi return kar do ya aaj ki date
+            pass
+
+    def _open_details(self, platform_name, jobs, extract):
+        return iter_details(
+            self.driver,
+            jobs,
+            extract,
+            platform_name,
+            readiness=READINESS[platform_name]['detail'],
+            concurrency=self.detail_concurrency,
+            per_host=self.detail_per_host,
+            prepare_tab=self._prepare_tab if self.block_resources else None
+        )
+
+    def close(self):
+        # Pool se liya hai to wapas do (state reset ke saath), warna quit
+        if self._closed:
+            return
+        self._closed = True
+        lifecycle.unwatch(self.driver)
+        if lifecycle.expired(self.driver):
+            self._driver_failed = True
+        if not self._driver_failed:
+            self._collect_network()
+            launch_stats.record_scrape_rss(self.launch_mode, driver_rss(self.driver))
+        if self.pool is not None:
+            self.pool.release(self.driver, discard=self._driver_failed)
+            return
+        lifecycle.quit(self.driver)
 
-        # Agar format samajh nahi aaya, to wahi text wapas bhej do (debugging ke liye)
-        return current_date.strftime("%Y-%m-%d")
-    
     def linkedin_scrape(self, keyword, location):
         print(f"--- Scraping LinkedIn: {keyword} in {location} ---")
         jobs_data = []
         # LinkedIn Search URL format
-        search_url = f"https://www.linkedin.com/jobs/search/?keywords={keyword.replace(' ', '%20')}&location={location.replace(' ', '%20')}"
+        search_url = SEARCH_URLS['linkedin'](self.base_urls['linkedin'], keyword, location)
         
         try:
-            self.driver.get(search_url)
-            time.sleep(5)
+            self._load('linkedin', search_url)
+            self._wait_ready('linkedin', 'search')
 
             # 1. SCROLL LOGIC (Taaki zyada jobs load ho jayein)
             for _ in range(3):
                 self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                time.sleep(2)
-
-            # 2. CARDS DETECTION
-            cards = self.driver.find_elements(By.CSS_SELECTOR, ".base-card, .job-search-card")
-            print(f"LinkedIn: Found {len(cards)} cards")
-
-            for card in cards[:5]: # Batch limit
-                try:
-                    # Basic Info
-                    title = card.find_element(By.CSS_SELECTOR, ".base-search-card__title").text.strip()
-                    company = card.find_element(By.CSS_SELECTOR, ".base-search-card__subtitle").text.strip()
-                    # 1. POST DATE EXTRACTION
-                    try:
-                        post_date = card.find_element(By.CSS_SELECTOR, "time").text.strip()
-                        print(f"✅ found date in 1st : {post_date}" )
-                    except:
-                        try:
-                            post_date = card.find_element(By.CSS_SELECTOR, ".job-search-card__listdate").text.strip()
-                            print(f"✅ found date in 2nd : {post_date}" )
-                        except:
-                            post_date = "Recently"
-                    # Click to open details
-                    self.driver.execute_script("arguments[0].click();", card)
-                    time.sleep(4)
-
-                    # 3. CLEAN HTML EXTRACTION (Like Indeed/Hiring Cafe)
-                    # LinkedIn ka main JD container 'details' class mein hota hai
-                    # full_html = self.driver.execute_script("""
-                    #     var jdContainer = document.querySelector('.details-section__content') || 
-                    #                       document.querySelector('.show-more-less-html__markup') ||
-                    #                       document.body;
-                        
-                    #     var clone = jdContainer.cloneNode(true);
-                        
-                    #     // Remove junk
-                    #     clone.querySelectorAll('nav, footer, header, script, style, button').forEach(el => el.remove());
-                        
-                    #     return clone.innerHTML;
-                    # """)
+                self._wait_ready('linkedin', 'scroll')
 
-                    # 4. DIRECT LINK
-                    link = card.find_element(By.TAG_NAME, "a").get_attribute("href").split('?')[0]
+            # 2. CARDS DETECTION (saare fields ek call mein)
+            total, cards = extract_cards(self.driver, CARD_SPECS['linkedin'], limit=5) # Batch limit
+            print(f"LinkedIn: Found {total} cards")
+            self._report(cards_found=total)
 
-                    jobs_data.append({
-                        "title": title,
-                        "company": company,
-                        # "description_raw": full_html.strip(), # 🔥 n8n AI ready
-                        "link": link,
-                        "platform": "LinkedIn",
-                        "date": datetime.now().strftime("%Y-%m-%d")
-                    })
-                    print(f"✅ LinkedIn: {link}" )
-
-                except Exception as e:
+            for card in per_item(cards, 'card_extraction'):
+                job = linkedin_card_job(card)
+                if job is None:
                     continue
+                self._add_job(jobs_data, job)
+                print(f"✅ LinkedIn: {job['link']}" )
 
         except Exception as e:
             print(f"LinkedIn Error: {e}")
+            self._driver_failed = True
 
         finally:
-            try: self.driver.quit()
-            except: pass    
+            self.close()    
         return jobs_data
     
   # --- HIRING.CAFE SCRAPER (Index Strategy - 11th Element) ---
@@ -238,10 +678,10 @@ class JobScraper:
         jobs_data = []
         temp_jobs = []
         try:
-            self.driver.get("https://hiring.cafe/")
+            self._load('hiringcafe', base_url)
             
-            print("Waiting 5s for UI...")
-            time.sleep(5)
+            print("Waiting for UI...")
+            self._wait_ready('hiringcafe', 'search')
             
             # --- 1. KEYWORD TYPE KARO ---
             try:
@@ -285,7 +725,7 @@ class JobScraper:
                         except:
                             self.driver.execute_script("arguments[0].click();", target_box)
                             
-                        time.sleep(2) # Modal animation waitss
+                        self._wait_ready('hiringcafe', 'modal') # Modal animation wait
                         print("Modal should be open now.")
                         # STEP: Modal ke andar ke input ko dhoondna (Using your provided ID)
                     # 1. Input box dhoondo
@@ -294,25 +734,27 @@ class JobScraper:
                     )
                     
                     def type_and_verify(text_to_type):
-                        location_input.click()
-                        location_input.send_keys(Keys.CONTROL + "a")
-                        location_input.send_keys(Keys.DELETE)
+                        # Char-by-char typing trace mein alag dikhe
+                        with span('type_and_verify', text=text_to_type):
+                            location_input.click()
+                            location_input.send_keys(Keys.CONTROL + "a")
+                            location_input.send_keys(Keys.DELETE)
                         
-                        for char in text_to_type:
-                            location_input.send_keys(char)
-                            time.sleep(0.1)
+                            for char in text_to_type:
+                                location_input.send_keys(char)
+                                time.sleep(0.1)
                         
-                        time.sleep(2) # Wait for suggestions
+                            self._wait_ready('hiringcafe', 'suggestions') # Wait for suggestions
                         
-                        # Check karo agar "No options" dikh raha hai
-                        try:
-                            # React-select ka default 'no options' div class ya text check
-                            page_source = self.driver.page_source.lower()
-                            if "no options" in page_source or "no results" in page_source:
-                                return False
-                            return True
-                        except:
-                            return True
+                            # Check karo agar "No options" dikh raha hai
+                            try:
+                                # React-select ka default 'no options' div class ya text check
+                                page_source = self.driver.page_source.lower()
+                                if "no options" in page_source or "no results" in page_source:
+                                    return False
+                                return True
+                            except:
+                                return True
 
                     # --- Execution ---
                     # Pehle Pura Address try karo
@@ -344,7 +786,7 @@ class JobScraper:
                     # 3. Final Search Trigger (Enter again or click outside)
                     time.sleep(1)
                     location_input.send_keys(Keys.ESCAPE) # Modal band karne ke liye
-                    time.sleep(2)
+                    self._wait_ready('hiringcafe', 'results')
 
                 except Exception as e:
                     print(f"⚠️ Hiring Cafe Location Error: {e}")
@@ -353,239 +795,182 @@ class JobScraper:
                 except Exception as e:
                     print(f"⚠️ Location Interaction Error: {e}")
 
-            # --- 3. FETCH RESULTS ---
-            print("Scrolling to load jobs...")
-            self.driver.execute_script("window.scrollTo(0, 1000);")
-            time.sleep(2)
-            self.driver.execute_script("window.scrollTo(0, 3000);")
-            time.sleep(3)
-
-            # --- 4. DATA EXTRACTION ---
-            # Job cards extraction
-            job_links = self.driver.find_elements(By.XPATH, "//a[contains(@href, '/viewjob/')]")
+            # --- 3. FETCH RESULTS (date-aware: kaafi naye jobs mil gaye ya window khatam to scroll band) ---
+            window = RecencyWindow(HIRINGCAFE_DAYS)
             unique_ids = set()
-
-            for link_elem in job_links:
-                try:
-                    href = link_elem.get_attribute("href")
-                    job_id = href.split("/viewjob/")[-1].split("?")[0]
-                    if job_id in unique_ids: continue
-                    
-                    card = link_elem.find_element(By.XPATH, "./../../..") 
-                    lines = [l.strip() for l in card.text.split('\n') if l.strip()]
-
-                    # --- 1. FIND RAW DATE TEXT ---
-                    raw_date_text = ""
-                    # Card lines mein niche se dhoondo (Aksar last mein time hota hai)
-                    for line in reversed(lines):
-                        # Agar line mein sirf digits aur 'd','w','m','h' ho (Hiring Cafe format)
-                        if re.search(r'^\d+[dwmh]$|ago', line.lower()):
-                            raw_date_text = line
-                            break
-                    
-                    # Agar upar wala fail ho, to koi bhi line jisme digit+unit ho
-                    if not raw_date_text:
-                        for line in lines:
-                            if any(unit in line.lower() for unit in ['1d','2d','3d','4d','5d','6d','1w','2w','3w','1mo','2mo','3mo']):
+            scrolls = (1000, 3000)
+            for done, scroll_y in enumerate(scrolls, 1):
+                print("Scrolling to load jobs...")
+                self.driver.execute_script(f"window.scrollTo(0, {scroll_y});")
+                self._wait_ready('hiringcafe', 'scroll')
+
+                # --- 4. DATA EXTRACTION ---
+                # Saare cards ka (href, text) ek hi call mein
+                window.start_batch()
+                added = 0
+                with timed_stage('card_discovery', 'hiringcafe'):
+                    rows = self.driver.execute_script(_HIRINGCAFE_CARDS_JS) or []
+                for href, text in per_item(rows, 'card_extraction'):
+                    try:
+                        job_id = href.split("/viewjob/")[-1].split("?")[0]
+                        if job_id in unique_ids: continue
+                        lines = [l.strip() for l in text.split('\n') if l.strip()]
+
+                        # --- 1. FIND RAW DATE TEXT ---
+                        raw_date_text = ""
+                        # Card lines mein niche se dhoondo (Aksar last mein time hota hai)
+                        for line in reversed(lines):
+                            # Agar line mein sirf digits aur 'd','w','m','h' ho (Hiring Cafe format)
+                            if re.search(r'^\d+[dwmh]$|ago', line.lower()):
                                 raw_date_text = line
                                 break
 
-                    # --- 2. PARSE DATE & FILTER ---
-                    parsed_date_str = self.parse_relative_date(raw_date_text)
-                    job_date_obj = datetime.strptime(parsed_date_str, "%Y-%m-%d")
-
-                    now = datetime.now()
-                    two_weeks_ago = now - timedelta(days=14)
-                    if job_date_obj < two_weeks_ago:
-                        print(f"Skipping old job: {raw_date_text} ({parsed_date_str})")
-                        continue 
+                        # Agar upar wala fail ho, to koi bhi line jisme digit+unit ho
+                        if not raw_date_text:
+                            for line in lines:
+                                if any(unit in line.lower() for unit in ['1d','2d','3d','4d','5d','6d','1w','2w','3w','1mo','2mo','3mo']):
+                                    raw_date_text = line
+                                    break
+
+                        # --- 2. DATE FILTER PEHLE (purane card par baaki extraction nahi) ---
+                        if not window.accept(raw_date_text):
+                            print(f"Skipping old job: {raw_date_text}")
+                            continue
+
+                        # --- 3. DATA EXTRACTION (Sahi Sequence) ---
+                        # Card ki pehli line Title hoti hai, dusri Company
+                        title= lines[1] if len(lines) > 1 else "Unknown Title"
+                        company =  lines[0] if len(lines) > 0 else "Unknown company"
+                        
 
-                    # --- 3. DATA EXTRACTION (Sahi Sequence) ---
-                    # Card ki pehli line Title hoti hai, dusri Company
-                    title= lines[1] if len(lines) > 1 else "Unknown Title"
-                    company =  lines[0] if len(lines) > 0 else "Unknown company"
-                    
+                        # Agar Title hi "1w" ya "2d" ban raha hai, toh correction logic
+                        if any(x in title.lower() for x in ['1w', '2d', '1mo']):
+                            # Iska matlab line sequence upar niche hai, thoda smart search karo
+                            for l in lines:
+                                if len(l) > 5 and not any(u in l for u in ['1d','2d','1w']):
+                                    title = l
+                                    break
 
-                    # Agar Title hi "1w" ya "2d" ban raha hai, toh correction logic
-                    if any(x in title.lower() for x in ['1w', '2d', '1mo']):
-                        # Iska matlab line sequence upar niche hai, thoda smart search karo
-                        for l in lines:
-                            if len(l) > 5 and not any(u in l for u in ['1d','2d','1w']):
-                                title = l
+                        # Location selection
+                        job_loc = "Remote"
+                        for line in lines:
+                            if any(x in line.lower() for x in ["remote", "hybrid", "onsite", "usa", "india"]):
+                                job_loc = line
                                 break
 
-                    # Location selection
-                    job_loc = "Remote"
-                    for line in lines:
-                        if any(x in line.lower() for x in ["remote", "hybrid", "onsite", "usa", "india"]):
-                            job_loc = line
-                            break
+                        temp_jobs.append({
+                            "title": title,
+                            "company": company,
+                            "location": job_loc,
+                            "date": _posted_day(raw_date_text), # Ab ye exact YYYY-MM-DD hogi
+                            "link": href,
+                            "platform": "Hiring.cafe"
+                        })
+                        unique_ids.add(job_id)
+                        added += 1
 
-                    temp_jobs.append({
-                        "title": title,
-                        "company": company,
-                        "location": job_loc,
-                        "date": parsed_date_str, # Ab ye exact YYYY-MM-DD hogi
-                        "link": href,
-                        "platform": "Hiring.cafe"
-                    })
-                    unique_ids.add(job_id)
+                    except Exception as e:
+                        continue
 
-                except Exception as e:
-                    continue
+                # JD sirf pehle HIRINGCAFE_JD_LIMIT ke khulte hain; utne mil gaye, ya scroll se kuch naya nahi aaya
+                if done < len(scrolls) and (len(temp_jobs) >= HIRINGCAFE_JD_LIMIT or window.exhausted or not added):
+                    recency_stats.record(pages_skipped=len(scrolls) - done, early_stop=True)
+                    break
+            recency_stats.record(cards_dropped=window.dropped)
 
+            # Sabse naye pehle (same din ke jobs feed order mein)
+            temp_jobs.sort(key=lambda job: job['date'], reverse=True)
             print(f"Filtered Results: Found {len(temp_jobs)} jobs from the last 2 weeks.")
-
-            for job in temp_jobs[:5]:
-                try:
-                    self.driver.get(job['link'])
-                    time.sleep(5) # JD load hone ka wait
-
-                    # JavaScript to extract clean Main Content
-                    clean_html = self.driver.execute_script("""
-                        // 1. Hiring Cafe mein aksar 'main' tag ke andar asli content hota hai
-                        var mainContent = document.querySelector('main') || 
-                                        document.querySelector('.chakra-container') ||
-                                        document.body;
-
-                        var clone = mainContent.cloneNode(true);
-
-                        // 2. Faltu elements ko remove karein (Nav, Sidebar, Footer)
-                        // Hiring Cafe ke specific classes/tags
-                        var unwanted = [
-                            'nav', 'footer', 'header', 'script', 'style', 'iframe',
-                            'svg', 'button:not([aria-label*="Apply"])', 
-                            '[role="navigation"]', '.css-17849id' // Example sidebar class
-                        ];
-                        
-                        unwanted.forEach(sel => {
-                            clone.querySelectorAll(sel).forEach(el => el.remove());
-                        });
-
-                        return clone.innerHTML;
-                    """)
-
-                    jobs_data.append({
-                        "title": job['title'],
-                        "company": job['company'],
-                        "location": job['location'],
-                        "description": clean_html.strip(),
-                        "date": job['date'],
-                        "link": job['link'],
-                        "platform": "Hiring.cafe"
-                    })
-                    print(f"✅ Scraped: {job['title']}")
-
-                except Exception as e:
-                    print(f"Hiring.cafe JD Error: {e}")
-                    continue
+            self._report(cards_found=len(temp_jobs))
+
+            def extract_jd(driver, job):
+                # JavaScript to extract clean Main Content
+                clean_html = driver.execute_script("""
+                    // 1. Hiring Cafe mein aksar 'main' tag ke andar asli content hota hai
+                    var mainContent = document.querySelector('main') || 
+                                    document.querySelector('.chakra-container') ||
+                                    document.body;
+
+                    var clone = mainContent.cloneNode(true);
+
+                    // 2. Faltu elements ko remove karein (Nav, Sidebar, Footer)
+                    // Hiring Cafe ke specific classes/tags
+                    var unwanted = [
+                        'nav', 'footer', 'header', 'script', 'style', 'iframe',
+                        'svg', 'button:not([aria-label*="Apply"])', 
+                        '[role="navigation"]', '.css-17849id' // Example sidebar class
+                    ];
+                    
+                    unwanted.forEach(sel => {
+                        clone.querySelectorAll(sel).forEach(el => el.remove());
+                    });
+
+                    return clone.innerHTML;
+                """)
+                return {"description": clean_html.strip()}
+
+            # JD pages parallel tabs mein load hote hain
+            for job in self._fetch_details('hiringcafe', temp_jobs[:HIRINGCAFE_JD_LIMIT], extract_jd):
+                self._add_job(jobs_data, {
+                    "title": job['title'],
+                    "company": job['company'],
+                    "location": job['location'],
+                    "description": job['description'],
+                    "date": job['date'],
+                    "link": job['link'],
+                    "platform": "Hiring.cafe"
+                })
+                print(f"✅ Scraped: {job['title']}")
 
         except Exception as e:
             print(f"Hiring.cafe Error: {e}")
+            self._driver_failed = True
         finally:
-            try: self.driver.quit()
-            except: pass
+            self.close()
             
         return jobs_data
     
     def dice_scrape(self, url, ):
         # print(f"--- Scraping {platform_name} ---")
-        self.driver.get(url)
-        time.sleep(5)
-        card_selector="[data-testid='job-card']"    # Custom web component
-        title_selector="[data-testid='job-search-job-detail-link']"     # Job title link with ID starting with position-title
-        link_selector="[data-testid='job-search-job-card-link']"       # Same element for link
-        
-        # Human behavior mimic karne ke liye random sleep
-        # time.sleep(random.uniform(8, 12))
-        
-        # Multiple scrolls for dynamic content loading
-        for i in range(3):
-            self.driver.execute_script(f"window.scrollTo(0, document.body.scrollHeight/{3-i});")
-            time.sleep(1)
-
         jobs_data = []
         
         try:
-            # Try multiple selector strategies
-            selectors_to_try = [
-                card_selector,  # Original selector
-                "div[data-testid='search-result-card']",
-                "dhi-js-search-result-card",
-                "div.card",
-                "article",
-                "[class*='card']"
-            ]
-            
-            cards = []
-            for selector in selectors_to_try:
-                try:
-                    print(f"Trying selector: {selector}")
-                    WebDriverWait(self.driver, 10).until(
-                        EC.presence_of_element_located((By.CSS_SELECTOR, selector))
-                    )
-                    cards = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                    if cards:
-                        print(f"✓ Found {len(cards)} cards with selector: {selector}")
-                        break
-                except:
-                    continue
-            
-            if not cards:
+            self._load('dice', url)
+            self._wait_ready('dice', 'search')
+
+            # Human behavior mimic karne ke liye random sleep
+            # time.sleep(random.uniform(8, 12))
+
+            # Multiple scrolls for dynamic content loading
+            for i in range(3):
+                self.driver.execute_script(f"window.scrollTo(0, document.body.scrollHeight/{3-i});")
+                self._wait_ready('dice', 'scroll')
+
+            # Card selectors ki fallback chain (CARD_SPECS) browser mein hi try hoti hai
+            total, cards = extract_cards(self.driver, CARD_SPECS['dice'], limit=10)
+            if total:
+                print(f"✓ Found {total} cards")
+                self._report(cards_found=total)
+            else:
                 print("❌ No cards found with any selector. Trying generic approach...")
                 # Last resort: find all links and filter
                 all_links = self.driver.find_elements(By.TAG_NAME, "a")
                 print(f"Found {len(all_links)} total links on page")
             
-            for card in cards[0:10]:
-                try:
-                    title = card.find_element(By.CSS_SELECTOR, title_selector).text
-                    print(f"Extracting job: {title}")
-                    # Link nikalne ke liye check (kabhi href parent pe hota hai, kabhi child pe)
-                    try:
-                        link_elem = card.find_element(By.CSS_SELECTOR, link_selector)
-                        link = link_elem.get_attribute('href')
-                    except:
-                        # Agar direct link selector kaam na kare to poore card ka href try karein
-                        link = card.get_attribute('href')
-                    meta_elements = card.find_elements(By.CSS_SELECTOR, "p.text-sm.font-normal.text-zinc-600")
-                    print(f"Found {len(meta_elements)} meta elements")
-                    
-                    try:
-                        location = meta_elements[0].text
-                    except Exception as e:
-                        location = f"Location Not Found {e}"
-
-                    # 4. Posted Date (New)
-                    try:
-                        posted_date = self.parse_relative_date(meta_elements[-1].text)
-                    except Exception as e:
-                        posted_date = f"Date Not Found {e}"
-
-                    if title:
-                        job_info = {
-                        "Title": title,
-                        "Location": location,
-                        "Date": posted_date,
-                        "Link": link
-                    }
-                        jobs_data.append(job_info)
-                        print(f"Scraped: {title} | {location} | {posted_date}")
-                       
-
-                        
-                except Exception as e:
-                    continue # Agar ek card fail ho jaye to agle pe jao
+            for card in per_item(cards, 'card_extraction'):
+                job_info = dice_card_job(card)
+                if job_info is None:
+                    continue
+                self._add_job(jobs_data, job_info)
+                print(f"Scraped: {job_info['Title']} | {job_info['Location']} | {job_info['Date']}")
 
         except Exception as e:
             print(f"Error on dice jobs : {e}")
+            self._driver_failed = True
             
         finally:
             # --- YEH LINE BAHUT ZAROORI HAI ---
-            try:
-                self.driver.quit()
-            except:
-                pass    
+            self.close()
             
         return jobs_data
 
@@ -593,8 +978,8 @@ class JobScraper:
         print(f"--- Scraping ZipRecruiter: {url} ---")
         jobs_data = []
         try:
-            self.driver.get(url)
-            time.sleep(8) 
+            self._load('ziprecruiter', url)
+            self._wait_ready('ziprecruiter', 'search')
 
             # --- 1. POP-UP HANDLER ---
             try:
@@ -604,33 +989,33 @@ class JobScraper:
 
             # --- 2. EXTRACT ALL JOB LINKS FIRST ---
             # Hum pehle saari details nikal lenge taaki 'Stale Element' error na aaye
-            cards = self.driver.find_elements(By.CSS_SELECTOR, "article.job_result, article[id^='job-card-']")
-            print(f"Total Cards Found: {len(cards)}")
+            total, cards = extract_cards(self.driver, CARD_SPECS['ziprecruiter'])
+            print(f"Total Cards Found: {total}")
+            self._report(cards_found=total)
             
             temp_jobs = []
-            for card in cards:
+            for card in per_item(cards, 'card_extraction'):
                 try:
-                    article_id = card.get_attribute("id")
+                    article_id = card['id']
                     job_key = article_id.replace("job-card-", "") if article_id else ""
                     
                     # Direct Link Logic
-                    job_link = f"https://www.ziprecruiter.com/jobs-search?{urllib.parse.urlencode({'search': keyword, 'location': location, 'lk': job_key})}"
+                    job_link = f"{self.base_urls['ziprecruiter']}/jobs-search?{urllib.parse.urlencode({'search': keyword, 'location': location, 'lk': job_key})}"
 
                     # --- TARGET LINK FORMAT (Updated as per your request) ---
                     # Ye link n8n ke liye save hoga
-                    final_link = f"https://www.ziprecruiter.com/jobs-search?lk={job_key}"
+                    final_link = f"{self.base_urls['ziprecruiter']}/jobs-search?lk={job_key}"
                     
-                    title = ""
-                    try: title = card.find_element(By.CSS_SELECTOR, "h2[aria-label]").get_attribute("aria-label")
-                    except: title = card.find_element(By.TAG_NAME, "h2").text.strip()
-
-                    company = "Unknown"
-                    try: company = card.find_element(By.CSS_SELECTOR, "[data-testid='job-card-company']").text.strip()
-                    except: pass
+                    # aria-label wala h2 pehle, warna h2 ka text; h2 hi nahi to card skip
+                    if card['aria_title'] is not None:
+                        title = card['aria_title']
+                    elif card['title'] is not None:
+                        title = card['title'].strip()
+                    else:
+                        continue
 
-                    location_val = "USA"
-                    try: location_val = card.find_element(By.CSS_SELECTOR, "[data-testid='job-card-location']").text.strip()
-                    except: pass
+                    company = card['company'].strip() if card['company'] is not None else "Unknown"
+                    location_val = card['location'].strip() if card['location'] is not None else "USA"
 
                     if title and job_link:
                         temp_jobs.append({
@@ -646,58 +1031,52 @@ class JobScraper:
             # --- 3. VISIT EACH LINK FOR DESCRIPTION ---
             # Ab hum har link par jayenge aur JD nikalenge
             print(f"Extracting descriptions for {len(temp_jobs)} jobs...")
-            for job in temp_jobs[:5]: # Starting ke 15 jobs (Safety ke liye)
+            def extract_jd(driver, job):
+                description = ""
                 try:
-                    self.driver.get(job['link'])
-                    time.sleep(5) # JD load hone ka wait
-
-                    description = ""
+                    # Aapka bataya hua specific selector
+                    jd_container = WebDriverWait(driver, 10).until(
+                        EC.presence_of_element_located((By.CSS_SELECTOR, "[data-testid='job-details-scroll-container']"))
+                    )
+                    description = jd_container.text.strip()
+                except:
                     try:
-                        # Aapka bataya hua specific selector
-                        jd_container = WebDriverWait(self.driver, 10).until(
-                            EC.presence_of_element_located((By.CSS_SELECTOR, "[data-testid='job-details-scroll-container']"))
-                        )
-                        description = jd_container.text.strip()
+                        description = driver.find_element(By.CLASS_NAME, "job_description").text.strip()
                     except:
-                        try:
-                            description = self.driver.find_element(By.CLASS_NAME, "job_description").text.strip()
-                        except:
-                            description = "Description could not be loaded"
-                    
-                    # 2. ASLI APPLY LINK (External URL) - THE FIX
-                        # Hum wo 'a' tag dhundenge jiska aria-label 'Apply' hai
-
+                        description = "Description could not be loaded"
+                
+                # 2. ASLI APPLY LINK (External URL) - THE FIX
+                # Hum wo 'a' tag dhundenge jiska aria-label 'Apply' hai
+                try:
                     try:
-                            try:
-                                apply_button = self.driver.find_element(By.CSS_SELECTOR, "a[aria-label='Apply']")
-                                external_apply_link = apply_button.get_attribute("href")
-                            except:
-                                # Fallback: Agar aria-label na mile toh link jisme 'job-redirect' ho
-                                apply_button = self.driver.find_element(By.XPATH, "//a[contains(@href, 'job-redirect')]")
-                                external_apply_link = apply_button.get_attribute("href")  
-                    except:            
-                        external_apply_link = job['link'] # Default to internal link              
-
-                    jobs_data.append({
-                        "title": job['title'],
-                        "company": job['company'],
-                        "location": job['location'],
-                        "description": description, # 🔥 Now sending to n8n
-                        "date": datetime.now().strftime("%Y-%m-%d"),
-                        "link": external_apply_link,
-                        "platform": "ZipRecruiter"
-                    })
-                    print(f"✅ Scraped: {job['title']}")
-
-                except Exception as e:
-                    print(f"Error on JD page: {e}")
-                    continue
+                        apply_button = driver.find_element(By.CSS_SELECTOR, "a[aria-label='Apply']")
+                        external_apply_link = apply_button.get_attribute("href")
+                    except:
+                        # Fallback: Agar aria-label na mile toh link jisme 'job-redirect' ho
+                        apply_button = driver.find_element(By.XPATH, "//a[contains(@href, 'job-redirect')]")
+                        external_apply_link = apply_button.get_attribute("href")  
+                except:            
+                    external_apply_link = job['link'] # Default to internal link              
+
+                return {"description": description, "external_apply_link": external_apply_link}
+
+            for job in self._fetch_details('ziprecruiter', temp_jobs[:5], extract_jd): # Starting ke 5 jobs (Safety ke liye)
+                self._add_job(jobs_data, {
+                    "title": job['title'],
+                    "company": job['company'],
+                    "location": job['location'],
+                    "description": job['description'], # 🔥 Now sending to n8n
+                    "date": datetime.now().strftime("%Y-%m-%d"),
+                    "link": job['external_apply_link'],
+                    "platform": "ZipRecruiter"
+                })
+                print(f"✅ Scraped: {job['title']}")
 
         except Exception as e:
             print(f"ZipRecruiter Scraping Error: {e}")
+            self._driver_failed = True
         finally:
-            try: self.driver.quit()
-            except: pass
+            self.close()
             
         return jobs_data
   # --- INDEED SCRAPER (Security & Selector Updated) ---
@@ -707,18 +1086,17 @@ class JobScraper:
         unique_jks = set()  # Duplicates hatane ke liye set banaya
 
         try:
-            self.driver.get(url)
-            time.sleep(15) # Security wait
+            self._load('indeed', url)
+            self._wait_ready('indeed', 'search') # Security wait
 
-            cards = self.driver.find_elements(By.CSS_SELECTOR, "div.job_seen_beacon, td.resultContent")
+            total, cards = extract_cards(self.driver, CARD_SPECS['indeed'], limit=5)
+            self._report(cards_found=total)
             temp_jobs = []
-            for card in cards[0:5]:
+            for card in per_item(cards, 'card_extraction'):
                 try:
                     # --- 1. GET UNIQUE ID (JK) FIRST ---
-                    jk_id = ""
-                    try:
-                        jk_id = card.find_element(By.CSS_SELECTOR, "a[data-jk]").get_attribute("data-jk")
-                    except:
+                    jk_id = card['jk']
+                    if jk_id is None:
                         continue # Agar JK hi nahi mila toh card bekar hai
 
                     # --- 2. DUPLICATE CHECK ---
@@ -726,20 +1104,15 @@ class JobScraper:
                         continue # Agar ye ID pehle aa chuki hai, toh skip karo
                     
                     # --- 3. DATA EXTRACTION ---
-                    title = ""
-                    try:
-                        title_elem = card.find_element(By.CSS_SELECTOR, "h2.jobTitle span[title]")
-                        title = title_elem.get_attribute("title")
-                    except:
-                        title = card.find_element(By.CSS_SELECTOR, "h2.jobTitle").text.strip()
+                    if card['span_title'] is not None:
+                        title = card['span_title']
+                    elif card['title'] is not None:
+                        title = card['title'].strip()
+                    else:
+                        continue
 
-                    try:
-                        company = card.find_element(By.CSS_SELECTOR, "[data-testid='company-name']").text.strip()
-                    except: company = ""
-
-                    try:
-                        location_val = card.find_element(By.CSS_SELECTOR, "[data-testid='text-location']").text.strip()
-                    except: location_val = ""
+                    company = (card['company'] or "").strip()
+                    location_val = (card['location'] or "").strip()
 
                     # --- 4. CLEANING & VALIDATION ---
                     # Agar Title, Company ya Location mein se kuch bhi missing hai, toh skip karo
@@ -753,7 +1126,7 @@ class JobScraper:
                         "company": company,
                         "location": location_val,
                         "date": datetime.now().strftime("%Y-%m-%d"),
-                        "link": f"https://www.indeed.com/viewjob?jk={jk_id}",
+                        "link": f"{self.base_urls['indeed']}/viewjob?jk={jk_id}",
                         "platform": "Indeed"
                     })
                     
@@ -761,55 +1134,50 @@ class JobScraper:
 
                 except Exception:
                     continue
-            for job in temp_jobs:
-                try:
-                    self.driver.get(job['link'])
-                    time.sleep(5) # JD load hone ka wait
+
+            def extract_jd(driver, job):
+                # JavaScript to extract clean HTML without Nav/Footer
+                clean_content = driver.execute_script("""
+                    // 1. Target the main content wrapper
+                    // Indeed ke naye layout mein ye container sabse best hai
+                    var mainContainer = document.querySelector('.jobsearch-ViewJobLayout-jobDisplay') || 
+                                    document.querySelector('.jobsearch-ViewJobLayout-content') ||
+                                    document.body;
+
+                    var clone = mainContainer.cloneNode(true);
+
+                    // 2. Remove unnecessary elements
+                    var unwanted = [
+                        'nav', 'footer', 'header', 'script', 'style', 'iframe',
+                        '.jobsearch-HeaderContainer', '#gnav-main-container', 
+                        '.jobsearch-JobMetadataFooter', '.jobsearch-RelatedLinks'
+                    ];
                     
-                    # JavaScript to extract clean HTML without Nav/Footer
-                    clean_content = self.driver.execute_script("""
-                        // 1. Target the main content wrapper
-                        // Indeed ke naye layout mein ye container sabse best hai
-                        var mainContainer = document.querySelector('.jobsearch-ViewJobLayout-jobDisplay') || 
-                                        document.querySelector('.jobsearch-ViewJobLayout-content') ||
-                                        document.body;
-
-                        var clone = mainContainer.cloneNode(true);
-
-                        // 2. Remove unnecessary elements
-                        var unwanted = [
-                            'nav', 'footer', 'header', 'script', 'style', 'iframe',
-                            '.jobsearch-HeaderContainer', '#gnav-main-container', 
-                            '.jobsearch-JobMetadataFooter', '.jobsearch-RelatedLinks'
-                        ];
-                        
-                        unwanted.forEach(sel => {
-                            clone.querySelectorAll(sel).forEach(el => el.remove());
-                        });
-
-                        return clone.innerHTML;
-                    """)
-                    description_html = clean_content.strip()
-
-                    jobs_data.append({
-                        "title": job['title'],  
-                        "company": job['company'],
-                        "location": job['location'],
-                        "description": description_html,
-                        "date": job['date'],
-                        "link": job['link'],
-                        "platform": "Indeed"
-                    })
-                    print(f"✅ Scraped: {job['title']}")
-                except Exception as e:
-                    print(f"Indeed JD Error: {e}")
-                    continue        
+                    unwanted.forEach(sel => {
+                        clone.querySelectorAll(sel).forEach(el => el.remove());
+                    });
+
+                    return clone.innerHTML;
+                """)
+                return {"description": clean_content.strip()}
+
+            for job in self._fetch_details('indeed', temp_jobs, extract_jd):
+                self._add_job(jobs_data, {
+                    "title": job['title'],  
+                    "company": job['company'],
+                    "location": job['location'],
+                    "description": job['description'],
+                    "date": job['date'],
+                    "link": job['link'],
+                    "platform": "Indeed"
+                })
+                print(f"✅ Scraped: {job['title']}")
 
         except Exception as e:
             print(f"Indeed Error: {e}")
+            self._driver_failed = True
         finally:
-            try: self.driver.quit()
-            except: pass
+            self.close()
             
         return jobs_data
     
@@ -819,12 +1187,12 @@ class JobScraper:
         
         # Glassdoor US Search URL
         # Hum 'fromAge' parameter bhi add kar sakte hain (e.g., 7 days) filters ke liye
-        search_url = f"https://www.glassdoor.com/Job/jobs.htm?sc.keyword={keyword}&locT=C&locId={location}&brandIndex=en"
+        search_url = f"{self.base_urls['glassdoor']}/Job/jobs.htm?sc.keyword={keyword}&locT=C&locId={location}&brandIndex=en"
         
         try:
-            self.driver.get(search_url)
+            self._load('glassdoor', search_url)
             # VPN ke saath initial load mein time lagta hai
-            time.sleep(12)
+            self._wait_ready('glassdoor', 'search')
             # 🔥 RECURSIVE RETRY LOGIC (Just a moment check)
             # current_title = self.driver.title.lower()
             # if "just a moment" in current_title or "verify you are human" in current_title:
@@ -846,8 +1214,9 @@ class JobScraper:
             # Glassdoor aksar 'jobCard' ya 'react-job-listing' use karta hai
             cards = self.driver.find_elements(By.CLASS_NAME, "jobCard")
             print(f"Glassdoor: Found {len(cards)} job cards.")
+            self._report(cards_found=len(cards))
             temp_jobs = []
-            for card in cards[:5]: # Batch limit for n8n efficiency
+            for card in per_item(cards[:5], 'card_extraction'): # Batch limit for n8n efficiency
 
                 try:
                     print(card.text)
@@ -861,7 +1230,7 @@ class JobScraper:
                     # 2. CLICK TO LOAD DESCRIPTION
                     # Click se right side panel mein JD load hota hai
                     self.driver.execute_script("arguments[0].click();", card)
-                    time.sleep(4)
+                    self._wait_ready('glassdoor', 'panel')
 
                     try:
                         # Title wale anchor tag ko target karo jo clean link rakhta hai
@@ -880,7 +1249,7 @@ class JobScraper:
             
                     try:
                         posted_at = card.text.split('\n')[-1].strip()
-                        posted_at = self.parse_relative_date(posted_at)
+                        posted_at = _posted_day(posted_at)
                     except:
                         posted_at = datetime.now().strftime("%Y-%m-%d")   
 
@@ -895,92 +1264,82 @@ class JobScraper:
 
                 except Exception as e:
                     continue
-            for job in temp_jobs:
-                try:
-                    self.driver.get(job['link'])
-                    time.sleep(5) # JD load hone ka wait
-
-                    # # JavaScript to extract clean Main Content
-                    # clean_text = self.driver.execute_script("""
-                    #     // 1. Target the main job description container
-                    #     var jdContainer = document.querySelector('.jobDescriptionContent') || 
-                    #                     document.querySelector('.jobDescription') ||
-                    #                     document.body;
-
-                    #     return jdContainer.inne
-                    description_section = self.driver.find_element(By.CSS_SELECTOR, ".JobDetails_jobDescription__uW_fK").text.strip()
-
-                    jobs_data.append({
-                        "title": job['title'],
-                        "company": job['company'],
-                        "description": description_section,
-                        "date": job['posted_at'],
-                        "link": job['link'],
-                        "platform": "Glassdoor"
-                    })
-                    print(f"✅ Scraped: {job['title']}")
 
-                except Exception as e:
-                    print(f"Glassdoor JD Error: {e}")
-                    continue
+            def extract_jd(driver, job):
+                description_section = driver.find_element(By.CSS_SELECTOR, ".JobDetails_jobDescription__uW_fK").text.strip()
+                return {"description": description_section}
+
+            for job in self._fetch_details('glassdoor', temp_jobs, extract_jd):
+                self._add_job(jobs_data, {
+                    "title": job['title'],
+                    "company": job['company'],
+                    "description": job['description'],
+                    "date": job['posted_at'],
+                    "link": job['link'],
+                    "platform": "Glassdoor"
+                })
+                print(f"✅ Scraped: {job['title']}")
 
         except Exception as e:
             print(f"Glassdoor Main Error: {e}")
+            self._driver_failed = True
         finally:
-            try: self.driver.quit()
-            except: pass    
+            self.close()    
         return jobs_data
     
     def simplyhired_scrape(self, keyword, location):
         print(f"--- Scraping SimplyHired: {keyword} in {location} ---")
         jobs_data = []
-        search_url = f"https://www.simplyhired.com/search?q={keyword.replace(' ', '+')}&l={location.replace(' ', '+')}"
+        search_url = f"{self.base_urls['simplyhired']}/search?q={keyword.replace(' ', '+')}&l={location.replace(' ', '+')}"
         
         try:
-            self.driver.get(search_url)
-            time.sleep(8) # Chakra UI load hone ka wait
+            self._load('simplyhired', search_url)
+            self._wait_ready('simplyhired', 'search') # Chakra UI load hone ka wait
 
             # 1. FIXED CARDS DETECTION (Using li.css-0 and data-testid)
-            # Aapki file ke mutabiq search results 'li.css-0' mein hote hain
-            titles = self.driver.find_elements(By.CSS_SELECTOR, "[data-testid='searchSerpJobTitle']")
-            cards = []
-            for t in titles:
-                try:
-                    cards.append(t.find_element(By.XPATH, "./ancestor::li[1]"))
-                except: continue
+            # Aapki file ke mutabiq search results 'li.css-0' mein hote hain (title ka ancestor li)
+            total, cards = extract_cards(self.driver, CARD_SPECS['simplyhired'], limit=5)
 
-            print(f"SimplyHired: Found {len(cards)} cards")
+            print(f"SimplyHired: Found {total} cards")
+            self._report(cards_found=total)
             
-            for card in cards[:5]:
+            for card in per_item(cards, 'card_extraction'):
                 try:
                     # --- BASIC INFO ---
-                    title_el = card.find_element(By.CSS_SELECTOR, "[data-testid='searchSerpJobTitle'] a")
-                    title = title_el.text.strip()
-                    job_link = title_el.get_attribute("href")
-                    company = card.find_element(By.CSS_SELECTOR, "[data-testid='companyName']").text.strip()
+                    title_el = card['title_el']
+                    if title_el is None or card['company'] is None:
+                        continue
+                    title = card['title'].strip()
+                    job_link = card['link']
+                    company = card['company'].strip()
 
                     # --- LOCATION EXTRACTION (Robust Logic) ---
-                    try:
-                        location_text = card.find_element(By.CSS_SELECTOR, "[data-testid='searchSerpJobLocation']").text.strip()
-                    except:
+                    if card['location'] is not None:
+                        location_text = card['location'].strip()
+                    else:
                         try:
                             # Fallback: Split by dash from card text (e.g., Company — Location)
-                            full_text = card.text
+                            full_text = card['text'] or ""
                             location_text = full_text.split("—")[1].split("\n")[0].strip() if "—" in full_text else "USA"
                         except:
                             location_text = "United States"
 
                     # --- DATE EXTRACTION ---
-                    try:
-                        date_raw = card.find_element(By.CSS_SELECTOR, "[data-testid='searchSerpJobDateStamp']").text.strip()
-                        date_text = self.parse_relative_date(date_raw) # Aapka custom parser
-                    except:
+                    if card['date'] is not None:
+                        date_text = _posted_day(card['date'].strip())
+                    else:
                         date_text = datetime.now().strftime("%Y-%m-%d")
 
                     # --- 🚀 GET FULL JOB DETAILS (HTML + TEXT) ---
                     # Click card to load the side panel
+                    # Panel pichle card ka content dikha sakta hai, isliye text change ka wait
+                    panel_selector = "div[data-testid='viewJobBodyJobFullDescriptionContent']"
+                    before = self.driver.execute_script(
+                        "var el = document.querySelector(arguments[0]); return el ? el.innerText : null;",
+                        panel_selector
+                    )
                     self.driver.execute_script("arguments[0].click();", title_el)
-                    time.sleep(4)
+                    self._wait_ready('simplyhired', 'panel', [ContentChanged(panel_selector, before)])
 
                     # Targetting the main container from your detail page file
                     description_container = self.driver.find_element(By.CSS_SELECTOR, "div[data-testid='viewJobBodyJobFullDescriptionContent']")
@@ -990,7 +1349,7 @@ class JobScraper:
                     # Clean text for simple analysis
                     description_clean = description_container.text.strip()
 
-                    jobs_data.append({
+                    self._add_job(jobs_data, {
                         "title": title,
                         "company": company,
                         "location": location_text,
@@ -1007,10 +1366,10 @@ class JobScraper:
 
         except Exception as e:
             print(f"SimplyHired Main Error: {e}")
+            self._driver_failed = True
 
         finally:
-            try: self.driver.quit()
-            except: pass      
+            self.close()      
             
         return jobs_data
         
@@ -1019,95 +1378,50 @@ class JobScraper:
         jobs_data = []
         
         # BuiltIn URL structure: Keyword aur Location dono ko query mein pass kar rahe hain
-        # 'allLocations=true' se ye pure location radius ko search karta hai
-        search_url = f"https://builtin.com/jobs?search={keyword.replace(' ', '+')}&location={location.replace(' ', '+')}&allLocations=true"
+        search_url = SEARCH_URLS['builtin'](self.base_urls['builtin'], keyword, location)
         
         try:
-            self.driver.get(search_url)
-            time.sleep(8) # Chakra/BuiltIn UI load hone ka wait
+            self._load('builtin', search_url)
+            self._wait_ready('builtin', 'search') # Chakra/BuiltIn UI load hone ka wait
 
             # 1. CARDS EXTRACTION (Using data-id from your snippet)
-            # Aapki file mein main container div[data-id="job-card"] hai
-            cards = self.driver.find_elements(By.CSS_SELECTOR, "div[data-id='job-card']")
-            
-            # Fallback agar data-id na mile
-            if not cards:
-                cards = self.driver.find_elements(By.CSS_SELECTOR, ".job-bounded-responsive")
-
-            print(f"BuiltIn: Found {len(cards)} cards for location: {location}")
-
-            for card in cards[:5]:
-                try:
-                    # --- Title & Direct Link ---
-                    # Selector: data-id="job-card-title"
-                    title_el = card.find_element(By.CSS_SELECTOR, "a[data-id='job-card-title']")
-                    title = title_el.text.strip()
-                    job_link = title_el.get_attribute("href")
-                    
-                    # --- Company ---
-                    # Selector: data-id="company-title"
-                    company = card.find_element(By.CSS_SELECTOR, "a[data-id='company-title']").text.strip()
-                    
-                    # --- Location Extraction ---
-                    # Aapke snippet mein location span.font-barlow ke andar hai
-                    try:
-                        loc_elements = card.find_elements(By.CSS_SELECTOR, "span.font-barlow")
-                        # Usually 2nd or 3rd span location hota hai
-                        job_loc = loc_elements[-1].text.strip() if loc_elements else location
-                    except:
-                        job_loc = location
-
-                    # --- Date (Posted) ---
-                    # Selector: span.bg-gray-01 (e.g., "Reposted 4 Days Ago")
-                    try:
-                        date_text = card.find_element(By.CSS_SELECTOR, "span.bg-gray-01").text.replace("Reposted", "").strip()
-                        date_text = self.parse_relative_date(date_text)
-                    except:
-                        date_text = datetime.now().strftime("%Y-%m-%d")
+            # Aapki file mein main container div[data-id="job-card"] hai, fallback .job-bounded-responsive
+            total, cards = extract_cards(self.driver, CARD_SPECS['builtin'], limit=5)
 
-                    # --- 🚀 FULL DESCRIPTION EXTRACTION (New Tab) ---
-                    main_window = self.driver.current_window_handle
-                    self.driver.execute_script(f"window.open('{job_link}', '_blank');")
-                    time.sleep(5) # Job page load hone ka wait
-                    
-                    self.driver.switch_to.window(self.driver.window_handles[1])
-                    
-                    try:
-                        # BuiltIn job description page selector
-                        desc_el = self.driver.find_element(By.CSS_SELECTOR, ".job-description")
-                        full_html = desc_el.get_attribute('innerHTML')
-                        full_text = desc_el.text.strip()
-                    except:
-                        full_html = full_text = "Description container not found"
+            print(f"BuiltIn: Found {total} cards for location: {location}")
+            self._report(cards_found=total)
 
-                    # Tab band karke wapas aao
-                    self.driver.close()
-                    self.driver.switch_to.window(main_window)
+            temp_jobs = [job for job in (builtin_card_job(card, location)
+                                         for card in per_item(cards, 'card_extraction')) if job]
 
-                    jobs_data.append({
-                        "title": title,
-                        "company": company,
-                        "location": job_loc,
-                        "posted_at": date_text,
-                        # "description_html": full_html,
-                        "description_text": full_text,
-                        "link": job_link,
-                        "platform": "BuiltIn"
-                    })
-                    print(f"✅ Scraped BuiltIn: {title} | {job_loc}")
-
-                except Exception as e:
-                    # Error aane par ensure karein ki main window par hi hain
-                    if len(self.driver.window_handles) > 1:
-                        self.driver.close()
-                        self.driver.switch_to.window(main_window)
-                    continue
+            # --- 🚀 FULL DESCRIPTION EXTRACTION (parallel tabs) ---
+            def extract_jd(driver, job):
+                try:
+                    # BuiltIn job description page selector
+                    desc_el = driver.find_element(By.CSS_SELECTOR, ".job-description")
+                    full_text = desc_el.text.strip()
+                except:
+                    full_text = "Description container not found"
+                return {"description_text": full_text}
+
+            for job in self._fetch_details('builtin', temp_jobs, extract_jd):
+                self._add_job(jobs_data, {
+                    "title": job['title'],
+                    "company": job['company'],
+                    "location": job['location'],
+                    "posted_at": job['posted_at'],
+                    # "description_html": full_html,
+                    "description_text": job['description_text'],
+                    "link": job['link'],
+                    "platform": "BuiltIn"
+                })
+                print(f"✅ Scraped BuiltIn: {job['title']} | {job['location']}")
 
         except Exception as e:
             print(f"BuiltIn Main Error: {e}")
+            self._driver_failed = True
         finally:
-            try: self.driver.quit()
-            except: pass    
+            self.close()    
         return jobs_data
     
     def careerbuilder_scrape(self, keyword, location):
@@ -1115,84 +1429,52 @@ class JobScraper:
         jobs_data = []
         
         # CareerBuilder URL structure
-        search_url = f"https://www.careerbuilder.com/jobs?keywords={keyword.replace(' ', '+')}&location={location.replace(' ', '+')}"
+        search_url = SEARCH_URLS['careerbuilder'](self.base_urls['careerbuilder'], keyword, location)
         
         try:
-            self.driver.get(search_url)
-            time.sleep(6) # Initial load wait
+            self._load('careerbuilder', search_url)
+            self._wait_ready('careerbuilder', 'search') # Initial load wait
 
             # 1. CARDS EXTRACTION
-            # CareerBuilder cards usually have a 'job-listing-item' class
-            cards = self.driver.find_elements(By.CSS_SELECTOR, ".job-listing-item")
-            
-            if not cards:
-                # Fallback selector
-                cards = self.driver.find_elements(By.CSS_SELECTOR, "li.item")
-
-            print(f"CareerBuilder: Found {len(cards)} cards")
-
-            for card in cards[:5]:
-                try:
-                    # --- Title & Direct Link ---
-                    title_el = card.find_element(By.CSS_SELECTOR, "h2.job-title a")
-                    title = title_el.text.strip()
-                    job_link = title_el.get_attribute("href")
-                    
-                    # --- Company & Location ---
-                    try:
-                        company = card.find_element(By.CSS_SELECTOR, ".company-name").text.strip()
-                    except: company = "N/A"
-                    
-                    try:
-                        loc = card.find_element(By.CSS_SELECTOR, ".job-location").text.strip()
-                    except: loc = location
-
-                    # --- Date ---
-                    try:
-                        date_text = card.find_element(By.CSS_SELECTOR, ".job-post-date").text.strip()
-                    except: date_text = "Recently"
-
-                    # --- 🚀 FULL DESCRIPTION EXTRACTION (Navigating to Link) ---
-                    # CareerBuilder par hum seedha link par ja sakte hain
-                    main_window = self.driver.current_window_handle
-                    self.driver.execute_script(f"window.open('{job_link}', '_blank');")
-                    time.sleep(5)
-                    self.driver.switch_to.window(self.driver.window_handles[1])
-                    
-                    try:
-                        # CareerBuilder description selector
-                        desc_el = self.driver.find_element(By.ID, "job-description")
-                        if not desc_el:
-                            desc_el = self.driver.find_element(By.CLASS_NAME, "jdp-description-details")
-                            
-                        full_html = desc_el.get_attribute('innerHTML')
-                        full_text = desc_el.text.strip()
-                    except:
-                        full_html = full_text = "Description not found"
-
-                    self.driver.close()
-                    self.driver.switch_to.window(main_window)
-
-                    jobs_data.append({
-                        "title": title,
-                        "company": company,
-                        "location": loc,
-                        "posted_at": date_text,
-                        "description_html": full_html,
-                        "description_text": full_text,
-                        "link": job_link,
-                        "platform": "CareerBuilder"
-                    })
-                    print(f"✅ CareerBuilder: {title} | {company}")
-
-                except Exception as e:
-                    if len(self.driver.window_handles) > 1:
-                        self.driver.close()
-                        self.driver.switch_to.window(main_window)
-                    continue
+            # CareerBuilder cards usually have a 'job-listing-item' class (fallback li.item)
+            total, cards = extract_cards(self.driver, CARD_SPECS['careerbuilder'], limit=5)
+
+            print(f"CareerBuilder: Found {total} cards")
+            self._report(cards_found=total)
+
+            temp_jobs = [job for job in (careerbuilder_card_job(card, location)
+                                         for card in per_item(cards, 'card_extraction')) if job]
+
+            # --- 🚀 FULL DESCRIPTION EXTRACTION (parallel tabs) ---
+            def extract_jd(driver, job):
+                # CareerBuilder description selector (ID, warna class)
+                desc_els = driver.find_elements(By.ID, "job-description") or \
+                           driver.find_elements(By.CLASS_NAME, "jdp-description-details")
+                if not desc_els:
+                    return {"description_html": "Description not found", "description_text": "Description not found"}
+                return {
+                    "description_html": desc_els[0].get_attribute('innerHTML'),
+                    "description_text": desc_els[0].text.strip()
+                }
+
+            for job in self._fetch_details('careerbuilder', temp_jobs, extract_jd):
+                self._add_job(jobs_data, {
+                    "title": job['title'],
+                    "company": job['company'],
+                    "location": job['location'],
+                    "posted_at": job['posted_at'],
+                    "description_html": job['description_html'],
+                    "description_text": job['description_text'],
+                    "link": job['link'],
+                    "platform": "CareerBuilder"
+                })
+                print(f"✅ CareerBuilder: {job['title']} | {job['company']}")
 
         except Exception as e:
             print(f"CareerBuilder Main Error: {e}")
+            self._driver_failed = True
+        finally:
+            self.close()
             
         return jobs_data
 # --- MAIN EXECUTION ---
@@ -0,0 +1,157 @@
+import json
+import logging
+import threading
+from collections import Counter
+from typing import Dict, List, NamedTuple, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Network.setBlockedURLs wildcard patterns, resource class ke hisaab se
+RESOURCE_PATTERNS = {
+    'image': ('*.png', '*.jpg', '*.jpeg', '*.gif', '*.webp', '*.svg', '*.ico', '*.avif', '*.bmp'),
+    'font': ('*.woff', '*.woff2', '*.ttf', '*.otf', '*.eot', '*fonts.googleapis.com*', '*fonts.gstatic.com*'),
+    'stylesheet': ('*.css', '*.css?*'),
+    'media': ('*.mp4', '*.webm', '*.m3u8', '*.mp3', '*.ogg', '*.mov', '*youtube.com/embed*', '*player.vimeo.com*'),
+    'analytics': (
+        '*google-analytics.com*', '*googletagmanager.com*', '*analytics.google.com*', '*hotjar.com*',
+        '*segment.com*', '*segment.io*', '*mixpanel.com*', '*amplitude.com*', '*fullstory.com*',
+        '*clarity.ms*', '*newrelic.com*', '*nr-data.net*', '*sentry.io*', '*optimizely.com*',
+        '*bat.bing.com*', '*connect.facebook.net*', '*snap.licdn.com*', '*px.ads.linkedin.com*',
+        '*scorecardresearch.com*', '*quantserve.com*', '*heapanalytics.com*',
+    ),
+    'ads': (
+        '*doubleclick.net*', '*googlesyndication.com*', '*adservice.google.com*', '*amazon-adsystem.com*',
+        '*adsrvr.org*', '*criteo.com*', '*criteo.net*', '*taboola.com*', '*outbrain.com*', '*adnxs.com*',
+        '*rubiconproject.com*', '*pubmatic.com*', '*casalemedia.com*',
+    ),
+}
+
+DEFAULT_BLOCK = ('image', 'font', 'stylesheet', 'media', 'analytics', 'ads')
+
+# CDP resource type -> hamari class (bytes saved estimate ke liye)
+CDP_TYPE_CLASS = {'Image': 'image', 'Font': 'font', 'Stylesheet': 'stylesheet', 'Media': 'media'}
+
+# Jab tak koi real sample na mile, har class ka approx size (bytes)
+DEFAULT_SIZES = {
+    'image': 30 * 1024, 'font': 40 * 1024, 'stylesheet': 30 * 1024, 'media': 500 * 1024,
+    'analytics': 40 * 1024, 'ads': 60 * 1024, 'other': 20 * 1024,
+}
+
+
+class BlockProfile(NamedTuple):
+    """
+    Which resource classes a platform blocks. `allow` drops every blocklist
+    entry containing one of its substrings (setBlockedURLs has no
+    exceptions), `extra` adds site-specific URL patterns.
+    """
+    block: Tuple[str, ...] = DEFAULT_BLOCK
+    allow: Tuple[str, ...] = ()
+    extra: Tuple[str, ...] = ()
+
+    def patterns(self) -> List[str]:
+        patterns = [p for cls in self.block for p in RESOURCE_PATTERNS[cls]] + list(self.extra)
+        return [p for p in dict.fromkeys(patterns) if not any(a in p for a in self.allow)]
+
+
+def classify(url: str, cdp_type: str = '') -> str:
+    lowered = url.lower()
+    for cls in ('analytics', 'ads'):
+        if any(p.strip('*') in lowered for p in RESOURCE_PATTERNS[cls]):
+            return cls
+    return CDP_TYPE_CLASS.get(cdp_type, 'other')
+
+
+def apply_blocking(driver, profile: BlockProfile):
+    driver.execute_cdp_cmd('Network.enable', {})
+    driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': profile.patterns()})
+
+
+def clear_blocking(driver):
+    driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': []})
+
+
+def read_network_log(driver) -> Dict:
+    """
+    Drains chromedriver's performance log and summarizes it: requests and
+    bytes actually downloaded, and requests blocked by setBlockedURLs per
+    resource class.
+    """
+    summary = {'requests': 0, 'bytes_downloaded': 0, 'blocked': Counter(), 'downloaded_by_class': Counter(),
+               'finished_by_class': Counter()}
+    try:
+        entries = driver.get_log('performance')
+    except Exception as e:
+        logger.debug(f"Performance log unavailable: {e}")
+        return summary
+
+    requests = {}
+    for entry in entries:
+        try:
+            message = json.loads(entry['message'])['message']
+        except (KeyError, TypeError, ValueError):
+            continue
+        method, params = message.get('method'), message.get('params', {})
+        if method == 'Network.requestWillBeSent':
+            requests[params.get('requestId')] = classify(params.get('request', {}).get('url', ''), params.get('type', ''))
+        elif method == 'Network.loadingFinished':
+            cls = requests.get(params.get('requestId'), 'other')
+            size = int(params.get('encodedDataLength') or 0)
+            summary['requests'] += 1
+            summary['bytes_downloaded'] += size
+            summary['downloaded_by_class'][cls] += size
+            summary['finished_by_class'][cls] += 1
+        elif method == 'Network.loadingFailed' and params.get('blockedReason') == 'inspector':
+            summary['blocked'][requests.get(params.get('requestId'), 'other')] += 1
+    return summary
+
+
+class BlockStats:
+    """Per-platform totals for /health, with bytes-saved estimates from observed average sizes."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._platforms: Dict[str, Dict] = {}
+        self._size_totals = Counter()
+        self._size_counts = Counter()
+
+    def _avg_size(self, cls: str) -> float:
+        if self._size_counts[cls]:
+            return self._size_totals[cls] / self._size_counts[cls]
+        return DEFAULT_SIZES.get(cls, DEFAULT_SIZES['other'])
+
+    def record(self, platform: str, summary: Dict) -> Dict:
+        """Adds one scrape's network summary and returns that scrape's report."""
+        with self._lock:
+            # Unblocked downloads se har class ka average size seekho
+            self._size_totals.update(summary['downloaded_by_class'])
+            self._size_counts.update(summary['finished_by_class'])
+            saved = int(sum(count * self._avg_size(cls) for cls, count in summary['blocked'].items()))
+
+            report = {
+                'requests': summary['requests'],
+                'bytes_downloaded': summary['bytes_downloaded'],
+                'blocked_requests': sum(summary['blocked'].values()),
+                'blocked_by_class': dict(summary['blocked']),
+                'estimated_bytes_saved': saved,
+            }
+            entry = self._platforms.setdefault(platform, {
+                'scrapes': 0, 'requests': 0, 'bytes_downloaded': 0, 'blocked_requests': 0,
+                'blocked_by_class': Counter(), 'estimated_bytes_saved': 0,
+            })
+            entry['scrapes'] += 1
+            entry['requests'] += report['requests']
+            entry['bytes_downloaded'] += report['bytes_downloaded']
+            entry['blocked_requests'] += report['blocked_requests']
+            entry['blocked_by_class'].update(summary['blocked'])
+            entry['estimated_bytes_saved'] += saved
+        return report
+
+    def snapshot(self) -> Dict:
+        with self._lock:
+            return {
+                platform: {**entry, 'blocked_by_class': dict(entry['blocked_by_class'])}
+                for platform, entry in self._platforms.items()
+            }
+
+
+block_stats = BlockStats()
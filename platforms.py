@@ -0,0 +1,254 @@
+import logging
+import os
+import threading
+import time
+from typing import Callable, Dict, NamedTuple, Optional, Tuple
+
+from http_fast import FAST_PATH, FastPathUnavailable, HttpJobScraper, fast_path_stats
+from job_store import job_store
+from metrics import JOBS_TOTAL, SCRAPE_SECONDS, SCRAPES_TOTAL, current_platform
+from tracing import span
+from scraper import LinkedInJobScraper
+from multi_platform import SEARCH_URLS, JobScraper, launch_mode_for
+
+
+logger = logging.getLogger(__name__)
+
+# Har scrape ka output local job store mein (/jobs route wahi se answer karta hai)
+STORE_JOBS = os.environ.get('JOB_STORE', '1') == '1'
+
+
+class PlatformSpec(NamedTuple):
+    name: str
+    run: Callable
+    keyword_required: bool = False
+    location_required: bool = False
+    default_keyword: str = ''
+    default_location: str = ''
+    echo_query: bool = False
+    deadline: float = 90
+    # fast(keyword, location, pages, days, on_progress, on_job): Chrome ke bina HTTP scrape,
+    # FastPathUnavailable raise kare to run() (browser) chalta hai
+    fast: Optional[Callable] = None
+    browser: bool = True
+
+
+def _job_scraper(platform: str, pool, on_progress, on_job) -> JobScraper:
+    # Platform ke launch mode wala browser (pool group ho to usi mode ke pool se)
+    return JobScraper(pool=pool, on_progress=on_progress, on_job=on_job, launch_mode=launch_mode_for(platform))
+
+
+def _plus(text: str) -> str:
+    return text.replace(' ', '+')
+
+
+def _run_linkedin(keyword, location, pages, days, pool, on_progress, on_job):
+    scraper = LinkedInJobScraper(max_pages=pages, days_filter=days, on_progress=on_progress, on_job=on_job)
+    return scraper.scrape_jobs(location=location, keyword=keyword)
+
+
+def _run_linkedin_browser(keyword, location, pages, days, pool, on_progress, on_job):
+    return _job_scraper('linkedin', pool, on_progress, on_job).linkedin_scrape(keyword, location)
+
+
+def _run_dice(keyword, location, pages, days, pool, on_progress, on_job):
+    url = SEARCH_URLS['dice']("https://www.dice.com", keyword, location)
+    return _job_scraper('dice', pool, on_progress, on_job).dice_scrape(url)
+
+
+def _run_indeed(keyword, location, pages, days, pool, on_progress, on_job):
+    # q = keyword, l = location
+    url = f"https://www.indeed.com/jobs?q={_plus(keyword)}&l={_plus(location)}"
+    return _job_scraper('indeed', pool, on_progress, on_job).indeed_scrape(url)
+
+
+def _run_ziprecruiter(keyword, location, pages, days, pool, on_progress, on_job):
+    # Note: .com uses 'search' and 'location' parameters
+    url = f"https://www.ziprecruiter.com/jobs-search?search={keyword}&location={location}"
+    return _job_scraper('ziprecruiter', pool, on_progress, on_job).ziprecruiter_scrape(url, keyword, location)
+
+
+def _run_hiringcafe(keyword, location, pages, days, pool, on_progress, on_job):
+    # Base URL (Scraper khud navigate karega)
+    return _job_scraper('hiringcafe', pool, on_progress, on_job).hiringcafe_scrape(
+        "https://hiring.cafe/", keyword=keyword, location=location
+    )
+
+
+def _run_glassdoor(keyword, location, pages, days, pool, on_progress, on_job):
+    return _job_scraper('glassdoor', pool, on_progress, on_job).glassdoor_scrape(keyword, location)
+
+
+def _run_simplyhired(keyword, location, pages, days, pool, on_progress, on_job):
+    return _job_scraper('simplyhired', pool, on_progress, on_job).simplyhired_scrape(keyword, location)
+
+
+def _run_builtin(keyword, location, pages, days, pool, on_progress, on_job):
+    return _job_scraper('builtin', pool, on_progress, on_job).builtin_scrape(keyword, location)
+
+
+def _run_careerbuilder(keyword, location, pages, days, pool, on_progress, on_job):
+    return _job_scraper('careerbuilder', pool, on_progress, on_job).careerbuilder_scrape(keyword, location)
+
+
+# --- HTTP fast paths (server-rendered search pages) ---
+def _fast_linkedin_browser(keyword, location, pages, days, on_progress, on_job):
+    return HttpJobScraper(on_progress=on_progress, on_job=on_job).linkedin_scrape(keyword, location)
+
+
+def _fast_builtin(keyword, location, pages, days, on_progress, on_job):
+    return HttpJobScraper(on_progress=on_progress, on_job=on_job).builtin_scrape(keyword, location)
+
+
+def _fast_careerbuilder(keyword, location, pages, days, on_progress, on_job):
+    return HttpJobScraper(on_progress=on_progress, on_job=on_job).careerbuilder_scrape(keyword, location)
+
+
+# deadline = /search fan-out mein platform ka max wall-clock time (seconds)
+PLATFORMS: Dict[str, PlatformSpec] = {
+    'linkedin': PlatformSpec('LinkedIn', _run_linkedin, location_required=True, deadline=30, browser=False),
+    'linkedin_browser': PlatformSpec('LinkedIn', _run_linkedin_browser,
+                                     default_keyword='Data Analyst', default_location='USA', deadline=60,
+                                     fast=_fast_linkedin_browser),
+    'dice': PlatformSpec('Dice', _run_dice, keyword_required=True, default_location='Remote',
+                         echo_query=True, deadline=45),
+    'indeed': PlatformSpec('Indeed', _run_indeed, keyword_required=True, default_location='Remote', deadline=75),
+    'ziprecruiter': PlatformSpec('ZipRecruiter', _run_ziprecruiter, keyword_required=True,
+                                 default_location='USA', deadline=60),
+    'hiringcafe': PlatformSpec('Hiring.cafe', _run_hiringcafe, keyword_required=True, deadline=90),
+    'glassdoor': PlatformSpec('Glassdoor', _run_glassdoor, default_keyword='Data Analyst', deadline=75),
+    'simplyhired': PlatformSpec('SimplyHired', _run_simplyhired, default_keyword='Data Analyst', deadline=60),
+    'builtin': PlatformSpec('BuiltIn', _run_builtin, default_keyword='Data Analyst', deadline=60,
+                            fast=_fast_builtin),
+    'careerbuilder': PlatformSpec('CareerBuilder', _run_careerbuilder,
+                                  default_keyword='AI Developer', default_location='USA', deadline=60,
+                                  fast=_fast_careerbuilder),
+}
+
+# /search default: har board ek baar (LinkedIn requests-based scraper se)
+SEARCH_PLATFORMS = ('linkedin', 'dice', 'indeed', 'ziprecruiter', 'hiringcafe',
+                    'glassdoor', 'simplyhired', 'builtin', 'careerbuilder')
+
+
+def validate_params(platform: str, keyword: str, location: str) -> Optional[str]:
+    spec = PLATFORMS.get(platform)
+    if spec is None:
+        return f"Unknown platform '{platform}'. Available: {', '.join(PLATFORMS)}"
+    if spec.keyword_required and not (keyword or spec.default_keyword):
+        return 'Keyword parameter is required'
+    if spec.location_required and not (location or spec.default_location):
+        return 'Location parameter is required'
+    return None
+
+
+def resolve_params(platform: str, keyword: str, location: str) -> Tuple[str, str]:
+    spec = PLATFORMS[platform]
+    return keyword or spec.default_keyword, location or spec.default_location
+
+
+# Abhi chal rahe scrapes (pooled, non-pooled aur HTTP fast path sab), prewarm ka busy check
+_in_flight = 0
+_in_flight_lock = threading.Lock()
+
+
+def scrapes_in_flight() -> int:
+    with _in_flight_lock:
+        return _in_flight
+
+
+def _track_in_flight(delta: int):
+    global _in_flight
+    with _in_flight_lock:
+        _in_flight += delta
+
+
+def run_scrape(platform: str, keyword: str = '', location: str = '', pages: int = 3, days: int = 7,
+               pool=None, on_progress: Optional[Callable[[Dict], None]] = None,
+               on_job: Optional[Callable[[Dict], None]] = None) -> Dict:
+    """
+    Runs one platform scrape and returns the same JSON payload the
+    platform's Flask route responds with. on_job is called with each job
+    as soon as it is extracted. Jobs are also written to the job store.
+    Platforms with a fast path are tried over plain HTTP first; the payload's
+    served_by says whether HTTP or Chrome produced it.
+    """
+    spec = PLATFORMS[platform]
+    keyword, location = resolve_params(platform, keyword, location)
+
+    # Is scrape ke saare stage timings isi platform ke label par (pool/launch/waits sab)
+    token = current_platform.set(platform)
+    start = time.perf_counter()
+    _track_in_flight(1)
+    try:
+        with span('scrape', platform=platform, keyword=keyword, location=location):
+            payload = _scrape(platform, spec, keyword, location, pages, days, pool, on_progress, on_job)
+    except Exception:
+        SCRAPES_TOTAL.inc(platform=platform, served_by='browser' if spec.browser else 'http', outcome='error')
+        raise
+    finally:
+        _track_in_flight(-1)
+        current_platform.reset(token)
+    jobs = payload.get('jobs') or []
+    SCRAPE_SECONDS.observe(time.perf_counter() - start, platform=platform, served_by=payload['served_by'])
+    SCRAPES_TOTAL.inc(platform=platform, served_by=payload['served_by'], outcome='ok' if jobs else 'empty')
+    JOBS_TOTAL.inc(len(jobs), platform=platform)
+
+    if STORE_JOBS and jobs:
+        # Store fail ho to bhi scrape ka response jaana chahiye
+        try:
+            job_store.ingest(platform, spec.name, jobs)
+        except Exception as e:
+            logger.warning(f"Job store ingest failed for {platform}: {e}")
+    return payload
+
+
+def _scrape(platform: str, spec: PlatformSpec, keyword: str, location: str, pages: int, days: int,
+            pool, on_progress, on_job) -> Dict:
+    result, fallback = None, None
+    served_by = 'browser' if spec.browser else 'http'
+    start = time.perf_counter()
+    if spec.fast is not None and FAST_PATH:
+        emitted = [0]
+
+        def fast_on_job(job):
+            emitted[0] += 1
+            if on_job:
+                on_job(job)
+
+        try:
+            with span('http_fast_path', platform=platform):
+                result = spec.fast(keyword, location, pages, days, on_progress, fast_on_job)
+            served_by = 'http'
+        except FastPathUnavailable as e:
+            # Koi job emit hone se pehle hi raise hota hai, browser run duplicates nahi bhejega
+            fallback = e.reason
+            logger.info(f"{platform}: HTTP fast path unavailable ({e.reason}), using Chrome")
+            start = time.perf_counter()
+        except Exception as e:
+            # Parser/network ka unexpected error: jab tak koi job nahi gayi, Chrome se retry safe hai
+            if emitted[0]:
+                raise
+            fallback = f"error: {type(e).__name__}"
+            logger.warning(f"{platform}: HTTP fast path failed ({type(e).__name__}: {e}), using Chrome")
+            start = time.perf_counter()
+    if result is None:
+        with span('browser_scrape' if spec.browser else 'http_scrape', platform=platform):
+            result = spec.run(keyword, location, pages, days, pool, on_progress, on_job)
+    fast_path_stats.record(platform, served_by, time.perf_counter() - start, fallback)
+
+    if isinstance(result, dict):
+        payload = result
+    else:
+        payload = {
+            'success': True,
+            'platform': spec.name,
+        }
+        if spec.echo_query:
+            payload['keyword'] = keyword
+            payload['location'] = location
+        payload['total_jobs'] = len(result)
+        payload['jobs'] = result
+    payload['served_by'] = served_by
+    if fallback:
+        payload['fast_path_fallback'] = fallback
+    return payload
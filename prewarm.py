@@ -0,0 +1,237 @@
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Callable, Dict, List, Optional, Tuple
+
+from platforms import PLATFORMS
+from result_cache import ResultCache, cache_key
+
+logger = logging.getLogger(__name__)
+
+# Opt-in: apne aap Chrome launch karta hai, isliye default band
+PREWARM_ENABLED = os.environ.get('PREWARM', '0') == '1'
+# Har itne seconds mein ek refresh cycle
+PREWARM_INTERVAL = float(os.environ.get('PREWARM_INTERVAL', 300))
+# Ek cycle mein zyada se zyada itni hot queries
+PREWARM_TOP = int(os.environ.get('PREWARM_TOP', 10))
+# Decayed hit score jiske neeche query pre-warm nahi hoti (ek-do baar wali queries par browser waste nahi)
+PREWARM_MIN_SCORE = float(os.environ.get('PREWARM_MIN_SCORE', 3))
+# Purane hits ka weight aadha hone ka time
+PREWARM_HALF_LIFE = float(os.environ.get('PREWARM_HALF_LIFE', 6 * 3600))
+# Off-peak ghante (local time), e.g. "1-6" ya "22-6"; khaali = koi bhi ghanta (jab koi user scrape na chal raha ho)
+PREWARM_HOURS = os.environ.get('PREWARM_HOURS', '1-6')
+PREWARM_CONCURRENCY = int(os.environ.get('PREWARM_CONCURRENCY', 1))
+# Ek cycle mein Chrome wale refreshes ki limit (HTTP-only platforms is budget se bahar)
+PREWARM_BROWSER_BUDGET = int(os.environ.get('PREWARM_BROWSER_BUDGET', 2))
+# Entry TTL ka itna hissa guzar jaye to refresh (expire hone se pehle hi)
+PREWARM_REFRESH_AT = float(os.environ.get('PREWARM_REFRESH_AT', 0.8))
+
+
+def parse_hours(spec: str) -> Optional[Tuple[int, int]]:
+    """Parses "1-6" into (1, 6), end exclusive; "22-6" wraps past midnight. Empty means any hour (None)."""
+    spec = (spec or '').strip()
+    if not spec:
+        return None
+    start, _, end = spec.partition('-')
+    return int(start) % 24, int(end or start) % 24
+
+
+def in_window(hours: Optional[Tuple[int, int]], now: Optional[datetime] = None) -> bool:
+    if hours is None:
+        return True
+    hour = (now or datetime.now()).hour
+    start, end = hours
+    if start == end:
+        return True
+    return start <= hour < end if start < end else hour >= start or hour < end
+
+
+class QueryTracker:
+    """
+    Exponentially decayed hit counts per (platform, keyword, location,
+    pages, days) cache key of user-facing scrapes. Keeps the first-seen
+    spelling of keyword/location so refreshes scrape what users typed.
+    """
+
+    def __init__(self, half_life: float = PREWARM_HALF_LIFE, max_queries: int = 1000):
+        self.half_life = half_life
+        self.max_queries = max_queries
+        self._lock = threading.Lock()
+        self._queries: Dict[Tuple, Dict] = {}
+
+    def _decayed(self, entry: Dict, now: float) -> float:
+        return entry['score'] * 0.5 ** ((now - entry['updated']) / self.half_life)
+
+    def record(self, platform: str, keyword: str, location: str, pages: int, days: int):
+        key = cache_key(platform, keyword, location, pages, days)
+        now = time.time()
+        with self._lock:
+            entry = self._queries.get(key)
+            if entry is None:
+                entry = self._queries[key] = {
+                    'platform': platform, 'keyword': keyword, 'location': location,
+                    'pages': pages, 'days': days, 'score': 0.0, 'updated': now, 'hits': 0,
+                }
+            entry['score'] = self._decayed(entry, now) + 1
+            entry['updated'] = now
+            entry['hits'] += 1
+            if len(self._queries) > self.max_queries:
+                # Sabse thandi queries hatao
+                coldest = sorted(self._queries, key=lambda k: self._decayed(self._queries[k], now))
+                for old in coldest[:len(self._queries) - self.max_queries]:
+                    del self._queries[old]
+
+    def hottest(self, limit: int, min_score: float = 0.0) -> List[Tuple[Tuple, Dict]]:
+        """[(cache key, query)] by decayed score, highest first."""
+        now = time.time()
+        with self._lock:
+            scored = [(self._decayed(entry, now), key, dict(entry)) for key, entry in self._queries.items()]
+        scored = [item for item in scored if item[0] >= min_score]
+        scored.sort(key=lambda item: item[0], reverse=True)
+        result = []
+        for score, key, entry in scored[:limit]:
+            entry['score'] = round(score, 3)
+            result.append((key, entry))
+        return result
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._queries)
+
+
+class PrewarmScheduler:
+    """
+    Background thread that periodically re-runs the hottest tracked
+    queries whose cached result is missing or near expiry, so user
+    requests are served warm. A cycle only runs inside the off-peak
+    hours and while is_busy() is false; each cycle is capped at `top`
+    queries, `concurrency` parallel scrapes and `browser_budget`
+    Chrome-backed scrapes. `active` counts the scheduler's own in-flight
+    refreshes, so is_busy() can tell them apart from user scrapes.
+    """
+
+    def __init__(self, tracker: QueryTracker, cache: ResultCache, runner: Callable[..., Dict],
+                 is_busy: Optional[Callable[[], bool]] = None, interval: float = PREWARM_INTERVAL,
+                 top: int = PREWARM_TOP, min_score: float = PREWARM_MIN_SCORE, hours: str = PREWARM_HOURS,
+                 concurrency: int = PREWARM_CONCURRENCY, browser_budget: int = PREWARM_BROWSER_BUDGET,
+                 refresh_at: float = PREWARM_REFRESH_AT):
+        self.tracker = tracker
+        self.cache = cache
+        self.runner = runner
+        self.is_busy = is_busy or (lambda: False)
+        self.interval = interval
+        self.top = top
+        self.min_score = min_score
+        self.hours = parse_hours(hours)
+        self.concurrency = max(concurrency, 1)
+        self.browser_budget = max(browser_budget, 0)
+        self.refresh_at = refresh_at
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self.active = 0
+        self._stats = {
+            'cycles': 0, 'skipped_off_window': 0, 'skipped_busy': 0, 'refreshes': 0, 'refresh_errors': 0,
+            'empty_results': 0, 'deferred_browser_budget': 0, 'refresh_seconds_total': 0.0, 'last_cycle_at': None,
+        }
+
+    def start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._loop, name='prewarm', daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+
+    def _loop(self):
+        while not self._stop.wait(self.interval):
+            try:
+                self.run_once()
+            except Exception as e:
+                logger.error(f"Prewarm cycle failed: {e}")
+
+    def _count(self, name: str, amount: float = 1):
+        with self._lock:
+            self._stats[name] += amount
+
+    def _count_active(self, delta: int):
+        with self._lock:
+            self.active += delta
+
+    def _due(self, key: Tuple) -> bool:
+        cached = self.cache.peek(key)
+        return cached is None or cached[1] >= self.cache.ttl(key) * self.refresh_at
+
+    def candidates(self) -> List[Tuple[Tuple, Dict]]:
+        """Hot queries that need a refresh, within the browser budget."""
+        selected, browsers = [], 0
+        for key, query in self.tracker.hottest(self.top, self.min_score):
+            spec = PLATFORMS.get(query['platform'])
+            if spec is None or not self._due(key):
+                continue
+            if spec.browser:
+                if browsers >= self.browser_budget:
+                    self._count('deferred_browser_budget')
+                    continue
+                browsers += 1
+            selected.append((key, query))
+        return selected
+
+    def run_once(self) -> int:
+        """One refresh cycle; returns how many queries were refreshed."""
+        if not in_window(self.hours):
+            self._count('skipped_off_window')
+            return 0
+        if self.is_busy():
+            self._count('skipped_busy')
+            return 0
+        selected = self.candidates()
+        self._count('cycles')
+        with self._lock:
+            self._stats['last_cycle_at'] = datetime.now().isoformat(timespec='seconds')
+        if not selected:
+            return 0
+        logger.info(f"Prewarm: refreshing {len(selected)} hot queries")
+        with ThreadPoolExecutor(max_workers=min(self.concurrency, len(selected)),
+                                thread_name_prefix='prewarm') as executor:
+            return sum(executor.map(self._refresh, selected))
+
+    def _refresh(self, item: Tuple[Tuple, Dict]) -> int:
+        key, query = item
+        if self._stop.is_set() or self.is_busy():
+            # User traffic aa gaya: baaki refreshes agle cycle mein
+            self._count('skipped_busy')
+            return 0
+        self._count_active(1)
+        start = time.perf_counter()
+        try:
+            payload = self.runner(query['platform'], query['keyword'], query['location'],
+                                  pages=query['pages'], days=query['days'])
+        except Exception as e:
+            logger.warning(f"Prewarm refresh failed for {key}: {e}")
+            self._count('refresh_errors')
+            return 0
+        finally:
+            self._count('refresh_seconds_total', time.perf_counter() - start)
+            self._count_active(-1)
+        # Khaali/blocked result cache nahi hota (put khud check karta hai), purana entry hi rehta hai
+        self.cache.put(key, payload)
+        self._count('refreshes')
+        if not (isinstance(payload, dict) and payload.get('total_jobs')):
+            self._count('empty_results')
+        return 1
+
+    def stats(self) -> Dict:
+        with self._lock:
+            stats = dict(self._stats)
+        stats['refresh_seconds_total'] = round(stats['refresh_seconds_total'], 3)
+        stats['tracked_queries'] = len(self.tracker)
+        stats['active'] = self.active
+        stats['hottest'] = [
+            {k: query[k] for k in ('platform', 'keyword', 'location', 'score', 'hits')}
+            for _, query in self.tracker.hottest(5)
+        ]
+        return stats
@@ -0,0 +1,227 @@
+import logging
+import os
+import shutil
+import subprocess
+import tempfile
+import threading
+import time
+import uuid
+from typing import Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+PROFILE_ROOT = os.environ.get('PROFILE_ROOT', os.path.join(BASE_DIR, 'profiles'))
+
+# Chrome ke per-process lock files, clone mein aaye to naya browser "profile in use" bolta hai
+SINGLETON_FILES = ('SingletonLock', 'SingletonSocket', 'SingletonCookie', 'lockfile')
+
+# Plain copy mein ye caches skip (login profile ka ~80% size yahi hai); reflink mein free hain
+CACHE_DIRS = frozenset((
+    'Cache', 'Code Cache', 'GPUCache', 'GrShaderCache', 'ShaderCache', 'DawnGraphiteCache',
+    'DawnWebGPUCache', 'component_crx_cache', 'Crashpad',
+))
+
+
+def _reflink_copy(src: str, dst: str) -> bool:
+    # btrfs/xfs par copy-on-write clone: size se independent, template safe rehta hai
+    try:
+        result = subprocess.run(['cp', '-a', '--reflink=always', src, dst],
+                                stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    except OSError:
+        return False
+    if result.returncode != 0:
+        shutil.rmtree(dst, ignore_errors=True)
+        return False
+    return True
+
+
+def _plain_copy(src: str, dst: str):
+    shutil.copytree(src, dst, symlinks=True,
+                    ignore=lambda d, names: [n for n in names if n in CACHE_DIRS or n in SINGLETON_FILES])
+
+
+def _lock_pid(profile_dir: str) -> Optional[int]:
+    # Chrome SingletonLock symlink banata hai: "<hostname>-<pid>"
+    try:
+        target = os.readlink(os.path.join(profile_dir, 'SingletonLock'))
+        return int(target.rsplit('-', 1)[1])
+    except (OSError, IndexError, ValueError):
+        return None
+
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+class ProfileManager:
+    """
+    Keeps pre-initialized Chrome profile templates and hands out per-run
+    clones (reflink when the filesystem supports it, plain copy without
+    caches otherwise). Clones whose browser is gone are garbage collected.
+    """
+
+    def __init__(self, root: str = PROFILE_ROOT, gc_interval: float = 300, gc_grace: float = 120):
+        self.root = root
+        self.runs_dir = os.path.join(root, 'runs')
+        self.gc_interval = gc_interval
+        self.gc_grace = gc_grace
+        self._templates: Dict[str, str] = {}
+        self._initializers: Dict[str, Callable[[str], None]] = {}
+        self._lock = threading.Lock()
+        self._template_locks: Dict[str, threading.Lock] = {}
+        self._last_gc = 0.0
+        self._reflink_ok = True
+        self._stats = {
+            'clones': 0,
+            'reflink_clones': 0,
+            'copy_clones': 0,
+            'empty_clones': 0,
+            'clone_seconds_total': 0.0,
+            'template_inits': 0,
+            'template_init_failures': 0,
+            'gc_removed': 0,
+        }
+
+    # --- Templates ---
+    def register(self, name: str, path: Optional[str] = None, initializer: Optional[Callable[[str], None]] = None):
+        """
+        path: existing profile dir to use as the template (e.g. login.py's).
+        initializer(path): builds the template on first use when it is missing.
+        """
+        with self._lock:
+            self._templates[name] = path or os.path.join(self.root, 'templates', name)
+            if initializer:
+                self._initializers[name] = initializer
+            self._template_locks.setdefault(name, threading.Lock())
+
+    def template_path(self, name: str) -> str:
+        return self._templates[name]
+
+    def ensure_template(self, name: str) -> Optional[str]:
+        path = self._templates[name]
+        if os.path.isdir(path):
+            return path
+        initializer = self._initializers.get(name)
+        if initializer is None:
+            return None
+
+        with self._template_locks[name]:
+            if os.path.isdir(path):
+                return path
+            # Temp dir mein banao, phir atomic rename (aadha bana template kabhi clone na ho)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            staging = f"{path}.init-{uuid.uuid4().hex[:8]}"
+            start = time.perf_counter()
+            try:
+                initializer(staging)
+                self._strip_singletons(staging)
+                os.rename(staging, path)
+            except Exception as e:
+                shutil.rmtree(staging, ignore_errors=True)
+                with self._lock:
+                    self._stats['template_init_failures'] += 1
+                logger.warning(f"Profile template '{name}' init failed: {e}")
+                return None
+            with self._lock:
+                self._stats['template_inits'] += 1
+            logger.info(f"Profile template '{name}' ready in {time.perf_counter() - start:.2f}s")
+            return path
+
+    # --- Clones ---
+    def clone(self, name: str) -> str:
+        """Returns a fresh per-run profile dir cloned from template `name` (empty dir if it has none)."""
+        self._maybe_gc()
+        os.makedirs(self.runs_dir, exist_ok=True)
+        template = self.ensure_template(name)
+        start = time.perf_counter()
+
+        if template is None:
+            method = 'empty'
+            dst = tempfile.mkdtemp(prefix=f"{name}-", dir=self.runs_dir)
+        else:
+            dst = os.path.join(self.runs_dir, f"{name}-{uuid.uuid4().hex[:12]}")
+            if self._reflink_ok and _reflink_copy(template, dst):
+                method = 'reflink'
+                self._strip_singletons(dst)
+            else:
+                # Ek baar reflink fail hua to filesystem support nahi karta, dobara try mat karo
+                self._reflink_ok = False
+                method = 'copy'
+                _plain_copy(template, dst)
+            # cp -a template ka mtime le aata hai; GC grace naye clone se shuru ho
+            os.utime(dst)
+
+        with self._lock:
+            self._stats['clones'] += 1
+            self._stats[f'{method}_clones'] += 1
+            self._stats['clone_seconds_total'] += time.perf_counter() - start
+        return dst
+
+    def release(self, path: str):
+        if os.path.dirname(os.path.abspath(path)) == os.path.abspath(self.runs_dir):
+            shutil.rmtree(path, ignore_errors=True)
+
+    @staticmethod
+    def _strip_singletons(path: str):
+        for name in SINGLETON_FILES:
+            try:
+                os.remove(os.path.join(path, name))
+            except OSError:
+                pass
+
+    # --- Garbage collection ---
+    def gc(self) -> int:
+        """Removes clones whose browser has exited (or never started within gc_grace seconds)."""
+        removed = 0
+        try:
+            entries = os.listdir(self.runs_dir)
+        except OSError:
+            return 0
+        now = time.time()
+        for entry in entries:
+            path = os.path.join(self.runs_dir, entry)
+            pid = _lock_pid(path)
+            if pid is not None and _pid_alive(pid):
+                continue
+            try:
+                if now - os.path.getmtime(path) < self.gc_grace:
+                    continue
+            except OSError:
+                continue
+            shutil.rmtree(path, ignore_errors=True)
+            removed += 1
+        with self._lock:
+            self._stats['gc_removed'] += removed
+        if removed:
+            logger.info(f"Profile GC: removed {removed} stale clone(s)")
+        return removed
+
+    def _maybe_gc(self):
+        with self._lock:
+            if time.monotonic() - self._last_gc < self.gc_interval and self._last_gc:
+                return
+            self._last_gc = time.monotonic()
+        threading.Thread(target=self.gc, name='profile-gc', daemon=True).start()
+
+    def stats(self) -> Dict:
+        with self._lock:
+            stats = dict(self._stats)
+        try:
+            stats['active_clones'] = len(os.listdir(self.runs_dir))
+        except OSError:
+            stats['active_clones'] = 0
+        stats['avg_clone_seconds'] = round(stats['clone_seconds_total'] / stats['clones'], 3) if stats['clones'] else 0.0
+        stats['clone_seconds_total'] = round(stats['clone_seconds_total'], 3)
+        return stats
+
+
+profiles = ProfileManager()
+# login.py isi folder mein login session save karta hai
+profiles.register('login', path=os.path.join(BASE_DIR, 'chrome_profile'))
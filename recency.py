@@ -0,0 +1,131 @@
+import re
+import threading
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+from typing import Optional, Tuple
+
+# Har board ka apna format: "3 days ago", "5d", "2w", "1mo", "30+ days ago", "Yesterday", "2024-05-20"
+_ISO_DAY = re.compile(r'(\d{4})-(\d{2})-(\d{2})')
+_RELATIVE = re.compile(
+    r'(\d+)\s*\+?\s*(seconds?|secs?|minutes?|mins?|hours?|hrs?|h|days?|d|weeks?|wks?|w'
+    r'|months?|mos?|mon|m|years?|yrs?|y)\b'
+)
+_ARTICLE = re.compile(r'\b(?:an?|one)\s+(second|minute|hour|day|week|month|year)\b')
+_NOW_WORDS = re.compile(r'\b(?:just now|today|now|moments? ago|recently)\b')
+_UNIT_SECONDS = {
+    's': 1, 'sec': 1, 'second': 1,
+    'min': 60, 'minute': 60,
+    'h': 3600, 'hr': 3600, 'hour': 3600,
+    'd': 86400, 'day': 86400,
+    'w': 7 * 86400, 'wk': 7 * 86400, 'week': 7 * 86400,
+    # Bare "m" boards par month hota hai ("1m" = Hiring.cafe month)
+    'm': 30 * 86400, 'mo': 30 * 86400, 'mon': 30 * 86400, 'month': 30 * 86400,
+    'y': 365 * 86400, 'yr': 365 * 86400, 'year': 365 * 86400,
+}
+
+
+def _unit(token: str) -> int:
+    if token not in _UNIT_SECONDS and token.endswith('s'):
+        token = token[:-1]
+    return _UNIT_SECONDS[token]
+
+
+@lru_cache(maxsize=4096)
+def _parse(text: str) -> Optional[Tuple[str, object]]:
+    # Offset cache hota hai, date nahi: "3 days ago" ka cached result aadhi raat ke baad bhi sahi
+    match = _ISO_DAY.search(text)
+    if match:
+        try:
+            return 'date', date(int(match.group(1)), int(match.group(2)), int(match.group(3)))
+        except ValueError:
+            return None
+    if 'yesterday' in text:
+        return 'age', 86400
+    match = _RELATIVE.search(text)
+    if match:
+        return 'age', int(match.group(1)) * _unit(match.group(2))
+    match = _ARTICLE.search(text)
+    if match:
+        return 'age', _unit(match.group(1))
+    if _NOW_WORDS.search(text):
+        return 'age', 0
+    return None
+
+
+def _key(text: Optional[str]) -> str:
+    return ' '.join((text or '').lower().split())
+
+
+def posted_at(text: Optional[str], now: Optional[datetime] = None) -> Optional[datetime]:
+    """When the posting went up, from any board's date text; None when it can't be parsed."""
+    parsed = _parse(_key(text)) if text else None
+    if parsed is None:
+        return None
+    kind, value = parsed
+    if kind == 'date':
+        return datetime(value.year, value.month, value.day)
+    return (now or datetime.now()) - timedelta(seconds=value)
+
+
+def posted_day(text: Optional[str], now: Optional[datetime] = None) -> Optional[str]:
+    """posted_at() as YYYY-MM-DD."""
+    when = posted_at(text, now)
+    return when.strftime('%Y-%m-%d') if when else None
+
+
+class RecencyWindow:
+    """
+    Posting-date filter for one scrape. Cards are fed in feed order, one
+    batch (page or scroll) at a time; cards without a parseable date are
+    kept. `exhausted` turns true when the last dated card of the current
+    batch is already outside the window, i.e. a date-ordered feed has
+    nothing newer left and paging/scrolling can stop.
+    """
+
+    def __init__(self, days: float, now: Optional[datetime] = None):
+        self.now = now or datetime.now()
+        self.cutoff = self.now - timedelta(days=days)
+        self.dropped = 0
+        self._last: Optional[datetime] = None
+
+    def start_batch(self):
+        self._last = None
+
+    def accept(self, text: Optional[str]) -> bool:
+        when = posted_at(text, self.now)
+        if when is None:
+            return True
+        self._last = when
+        if when < self.cutoff:
+            self.dropped += 1
+            return False
+        return True
+
+    @property
+    def exhausted(self) -> bool:
+        return self._last is not None and self._last < self.cutoff
+
+
+class RecencyStats:
+    """Cards dropped as too old and pages/scrolls skipped by early termination, for /health."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stats = {'cards_dropped': 0, 'early_stops': 0, 'pages_skipped': 0}
+
+    def record(self, cards_dropped: int = 0, pages_skipped: int = 0, early_stop: bool = False):
+        with self._lock:
+            self._stats['cards_dropped'] += cards_dropped
+            self._stats['pages_skipped'] += pages_skipped
+            self._stats['early_stops'] += 1 if early_stop else 0
+
+    def snapshot(self) -> dict:
+        info = _parse.cache_info()
+        with self._lock:
+            stats = dict(self._stats)
+        stats['parse_cache_hits'] = info.hits
+        stats['parse_cache_misses'] = info.misses
+        return stats
+
+
+recency_stats = RecencyStats()
@@ -0,0 +1,143 @@
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Seconds a scrape result is served as fresh, per platform
+PLATFORM_TTLS = {
+    'linkedin': 900,
+    'linkedin_browser': 1800,
+    'dice': 1800,
+    'indeed': 3600,
+    'ziprecruiter': 3600,
+    'hiringcafe': 3600,
+    'glassdoor': 3600,
+    'simplyhired': 3600,
+    'builtin': 3600,
+    'careerbuilder': 3600,
+}
+
+
+def normalize_query(text: str) -> str:
+    return ' '.join((text or '').lower().split())
+
+
+def cache_key(platform: str, keyword: str, location: str, pages: int, days: int) -> Tuple:
+    return (platform, normalize_query(keyword), normalize_query(location), pages, days)
+
+
+def is_cacheable(payload: Any) -> bool:
+    # Blocked/empty scrapes cache nahi karte, warna TTL bhar khali result milega
+    return isinstance(payload, dict) and payload.get('success') and payload.get('total_jobs', 0) > 0
+
+
+class ResultCache:
+    """
+    In-process cache of route payloads with stale-while-revalidate: an
+    expired entry is still returned immediately while a single background
+    refresh runs for that key.
+    """
+
+    def __init__(self, ttls: Optional[Dict[str, float]] = None, default_ttl: float = 1800,
+                 max_stale: float = 86400, max_entries: int = 500):
+        self.ttls = ttls if ttls is not None else PLATFORM_TTLS
+        self.default_ttl = default_ttl
+        self.max_stale = max_stale
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries: 'OrderedDict[Tuple, Tuple[float, Any]]' = OrderedDict()
+        self._refreshing = set()
+        self._stats = {'hits': 0, 'stale_hits': 0, 'misses': 0, 'bypasses': 0, 'refreshes': 0, 'refresh_errors': 0}
+
+    def ttl(self, key: Tuple) -> float:
+        return self.ttls.get(key[0], self.default_ttl)
+
+    def put(self, key: Tuple, payload: Any):
+        if not is_cacheable(payload):
+            return
+        with self._lock:
+            self._entries[key] = (time.time(), payload)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def peek(self, key: Tuple) -> Optional[Tuple[Any, float]]:
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is None:
+            return None
+        stored_at, payload = entry
+        return payload, time.time() - stored_at
+
+    def get_fresh(self, key: Tuple) -> Optional[Tuple[Any, float]]:
+        """Returns (payload, age_seconds) only if the entry is within its TTL; never triggers a refresh."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or time.time() - entry[0] >= self.ttl(key):
+                return None
+            self._entries.move_to_end(key)
+            self._stats['hits'] += 1
+            stored_at, payload = entry
+        return payload, time.time() - stored_at
+
+    def _refresh(self, key: Tuple, loader: Callable):
+        try:
+            self.put(key, loader())
+            with self._lock:
+                self._stats['refreshes'] += 1
+        except Exception as e:
+            logger.error(f"Background refresh failed for {key}: {e}")
+            with self._lock:
+                self._stats['refresh_errors'] += 1
+        finally:
+            with self._lock:
+                self._refreshing.discard(key)
+
+    def get_or_load(self, key: Tuple, loader: Callable, bypass: bool = False) -> Tuple[Any, str, float]:
+        """Returns (payload, cache_status, age_seconds). Status: HIT, STALE, MISS or BYPASS."""
+        if bypass:
+            with self._lock:
+                self._stats['bypasses'] += 1
+            payload = loader()
+            self.put(key, payload)
+            return payload, 'BYPASS', 0.0
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                stored_at, payload = entry
+                age = time.time() - stored_at
+                if age < self.ttl(key):
+                    self._entries.move_to_end(key)
+                    self._stats['hits'] += 1
+                    return payload, 'HIT', age
+                if age < self.ttl(key) + self.max_stale:
+                    self._stats['stale_hits'] += 1
+                    start_refresh = key not in self._refreshing
+                    if start_refresh:
+                        self._refreshing.add(key)
+                else:
+                    del self._entries[key]
+                    entry = None
+            if entry is None:
+                self._stats['misses'] += 1
+
+        if entry is not None:
+            if start_refresh:
+                threading.Thread(target=self._refresh, args=(key, loader),
+                                 name='result-cache-refresh', daemon=True).start()
+            return payload, 'STALE', age
+
+        payload = loader()
+        self.put(key, payload)
+        return payload, 'MISS', 0.0
+
+    def stats(self) -> Dict:
+        with self._lock:
+            stats = dict(self._stats)
+            stats['entries'] = len(self._entries)
+            stats['refreshing'] = len(self._refreshing)
+        return stats
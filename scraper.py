@@ -1,11 +1,19 @@
 import requests
-from bs4 import BeautifulSoup
 from fake_useragent import UserAgent
 import logging
 import time
-from datetime import datetime, timedelta
-from typing import List, Dict, Optional
+from datetime import datetime
+from typing import Callable, List, Dict, Optional
 import re
+import os
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from rate_limit import HostRateLimiter
+from http_cache import DiskResponseCache, ResponseCache
+from card_parser import PARSERS
+from recency import RecencyWindow, recency_stats
+from metrics import per_item, stage
+from tracing import bind
 
 logging.basicConfig(
     level=logging.INFO,
@@ -13,12 +21,43 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Per-host token bucket: burst ke baad ~1 request / 2s (purane fixed sleep jitna polite)
+DEFAULT_RATE_LIMITER = HostRateLimiter(rate=0.5, burst=3)
+
+# Same search URL dobara aaye to network skip (TTL ke baad ETag/Last-Modified se revalidate)
+DEFAULT_RESPONSE_CACHE = DiskResponseCache(
+    os.environ.get('HTTP_CACHE_DIR', os.path.join(os.path.dirname(os.path.abspath(__file__)), '.cache', 'http')),
+    ttl=float(os.environ.get('HTTP_CACHE_TTL', 900)),
+    max_bytes=int(os.environ.get('HTTP_CACHE_MAX_MB', 100)) * 1024 * 1024
+) if os.environ.get('HTTP_CACHE_ENABLED', '1') == '1' else ResponseCache()
+
 class LinkedInJobScraper:
-    def __init__(self, max_pages: int = 3, days_filter: int = 7):
+    def __init__(self, max_pages: int = 3, days_filter: int = 7,
+                 on_progress: Optional[Callable[[Dict], None]] = None,
+                 on_job: Optional[Callable[[Dict], None]] = None,
+                 concurrency: int = 3, rate_limiter: Optional[HostRateLimiter] = None,
+                 cache: Optional[ResponseCache] = None,
+                 parser: str = os.environ.get('LINKEDIN_PARSER', 'lxml'),
+                 base_url: str = 'https://www.linkedin.com',
+                 sort_by_date: bool = os.environ.get('LINKEDIN_SORT_BY_DATE', '0') == '1'):
         self.max_pages = max_pages
         self.days_filter = days_filter
+        self.on_progress = on_progress
+        self.on_job = on_job
+        self.concurrency = max(concurrency, 1)
+        self.rate_limiter = rate_limiter or DEFAULT_RATE_LIMITER
+        self.cache = cache if cache is not None else DEFAULT_RESPONSE_CACHE
+        self.base_url = base_url.rstrip('/')
+        self.sort_by_date = sort_by_date
+        if parser not in PARSERS:
+            raise ValueError(f"Unknown parser '{parser}'. Available: {', '.join(PARSERS)}")
+        # lxml = compiled XPath (fast, default); bs4 = purana BeautifulSoup path, same output
+        self.parse_cards = PARSERS[parser]
         self.ua = UserAgent()
         self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=self.concurrency, pool_maxsize=self.concurrency)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
         self.jobs_data = []
         
     def _get_headers(self) -> Dict[str, str]:
@@ -32,19 +71,47 @@ class LinkedInJobScraper:
         }
     
     def _fetch_page(self, url: str, retries: int = 3) -> Optional[str]:
+        cached, fresh = self.cache.lookup(url)
+        if cached and fresh:
+            logger.info(f"Cache hit: {url}")
+            return cached.body
+        
         response = None
         for attempt in range(retries):
             try:
+                headers = self._get_headers()
+                if cached:
+                    # Stale entry: conditional request, 304 par body cache se
+                    if cached.etag:
+                        headers['If-None-Match'] = cached.etag
+                    if cached.last_modified:
+                        headers['If-Modified-Since'] = cached.last_modified
+                
+                self.rate_limiter.acquire(url)
                 logger.info(f"Fetching URL: {url} (Attempt {attempt + 1}/{retries})")
-                response = self.session.get(
-                    url,
-                    headers=self._get_headers(),
-                    timeout=15
-                )
+                # Page fetch worker threads mein chalte hain, platform label explicit
+                with stage('fetch', 'linkedin'):
+                    response = self.session.get(
+                        url,
+                        headers=headers,
+                        timeout=15
+                    )
+                
+                if response.status_code == 304 and cached:
+                    logger.info("Cached page still valid (Status: 304)")
+                    self.cache.refresh(url)
+                    return cached.body
+                
                 response.raise_for_status()
                 
                 if response.status_code == 200:
                     logger.info(f"Successfully fetched page (Status: {response.status_code})")
+                    self.cache.store(
+                        url,
+                        response.text,
+                        etag=response.headers.get('ETag'),
+                        last_modified=response.headers.get('Last-Modified')
+                    )
                     return response.text
                     
             except requests.exceptions.Timeout:
@@ -71,108 +138,38 @@ class LinkedInJobScraper:
         text = re.sub(r'\s+', ' ', text)
         return text.strip()
     
-    def _parse_posted_date(self, date_text: str) -> Optional[datetime]:
-        if not date_text:
-            return None
-            
-        date_text_normalized = self._normalize_text(date_text)
-        
-        try:
-            if re.match(r'^\d{4}-\d{2}-\d{2}', date_text_normalized):
-                return datetime.fromisoformat(date_text_normalized.split('T')[0])
-        except (ValueError, AttributeError):
-            pass
-        
-        date_text_lower = date_text_normalized.lower()
-        
-        try:
-            if 'just now' in date_text_lower or 'today' in date_text_lower:
-                return datetime.now()
-            elif 'yesterday' in date_text_lower:
-                return datetime.now() - timedelta(days=1)
-            elif 'hour' in date_text_lower or 'hr' in date_text_lower:
-                match = re.search(r'(\d+)', date_text_lower)
-                hours = int(match.group(1)) if match else 1
-                return datetime.now() - timedelta(hours=hours)
-            elif 'day' in date_text_lower or 'days' in date_text_lower:
-                match = re.search(r'(\d+)', date_text_lower)
-                days = int(match.group(1)) if match else 1
-                return datetime.now() - timedelta(days=days)
-            elif 'week' in date_text_lower or 'weeks' in date_text_lower:
-                match = re.search(r'(\d+)', date_text_lower)
-                weeks = int(match.group(1)) if match else 1
-                return datetime.now() - timedelta(weeks=weeks)
-            elif 'month' in date_text_lower or 'months' in date_text_lower:
-                match = re.search(r'(\d+)', date_text_lower)
-                months = int(match.group(1)) if match else 1
-                return datetime.now() - timedelta(days=months * 30)
-        except:
-            pass
-            
-        return None
-    
-    def _is_recent_job(self, posted_date: Optional[datetime]) -> bool:
-        if not posted_date:
-            return True
-        
-        cutoff_date = datetime.now() - timedelta(days=self.days_filter)
-        return posted_date >= cutoff_date
-    
-    def _parse_jobs(self, html: str) -> List[Dict]:
-        soup = BeautifulSoup(html, 'lxml')
+    def _parse_jobs(self, html: str, window: Optional[RecencyWindow] = None) -> List[Dict]:
+        with stage('parse', 'linkedin'):
+            cards = self.parse_cards(html)
         jobs = []
+        window = window or RecencyWindow(self.days_filter)
+        window.start_batch()
         
-        job_cards = soup.find_all('div', class_='base-card')
-        if not job_cards:
-            job_cards = soup.find_all('li', class_='jobs-search-results__list-item')
-        if not job_cards:
-            job_cards = soup.find_all('div', class_='job-search-card')
+        logger.info(f"Found {len(cards)} job cards on this page")
         
-        logger.info(f"Found {len(job_cards)} job cards on this page")
-        
-        for card in job_cards:
+        for title, company, location, date_text, href in per_item(cards, 'card_extraction', 'linkedin'):
             try:
+                # Date pehle: purana card baaki normalization se pehle hi drop
+                if date_text is not None and not window.accept(date_text):
+                    logger.debug(f"Skipping old job: {title}")
+                    continue
+
                 job = {}
                 
-                title_elem = card.find('h3', class_='base-search-card__title') or \
-                            card.find('a', class_='base-card__full-link') or \
-                            card.find('h3')
-                            
-                if title_elem:
-                    job['title'] = self._normalize_text(title_elem.get_text())
+                if title is not None:
+                    job['title'] = self._normalize_text(title)
                 
-                company_elem = card.find('h4', class_='base-search-card__subtitle') or \
-                              card.find('a', class_='hidden-nested-link') or \
-                              card.find('h4')
-                              
-                if company_elem:
-                    job['company'] = self._normalize_text(company_elem.get_text())
+                if company is not None:
+                    job['company'] = self._normalize_text(company)
                 
-                location_elem = card.find('span', class_='job-search-card__location') or \
-                               card.find('span', class_='job-result-card__location')
-                               
-                if location_elem:
-                    job['location'] = self._normalize_text(location_elem.get_text())
+                if location is not None:
+                    job['location'] = self._normalize_text(location)
                 
-                date_elem = card.find('time') or \
-                           card.find('span', class_='job-search-card__listdate')
-                           
-                if date_elem:
-                    datetime_attr = date_elem.get('datetime', '')
-                    date_text = str(datetime_attr) if datetime_attr else date_elem.get_text()
+                if date_text is not None:
                     job['posted_date'] = self._normalize_text(date_text)
-                    posted_datetime = self._parse_posted_date(date_text)
-                    
-                    if not self._is_recent_job(posted_datetime):
-                        logger.debug(f"Skipping old job: {job.get('title', 'Unknown')}")
-                        continue
                 
-                link_elem = card.find('a', class_='base-card__full-link') or \
-                           card.find('a', href=True)
-                           
-                if link_elem:
-                    href_attr = link_elem.get('href', '')
-                    job['apply_link'] = str(href_attr).strip() if href_attr else ''
+                if href is not None:
+                    job['apply_link'] = href.strip()
                     if job['apply_link'] and not job['apply_link'].startswith('http'):
                         job['apply_link'] = 'https://www.linkedin.com' + job['apply_link']
                 
@@ -188,12 +185,15 @@ class LinkedInJobScraper:
         
         return jobs
     
+    def _job_key(self, job: Dict) -> tuple:
+        return (job.get('title', '').lower(), job.get('company', '').lower())
+    
     def _remove_duplicates(self, jobs: List[Dict]) -> List[Dict]:
         seen = set()
         unique_jobs = []
         
         for job in jobs:
-            job_key = (job.get('title', '').lower(), job.get('company', '').lower())
+            job_key = self._job_key(job)
             
             if job_key not in seen and job_key != ('', ''):
                 seen.add(job_key)
@@ -202,38 +202,69 @@ class LinkedInJobScraper:
         logger.info(f"Removed {len(jobs) - len(unique_jobs)} duplicate jobs")
         return unique_jobs
     
+    def _build_url(self, location: str, keyword: str, page: int) -> str:
+        start_index = page * 25
+        # sortBy=DD (opt-in): newest first, taaki window ke bahar wala card aane par baaki pages skip ho sakein;
+        # default LinkedIn ka relevance order
+        sort = '&sortBy=DD' if self.sort_by_date else ''
+        if keyword:
+            return f"{self.base_url}/jobs/search?keywords={keyword}&location={location}&start={start_index}{sort}"
+        return f"{self.base_url}/jobs/search?location={location}&start={start_index}{sort}"
+
     def scrape_jobs(self, location: str, keyword: str = "") -> Dict:
         start_time = datetime.now()
         logger.info(f"Starting job scraping for location: {location}, keyword: {keyword or 'Any'}")
         
         all_jobs = []
+        streamed = set()
         successful_pages = 0
         failed_pages = 0
+        window = RecencyWindow(self.days_filter)
+        
+        # Pages parallel fetch hote hain (rate limiter ke through), lekin order mein process
+        executor = ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix='linkedin-page')
+        pending = {}
+        next_page = 0
         
         for page in range(self.max_pages):
-            start_index = page * 25
-            
-            if keyword:
-                url = f"https://www.linkedin.com/jobs/search?keywords={keyword}&location={location}&start={start_index}"
-            else:
-                url = f"https://www.linkedin.com/jobs/search?location={location}&start={start_index}"
+            while next_page < self.max_pages and next_page < page + self.concurrency:
+                url = self._build_url(location, keyword, next_page)
+                pending[next_page] = executor.submit(bind(self._fetch_page), url)
+                next_page += 1
             
-            html = self._fetch_page(url)
+            html = pending.pop(page).result()
             
             if html:
-                jobs = self._parse_jobs(html)
+                jobs = self._parse_jobs(html, window)
                 all_jobs.extend(jobs)
                 successful_pages += 1
                 logger.info(f"Page {page + 1}: Found {len(jobs)} jobs")
+                if self.on_progress:
+                    self.on_progress({'pages_fetched': successful_pages, 'cards_found': len(all_jobs)})
+                if self.on_job:
+                    # Final dedupe jaisa hi filter, taaki stream aur response same jobs de
+                    for job in jobs:
+                        job_key = self._job_key(job)
+                        if job_key not in streamed and job_key != ('', ''):
+                            streamed.add(job_key)
+                            self.on_job(job)
                 
                 if len(jobs) == 0 and page > 0:
                     logger.info("No more jobs found, stopping pagination")
                     break
+                if self.sort_by_date and window.exhausted:
+                    skipped = self.max_pages - page - 1
+                    if skipped:
+                        logger.info(f"Posting window ({self.days_filter}d) exhausted, skipping {skipped} page(s)")
+                        recency_stats.record(pages_skipped=skipped, early_stop=True)
+                    break
             else:
                 failed_pages += 1
                 logger.warning(f"Failed to fetch page {page + 1}")
-            
-            time.sleep(2)
+        
+        # Empty page / window khatam hone ke baad ke pages ki zaroorat nahi
+        executor.shutdown(wait=False, cancel_futures=True)
+        recency_stats.record(cards_dropped=window.dropped)
         
         unique_jobs = self._remove_duplicates(all_jobs)
         
@@ -0,0 +1,139 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, Iterable, Optional
+
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+SEEN_JOBS_DB = os.environ.get('SEEN_JOBS_DB', os.path.join(BASE_DIR, 'seen_jobs.db'))
+
+# Kitni der tak stored JD dobara fetch kiye bina use ho sakti hai (seconds)
+DEFAULT_TTL = float(os.environ.get('SEEN_JOBS_TTL', 24 * 3600))
+PLATFORM_TTLS: Dict[str, float] = {
+    'hiringcafe': 48 * 3600,
+    'indeed': 24 * 3600,
+    'ziprecruiter': 24 * 3600,
+    # Glassdoor listings jaldi edit/expire hote hain
+    'glassdoor': 12 * 3600,
+    'builtin': 72 * 3600,
+    'careerbuilder': 48 * 3600,
+}
+
+
+def fingerprint(*fields) -> str:
+    """Hash of the list-phase fields; a change means the posting was edited and the JD is refetched."""
+    text = '\x1f'.join(' '.join(str(f or '').split()).lower() for f in fields)
+    return hashlib.sha1(text.encode('utf-8')).hexdigest()
+
+
+class SeenJobsIndex:
+    """
+    SQLite index of job ids whose detail pages were already fetched, with
+    the extracted detail fields, so repeat scrapes only open new or changed
+    jobs. Entries older than the platform's TTL count as unseen.
+    """
+
+    def __init__(self, path: str = SEEN_JOBS_DB, ttls: Optional[Dict[str, float]] = None,
+                 default_ttl: float = DEFAULT_TTL):
+        self.path = path
+        self.ttls = {**PLATFORM_TTLS, **(ttls or {})}
+        self.default_ttl = default_ttl
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._stats = {'hits': 0, 'misses': 0, 'changed': 0, 'expired': 0, 'stored': 0}
+
+    def _db(self) -> sqlite3.Connection:
+        # Pehli zaroorat par kholo (import par file nahi banni chahiye)
+        if self._conn is None:
+            conn = sqlite3.connect(self.path, check_same_thread=False)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS seen_jobs (
+                    platform    TEXT NOT NULL,
+                    job_id      TEXT NOT NULL,
+                    fingerprint TEXT NOT NULL,
+                    details     TEXT NOT NULL,
+                    fetched_at  REAL NOT NULL,
+                    PRIMARY KEY (platform, job_id)
+                )
+            """)
+            self._prune(conn)
+            conn.commit()
+            self._conn = conn
+        return self._conn
+
+    def ttl(self, platform: str) -> float:
+        return self.ttls.get(platform, self.default_ttl)
+
+    def lookup(self, platform: str, fingerprints: Dict[str, str]) -> Dict[str, Dict]:
+        """
+        fingerprints: {job_id: fingerprint}. Returns {job_id: stored detail
+        fields} for ids seen within the TTL whose fingerprint still matches.
+        """
+        if not fingerprints:
+            return {}
+        cutoff = time.time() - self.ttl(platform)
+        found = {}
+        with self._lock:
+            db = self._db()
+            ids = list(fingerprints)
+            # SQLite variable limit (999) ke andar chunks
+            for start in range(0, len(ids), 500):
+                chunk = ids[start:start + 500]
+                rows = db.execute(
+                    f"SELECT job_id, fingerprint, details, fetched_at FROM seen_jobs "
+                    f"WHERE platform = ? AND job_id IN ({','.join('?' * len(chunk))})",
+                    [platform, *chunk],
+                ).fetchall()
+                for job_id, fp, details, fetched_at in rows:
+                    if fetched_at < cutoff:
+                        self._stats['expired'] += 1
+                    elif fp != fingerprints[job_id]:
+                        self._stats['changed'] += 1
+                    else:
+                        found[job_id] = json.loads(details)
+            self._stats['hits'] += len(found)
+            self._stats['misses'] += len(fingerprints) - len(found)
+        return found
+
+    def store(self, platform: str, job_id: str, fp: str, details: Dict):
+        with self._lock:
+            db = self._db()
+            db.execute(
+                "INSERT OR REPLACE INTO seen_jobs (platform, job_id, fingerprint, details, fetched_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (platform, job_id, fp, json.dumps(details), time.time()),
+            )
+            db.commit()
+            self._stats['stored'] += 1
+
+    def _prune(self, db: sqlite3.Connection, platforms: Optional[Iterable[str]] = None) -> int:
+        now = time.time()
+        removed = 0
+        names = platforms or [row[0] for row in db.execute("SELECT DISTINCT platform FROM seen_jobs")]
+        for platform in names:
+            removed += db.execute("DELETE FROM seen_jobs WHERE platform = ? AND fetched_at < ?",
+                                  (platform, now - self.ttl(platform))).rowcount
+        return removed
+
+    def prune(self, platforms: Optional[Iterable[str]] = None) -> int:
+        """Deletes entries past their platform's TTL (also done once when the DB is opened)."""
+        with self._lock:
+            db = self._db()
+            removed = self._prune(db, platforms)
+            db.commit()
+        return removed
+
+    def stats(self) -> Dict:
+        with self._lock:
+            stats = dict(self._stats)
+        lookups = stats['hits'] + stats['misses']
+        stats['hit_ratio'] = round(stats['hits'] / lookups, 3) if lookups else 0.0
+        return stats
+
+
+seen_jobs = SeenJobsIndex()
@@ -0,0 +1,125 @@
+import logging
+import threading
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from metrics import BROWSER_LAUNCHES_SAVED_TOTAL, COALESCED_TOTAL
+
+logger = logging.getLogger(__name__)
+
+Callback = Callable[[Dict], None]
+
+
+class _Flight:
+    __slots__ = ('done', 'result', 'error', 'followers', 'progress_listeners', 'job_listeners',
+                 'last_progress', 'jobs', 'lock')
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+        self.followers = 0
+        self.progress_listeners: List[Callback] = []
+        self.job_listeners: List[Callback] = []
+        self.last_progress: Optional[Dict] = None
+        self.jobs: List[Dict] = []
+        self.lock = threading.Lock()
+
+    def listen(self, on_progress: Optional[Callback] = None, on_job: Optional[Callback] = None):
+        # Der se aaya follower: ab tak ka progress aur emit hui saari jobs pehle mil jayein.
+        # Lock ke andar hi replay, taaki publish wali agli job replay se aage na nikle
+        with self.lock:
+            if on_progress is not None:
+                self.progress_listeners.append(on_progress)
+                if self.last_progress is not None:
+                    _notify(on_progress, self.last_progress)
+            if on_job is not None:
+                self.job_listeners.append(on_job)
+                for job in self.jobs:
+                    _notify(on_job, job)
+
+    def publish_progress(self, progress: Dict):
+        with self.lock:
+            self.last_progress = progress
+            for on_progress in self.progress_listeners:
+                _notify(on_progress, progress)
+
+    def publish_job(self, job: Dict):
+        with self.lock:
+            self.jobs.append(job)
+            for on_job in self.job_listeners:
+                _notify(on_job, job)
+
+
+def _notify(callback: Callback, value: Dict):
+    # Ek caller ka callback fail ho to baaki callers aur scrape chalte rahein
+    try:
+        callback(value)
+    except Exception as e:
+        logger.warning(f"Coalesced callback failed: {e}")
+
+
+class ScrapeCoalescer:
+    """
+    Single-flight for live scrapes: concurrent calls with the same key
+    (result-cache key, platform first) share one in-flight loader call.
+    The first caller runs it; the rest wait and get the same payload (or
+    the same exception). The loader gets one on_progress and one on_job
+    that fan out to every caller's callbacks; a follower that joins late
+    first gets the latest progress and every job emitted so far. Nothing is kept once the call finishes, so this only
+    merges overlapping requests; reuse over time is the result cache's job.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._flights: Dict[Tuple, _Flight] = {}
+        self._stats = {'leaders': 0, 'coalesced': 0, 'browser_launches_saved': 0, 'errors_shared': 0}
+
+    def run(self, key: Tuple, loader: Callable[[Callback, Callback], Any],
+            on_progress: Optional[Callback] = None, on_job: Optional[Callback] = None) -> Any:
+        with self._lock:
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[key] = _Flight()
+                self._stats['leaders'] += 1
+            else:
+                flight.followers += 1
+        flight.listen(on_progress, on_job)
+        if leader:
+            return self._lead(key, flight, loader)
+
+        flight.done.wait()
+        platform = key[0]
+        if flight.error is not None:
+            with self._lock:
+                self._stats['errors_shared'] += 1
+            raise flight.error
+        # Isi request ke liye alag Chrome lease/launch nahi hua
+        saved_browser = isinstance(flight.result, dict) and flight.result.get('served_by') == 'browser'
+        with self._lock:
+            self._stats['coalesced'] += 1
+            self._stats['browser_launches_saved'] += 1 if saved_browser else 0
+        COALESCED_TOTAL.inc(platform=platform)
+        if saved_browser:
+            BROWSER_LAUNCHES_SAVED_TOTAL.inc(platform=platform)
+        return flight.result
+
+    def _lead(self, key: Tuple, flight: _Flight, loader: Callable[[Callback, Callback], Any]) -> Any:
+        try:
+            flight.result = loader(flight.publish_progress, flight.publish_job)
+            return flight.result
+        except Exception as e:
+            flight.error = e
+            raise
+        finally:
+            # Pehle map se hatao, phir followers jagao: iske baad aane wala naya scrape shuru karega
+            with self._lock:
+                del self._flights[key]
+            flight.done.set()
+
+    def stats(self) -> Dict:
+        with self._lock:
+            stats = dict(self._stats)
+            stats['in_flight'] = len(self._flights)
+            stats['waiting'] = sum(flight.followers for flight in self._flights.values())
+        return stats
@@ -0,0 +1,98 @@
+import logging
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class ScrapeTaskQueue:
+    """
+    Runs scrapes on a background worker pool so the HTTP request can return
+    a task id immediately. Finished tasks are kept for `retention_seconds`.
+    """
+
+    def __init__(self, runner: Callable, workers: int = 2, retention_seconds: float = 3600):
+        self.runner = runner
+        self.retention_seconds = retention_seconds
+        self._executor = ThreadPoolExecutor(max_workers=max(workers, 1), thread_name_prefix='scrape-task')
+        self._lock = threading.Lock()
+        self._tasks: Dict[str, Dict] = {}
+
+    def submit(self, platform: str, params: Dict) -> Dict:
+        self._purge()
+        task_id = uuid.uuid4().hex
+        task = {
+            'task_id': task_id,
+            'platform': platform,
+            'params': params,
+            'status': 'queued',
+            'progress': {},
+            'error': None,
+            'result': None,
+            'submitted_at': datetime.now().isoformat(),
+            'started_at': None,
+            'finished_at': None,
+            '_finished': None,
+        }
+        with self._lock:
+            self._tasks[task_id] = task
+        self._executor.submit(self._run, task_id)
+        logger.info(f"Task {task_id} queued: {platform} {params}")
+        return self._public(task)
+
+    def _update(self, task_id: str, **fields):
+        with self._lock:
+            task = self._tasks.get(task_id)
+            if task is not None:
+                task.update(fields)
+
+    def _run(self, task_id: str):
+        with self._lock:
+            task = self._tasks.get(task_id)
+            if task is None:
+                return
+            platform, params = task['platform'], task['params']
+        self._update(task_id, status='running', started_at=datetime.now().isoformat())
+
+        def on_progress(progress: Dict):
+            self._update(task_id, progress=dict(progress))
+
+        try:
+            result = self.runner(platform, on_progress=on_progress, **params)
+            self._update(task_id, status='succeeded', result=result)
+        except Exception as e:
+            logger.error(f"Task {task_id} failed: {e}")
+            self._update(task_id, status='failed', error=str(e))
+        finally:
+            self._update(task_id, finished_at=datetime.now().isoformat(), _finished=time.monotonic())
+
+    def _purge(self):
+        cutoff = time.monotonic() - self.retention_seconds
+        with self._lock:
+            expired = [tid for tid, task in self._tasks.items()
+                       if task['_finished'] is not None and task['_finished'] < cutoff]
+            for tid in expired:
+                del self._tasks[tid]
+
+    def _public(self, task: Dict, include_result: bool = False) -> Dict:
+        data = {k: v for k, v in task.items() if not k.startswith('_') and k != 'result'}
+        if include_result:
+            data['result'] = task['result']
+        return data
+
+    def get(self, task_id: str, include_result: bool = False) -> Optional[Dict]:
+        self._purge()
+        with self._lock:
+            task = self._tasks.get(task_id)
+            return self._public(task, include_result) if task else None
+
+    def stats(self) -> Dict:
+        with self._lock:
+            counts = {}
+            for task in self._tasks.values():
+                counts[task['status']] = counts.get(task['status'], 0) + 1
+        return counts
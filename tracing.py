@@ -0,0 +1,191 @@
+import json
+import os
+import re
+import threading
+import time
+import uuid
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
+from typing import Callable, Dict, List, Optional
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+TRACE_DIR = os.environ.get('TRACE_DIR', os.path.join(BASE_DIR, 'traces'))
+# Disk par sirf itne latest traces rakho
+TRACE_KEEP = int(os.environ.get('TRACE_KEEP', 50))
+# Ek trace ki memory bounded (char-by-char send_keys wale scrapes mein hazaaron commands)
+TRACE_MAX_EVENTS = int(os.environ.get('TRACE_MAX_EVENTS', 100000))
+
+# trace=1 wali request ke scrape ke dauran set; baaki time None (span() tab kuch nahi karta)
+current_trace: ContextVar[Optional['Trace']] = ContextVar('current_trace', default=None)
+
+_TRACE_ID = re.compile(r'^[0-9a-f]{12}$')
+_NOOP = nullcontext()
+
+
+class Trace:
+    """
+    Spans of one traced request as Chrome trace-event "complete" events
+    (opens in Perfetto or chrome://tracing). Spans from every thread that
+    runs with this trace as current_trace land on that thread's track.
+    """
+
+    def __init__(self, name: str):
+        self.trace_id = uuid.uuid4().hex[:12]
+        self.name = name
+        self.started_at = time.time()
+        self.pid = os.getpid()
+        self._origin = time.perf_counter()
+        self._lock = threading.Lock()
+        self._events: List[Dict] = []
+        self._threads: Dict[int, str] = {}
+        self.dropped = 0
+
+    def add(self, name: str, cat: str, start: float, end: float, args: Optional[Dict] = None):
+        event = {
+            'name': name,
+            'cat': cat,
+            'ph': 'X',
+            'ts': round((start - self._origin) * 1e6, 3),
+            'dur': round((end - start) * 1e6, 3),
+            'pid': self.pid,
+            'tid': threading.get_ident(),
+        }
+        if args:
+            event['args'] = args
+        with self._lock:
+            if len(self._events) >= TRACE_MAX_EVENTS:
+                self.dropped += 1
+                return
+            self._events.append(event)
+            if event['tid'] not in self._threads:
+                self._threads[event['tid']] = threading.current_thread().name
+
+    def to_json(self) -> Dict:
+        with self._lock:
+            events = list(self._events)
+            threads = dict(self._threads)
+        metadata = [{'name': 'process_name', 'ph': 'M', 'pid': self.pid, 'args': {'name': self.name}}]
+        metadata.extend({'name': 'thread_name', 'ph': 'M', 'pid': self.pid, 'tid': tid, 'args': {'name': name}}
+                        for tid, name in threads.items())
+        return {
+            'traceEvents': metadata + events,
+            'displayTimeUnit': 'ms',
+            'otherData': {
+                'trace_id': self.trace_id,
+                'name': self.name,
+                'started_at': self.started_at,
+                'dropped_events': self.dropped,
+            },
+        }
+
+    def save(self, directory: str = TRACE_DIR) -> str:
+        os.makedirs(directory, exist_ok=True)
+        path = os.path.join(directory, f"{self.trace_id}.json")
+        tmp = f"{path}.tmp"
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump(self.to_json(), f, default=str)
+        os.replace(tmp, path)
+        _prune(directory)
+        return path
+
+
+def _prune(directory: str):
+    try:
+        files = [os.path.join(directory, name) for name in os.listdir(directory) if name.endswith('.json')]
+        files.sort(key=os.path.getmtime, reverse=True)
+        for path in files[TRACE_KEEP:]:
+            os.remove(path)
+    except OSError:
+        pass
+
+
+def trace_path(trace_id: str, directory: str = TRACE_DIR) -> Optional[str]:
+    """Saved trace file for an id, or None (ids are validated, so no path tricks)."""
+    if not _TRACE_ID.match(trace_id or ''):
+        return None
+    path = os.path.join(directory, f"{trace_id}.json")
+    return path if os.path.exists(path) else None
+
+
+@contextmanager
+def capture(name: str):
+    """Makes a new Trace current for the block and yields it."""
+    trace = Trace(name)
+    token = current_trace.set(trace)
+    try:
+        yield trace
+    finally:
+        current_trace.reset(token)
+
+
+@contextmanager
+def _span(trace: Trace, name: str, cat: str, args: Dict):
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        trace.add(name, cat, start, time.perf_counter(), args)
+
+
+def span(name: str, cat: str = 'scrape', **args):
+    """Records the block as a span when a trace is active; a shared no-op otherwise."""
+    trace = current_trace.get()
+    if trace is None:
+        return _NOOP
+    return _span(trace, name, cat, args)
+
+
+def bind(fn: Callable) -> Callable:
+    """Carries the active trace into a worker thread (executor.submit(bind(fn), ...))."""
+    trace = current_trace.get()
+    if trace is None:
+        return fn
+
+    def run(*args, **kwargs):
+        token = current_trace.set(trace)
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            current_trace.reset(token)
+    return run
+
+
+def _command_args(command: str, params: Optional[Dict]) -> Optional[Dict]:
+    # Bas itna ki trace mein command pehchaan aaye (poori scripts/values nahi)
+    if not params:
+        return None
+    if 'url' in params:
+        return {'url': params['url']}
+    if 'script' in params:
+        return {'script': ' '.join(str(params['script']).split())[:80]}
+    if 'using' in params:
+        return {'using': params['using'], 'value': str(params.get('value'))[:80]}
+    if 'cmd' in params:
+        return {'cmd': params['cmd']}
+    return None
+
+
+def instrument_driver(driver):
+    """
+    Wraps driver.execute so every WebDriver command (element calls, scripts,
+    CDP) is a span while a trace is active. Idempotent, so pooled drivers
+    are wrapped once; untraced commands pay one contextvar lookup.
+    """
+    if getattr(driver, '_trace_instrumented', False):
+        return driver
+    execute = driver.execute
+
+    def traced_execute(driver_command, params=None):
+        trace = current_trace.get()
+        if trace is None:
+            return execute(driver_command, params)
+        start = time.perf_counter()
+        try:
+            return execute(driver_command, params)
+        finally:
+            trace.add(driver_command, 'webdriver', start, time.perf_counter(),
+                      _command_args(driver_command, params))
+
+    driver.execute = traced_execute
+    driver._trace_instrumented = True
+    return driver
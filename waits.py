@@ -0,0 +1,179 @@
+import copy
+import logging
+import threading
+import time
+from typing import Dict, List, NamedTuple, Optional
+
+logger = logging.getLogger(__name__)
+
+
+# --- Readiness conditions ---
+# Har condition ek callable hai: condition(driver) -> bool. Stateful conditions
+# (network idle / DOM stable) reset() se har wait ke start par clear hoti hain.
+
+class Condition:
+    name = 'condition'
+
+    def reset(self):
+        pass
+
+    def __call__(self, driver) -> bool:
+        raise NotImplementedError
+
+
+class SelectorPresent(Condition):
+    def __init__(self, *selectors: str):
+        self.selectors = selectors
+        self.name = f"selector({', '.join(selectors)})"
+        self._script = "return !!document.querySelector(arguments[0]);"
+
+    def __call__(self, driver) -> bool:
+        return bool(driver.execute_script(self._script, ', '.join(self.selectors)))
+
+
+class ContentChanged(Condition):
+    """Element present and its text differs from a snapshot taken before a click."""
+
+    def __init__(self, selector: str, before: Optional[str] = None):
+        self.selector = selector
+        self.before = before
+        self.name = f"changed({selector})"
+
+    def __call__(self, driver) -> bool:
+        text = driver.execute_script(
+            "var el = document.querySelector(arguments[0]); return el ? el.innerText : null;",
+            self.selector
+        )
+        return text is not None and text != self.before
+
+
+class _Stable(Condition):
+    def __init__(self, stable_ms: int):
+        self.stable_ms = stable_ms
+        self.reset()
+
+    def reset(self):
+        self._signature = None
+        self._since = None
+
+    def _probe(self, driver):
+        raise NotImplementedError
+
+    def __call__(self, driver) -> bool:
+        signature = self._probe(driver)
+        now = time.monotonic()
+        if signature is None or signature != self._signature:
+            self._signature = signature
+            self._since = now
+            return False
+        return (now - self._since) * 1000 >= self.stable_ms
+
+
+class DomStable(_Stable):
+    def __init__(self, stable_ms: int = 500):
+        super().__init__(stable_ms)
+        self.name = f"dom_stable({stable_ms}ms)"
+
+    def _probe(self, driver):
+        return tuple(driver.execute_script(
+            "var b = document.body;"
+            "return b ? [document.getElementsByTagName('*').length, b.innerText.length] : null;"
+        ) or ()) or None
+
+
+class NetworkIdle(_Stable):
+    def __init__(self, idle_ms: int = 500):
+        super().__init__(idle_ms)
+        self.name = f"network_idle({idle_ms}ms)"
+
+    def _probe(self, driver):
+        state = driver.execute_script(
+            "return [document.readyState, performance.getEntriesByType('resource').length];"
+        )
+        if not state or state[0] == 'loading':
+            return None
+        return state[1]
+
+
+class Readiness(NamedTuple):
+    ceiling: float
+    conditions: List[Condition]
+    require_all: bool = False
+
+
+# --- Stats ---
+class WaitStats:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._data: Dict[str, Dict[str, Dict]] = {}
+
+    def record(self, platform: str, stage: str, waited: float, ceiling: float, satisfied: bool):
+        with self._lock:
+            entry = self._data.setdefault(platform, {}).setdefault(stage, {
+                'waits': 0,
+                'timeouts': 0,
+                'waited_seconds': 0.0,
+                'ceiling_seconds': 0.0,
+                'max_wait_seconds': 0.0,
+            })
+            entry['waits'] += 1
+            entry['timeouts'] += 0 if satisfied else 1
+            entry['waited_seconds'] += waited
+            entry['ceiling_seconds'] += ceiling
+            entry['max_wait_seconds'] = max(entry['max_wait_seconds'], waited)
+
+    def snapshot(self) -> Dict:
+        with self._lock:
+            result = {}
+            for platform, stages in self._data.items():
+                result[platform] = {}
+                for stage, entry in stages.items():
+                    result[platform][stage] = {
+                        'waits': entry['waits'],
+                        'timeouts': entry['timeouts'],
+                        'avg_wait_seconds': round(entry['waited_seconds'] / entry['waits'], 3),
+                        'max_wait_seconds': round(entry['max_wait_seconds'], 3),
+                        # Fixed sleep (ceiling) ke comparison mein kitna idle time bacha
+                        'saved_seconds': round(entry['ceiling_seconds'] - entry['waited_seconds'], 3),
+                    }
+            return result
+
+
+wait_stats = WaitStats()
+
+
+def wait_until(driver, conditions: List[Condition], timeout: float, platform: str = 'unknown',
+               stage: str = 'ready', require_all: bool = False, poll: float = 0.25) -> bool:
+    """
+    Polls the readiness conditions until they hold (any by default, all with
+    require_all) or the ceiling is hit. Returns True if the page became ready.
+    """
+    # Declarations shared hain (threads ke beech), isliye har wait apni copy use karta hai
+    conditions = [copy.copy(c) for c in conditions]
+    for condition in conditions:
+        condition.reset()
+
+    start = time.monotonic()
+    deadline = start + timeout
+    satisfied = False
+    while True:
+        results = []
+        for condition in conditions:
+            try:
+                results.append(condition(driver))
+            except Exception:
+                results.append(False)
+        if (all(results) if require_all else any(results)):
+            satisfied = True
+            break
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            break
+        time.sleep(min(poll, remaining))
+
+    waited = time.monotonic() - start
+    wait_stats.record(platform, stage, waited, timeout, satisfied)
+    if not satisfied:
+        names = ', '.join(c.name for c in conditions)
+        logger.info(f"{platform}/{stage}: not ready after {waited:.1f}s ({names})")
+    return satisfied